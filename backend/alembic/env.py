@@ -1,6 +1,9 @@
 """Alembic environment configuration for async SQLAlchemy."""
 
 import asyncio
+import logging
+import os
+from functools import lru_cache
 from logging.config import fileConfig
 
 from sqlalchemy import pool
@@ -16,17 +19,24 @@ from app.models import *  # noqa: F401, F403
 # Alembic Config object
 config = context.config
 
-# Interpret the config file for Python logging
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+# Interpret the config file for Python logging, unless the embedding process
+# (app, test runner) has already configured it
+if config.config_file_name is not None and not logging.getLogger().handlers:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # Model metadata for autogenerate
 target_metadata = Base.metadata
 
 
+@lru_cache(maxsize=1)
+def get_url() -> str:
+    """Database URL for migrations: DATABASE_URL if set, else alembic.ini."""
+    return os.getenv("DATABASE_URL") or config.get_main_option("sqlalchemy.url")
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
-    url = config.get_main_option("sqlalchemy.url")
+    url = get_url()
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -47,10 +57,18 @@ def do_run_migrations(connection: Connection) -> None:
 
 async def run_async_migrations() -> None:
     """Run migrations in 'online' mode with async engine."""
+    section = config.get_section(config.config_ini_section, {})
+    section["sqlalchemy.url"] = get_url()
     connectable = async_engine_from_config(
-        config.get_section(config.config_ini_section, {}),
+        section,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        # One pooled connection, reused if a migration checks out again
+        # (e.g. autocommit_block) instead of paying a fresh handshake.
+        poolclass=pool.AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        pool_recycle=3600,
     )
 
     async with connectable.connect() as connection:
@@ -11,6 +11,9 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.core.migrations import execute_batch
 
 # revision identifiers, used by Alembic.
 revision: str = '001_initial'
@@ -18,11 +21,29 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Enum types are created once in upgrade(), with no pg_type probe, and shared
+# by every column that uses them (vendorspecialty backs two columns).
+org_role_enum = postgresql.ENUM('ORG_OWNER', 'ORG_ADMIN', 'ORG_AGENT', name='orgrole', create_type=False)
+property_type_enum = postgresql.ENUM('residential', 'commercial', 'mixed', name='propertytype', create_type=False)
+unit_status_enum = postgresql.ENUM('occupied', 'vacant', 'maintenance', name='unitstatus', create_type=False)
+lease_type_enum = postgresql.ENUM('residential_gross', 'commercial_gross', 'commercial_nnn', name='leasetype', create_type=False)
+lease_status_enum = postgresql.ENUM('draft', 'pending', 'active', 'terminating', 'ended', 'disputed', name='leasestatus', create_type=False)
+inspection_type_enum = postgresql.ENUM('move_in', 'move_out', 'periodic', name='inspectiontype', create_type=False)
+inspection_status_enum = postgresql.ENUM('draft', 'submitted', 'reviewed', 'signed', 'archived', name='inspectionstatus', create_type=False)
+evidence_type_enum = postgresql.ENUM('photo', 'video', 'audio', 'document', name='evidencetype', create_type=False)
+vendor_specialty_enum = postgresql.ENUM('GENERAL', 'PLUMBING', 'HVAC', 'ELECTRICAL', 'ROOFING', name='vendorspecialty', create_type=False)
+maintenance_status_enum = postgresql.ENUM('open', 'acknowledged', 'scheduled', 'in_progress', 'completed', 'rejected', name='maintenancestatus', create_type=False)
+audit_action_enum = postgresql.ENUM('invite_sent', 'invite_accepted', 'inspection_submitted', 'inspection_signed', 'vendor_assigned', 'maintenance_triaged', 'lease_created', 'lease_activated', 'evidence_confirmed', name='auditaction', create_type=False)
+
 
 def upgrade() -> None:
+    # Tables are declared on a throwaway MetaData and compiled to DDL, so the
+    # whole schema goes to the server as one batch instead of ~30 round trips.
+    metadata = sa.MetaData()
+
     # === USERS ===
-    op.create_table(
-        'users',
+    sa.Table(
+        'users', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('firebase_uid', sa.String(128), unique=True, nullable=False, index=True),
         sa.Column('email', sa.String(255), unique=True, nullable=False, index=True),
@@ -34,8 +55,8 @@ def upgrade() -> None:
     )
 
     # === ORGANIZATIONS ===
-    op.create_table(
-        'organizations',
+    sa.Table(
+        'organizations', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('name', sa.String(255), nullable=False),
         sa.Column('slug', sa.String(100), unique=True, nullable=False, index=True),
@@ -48,22 +69,22 @@ def upgrade() -> None:
     )
 
     # === ORG MEMBERSHIPS ===
-    op.create_table(
-        'org_memberships',
+    sa.Table(
+        'org_memberships', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('org_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False, index=True),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True),
-        sa.Column('role', sa.Enum('ORG_OWNER', 'ORG_ADMIN', 'ORG_AGENT', name='orgrole'), nullable=False),
+        sa.Column('role', org_role_enum, nullable=False),
         sa.Column('created_at', sa.DateTime(), nullable=False),
     )
 
     # === PROPERTIES ===
-    op.create_table(
-        'properties',
+    sa.Table(
+        'properties', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('org_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False, index=True),
         sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('property_type', sa.Enum('residential', 'commercial', 'mixed', name='propertytype'), nullable=False),
+        sa.Column('property_type', property_type_enum, nullable=False),
         sa.Column('address_line1', sa.String(255), nullable=False),
         sa.Column('address_line2', sa.String(255), nullable=True),
         sa.Column('city', sa.String(100), nullable=False),
@@ -76,18 +97,18 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('updated_at', sa.DateTime(), nullable=False),
         sa.CheckConstraint(
-            "(property_type = 'residential') OR (total_leasable_sq_ft IS NOT NULL)",
+            sa.text("(property_type = 'residential') OR (total_leasable_sq_ft IS NOT NULL)"),
             name='ck_property_commercial_sq_ft'
         ),
     )
 
     # === UNITS ===
-    op.create_table(
-        'units',
+    sa.Table(
+        'units', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('property_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('properties.id', ondelete='CASCADE'), nullable=False, index=True),
         sa.Column('unit_number', sa.String(50), nullable=False),
-        sa.Column('status', sa.Enum('occupied', 'vacant', 'maintenance', name='unitstatus'), nullable=False),
+        sa.Column('status', unit_status_enum, nullable=False),
         sa.Column('bedrooms', sa.Integer(), nullable=True),
         sa.Column('bathrooms', sa.Integer(), nullable=True),
         sa.Column('sq_ft', sa.Integer(), nullable=True),
@@ -97,12 +118,12 @@ def upgrade() -> None:
     )
 
     # === LEASES ===
-    op.create_table(
-        'leases',
+    sa.Table(
+        'leases', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('unit_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('units.id', ondelete='CASCADE'), nullable=False, index=True),
-        sa.Column('lease_type', sa.Enum('residential_gross', 'commercial_gross', 'commercial_nnn', name='leasetype'), nullable=False),
-        sa.Column('status', sa.Enum('draft', 'pending', 'active', 'terminating', 'ended', 'disputed', name='leasestatus'), nullable=False, index=True),
+        sa.Column('lease_type', lease_type_enum, nullable=False),
+        sa.Column('status', lease_status_enum, nullable=False, index=True),
         sa.Column('start_date', sa.Date(), nullable=False),
         sa.Column('end_date', sa.Date(), nullable=False),
         # Money as INTEGER CENTS (BIGINT)
@@ -120,31 +141,35 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('updated_at', sa.DateTime(), nullable=False),
         sa.CheckConstraint(
-            "(pro_rata_share_bps IS NULL) OR (pro_rata_share_bps > 0 AND pro_rata_share_bps <= 10000)",
+            sa.text("(pro_rata_share_bps IS NULL) OR (pro_rata_share_bps > 0 AND pro_rata_share_bps <= 10000)"),
             name='ck_lease_pro_rata_share_bps_range'
         ),
+        sa.CheckConstraint(sa.text("rent_amount_cents >= 0"), name='ck_lease_rent_nonneg'),
+        sa.CheckConstraint(sa.text("deposit_amount_cents >= 0"), name='ck_lease_deposit_nonneg'),
+        sa.CheckConstraint(sa.text("cam_budget_cents >= 0"), name='ck_lease_cam_budget_nonneg'),
+        # Partial: only live leases are looked up by unit
+        sa.Index('ix_leases_unit_active', 'unit_id', postgresql_where=sa.text("status IN ('active', 'pending')")),
     )
-    op.create_index('ix_leases_unit_status', 'leases', ['unit_id', 'status'])
 
     # === TENANT ACCESS ===
-    op.create_table(
-        'tenant_access',
+    sa.Table(
+        'tenant_access', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column('lease_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('leases.id', ondelete='CASCADE'), nullable=False, index=True),
+        sa.Column('lease_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('leases.id', ondelete='CASCADE', deferrable=True, initially='DEFERRED'), nullable=False, index=True),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True),
         sa.Column('is_primary', sa.Boolean(), default=True),
         sa.Column('created_at', sa.DateTime(), nullable=False),
     )
 
     # === INSPECTIONS ===
-    op.create_table(
-        'inspections',
+    sa.Table(
+        'inspections', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('lease_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('leases.id', ondelete='CASCADE'), nullable=False, index=True),
         sa.Column('created_by_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
         sa.Column('supplemental_to_inspection_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('inspections.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('inspection_type', sa.Enum('move_in', 'move_out', 'periodic', name='inspectiontype'), nullable=False),
-        sa.Column('status', sa.Enum('draft', 'submitted', 'reviewed', 'signed', 'archived', name='inspectionstatus'), nullable=False, index=True),
+        sa.Column('inspection_type', inspection_type_enum, nullable=False),
+        sa.Column('status', inspection_status_enum, nullable=False, index=True),
         sa.Column('inspection_date', sa.DateTime(), nullable=False),
         sa.Column('content_hash', sa.String(64), nullable=True),
         sa.Column('schema_version', sa.Integer(), default=1),
@@ -153,14 +178,15 @@ def upgrade() -> None:
         sa.Column('notes', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('updated_at', sa.DateTime(), nullable=False),
+        # Partial: diffs and reports only ever read signed inspections
+        sa.Index('ix_inspections_lease_type_signed', 'lease_id', 'inspection_type', postgresql_where=sa.text("status = 'signed'")),
     )
-    op.create_index('ix_inspections_lease_type_status', 'inspections', ['lease_id', 'inspection_type', 'status'])
 
     # === INSPECTION ITEMS ===
-    op.create_table(
-        'inspection_items',
+    sa.Table(
+        'inspection_items', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column('inspection_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('inspections.id', ondelete='CASCADE'), nullable=False, index=True),
+        sa.Column('inspection_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('inspections.id', ondelete='CASCADE', deferrable=True, initially='DEFERRED'), nullable=False, index=True),
         sa.Column('room_name', sa.String(100), nullable=False),
         sa.Column('item_name', sa.String(100), nullable=False),
         sa.Column('condition_rating', sa.Integer(), nullable=True),
@@ -173,11 +199,11 @@ def upgrade() -> None:
     )
 
     # === INSPECTION EVIDENCE ===
-    op.create_table(
-        'inspection_evidence',
+    sa.Table(
+        'inspection_evidence', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column('item_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('inspection_items.id', ondelete='CASCADE'), nullable=False, index=True),
-        sa.Column('evidence_type', sa.Enum('photo', 'video', 'audio', 'document', name='evidencetype'), nullable=False),
+        sa.Column('item_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('inspection_items.id', ondelete='CASCADE', deferrable=True, initially='DEFERRED'), nullable=False, index=True),
+        sa.Column('evidence_type', evidence_type_enum, nullable=False),
         sa.Column('object_path', sa.String(500), nullable=False),
         sa.Column('file_name', sa.String(255), nullable=False),
         sa.Column('mime_type', sa.String(100), nullable=False),
@@ -190,12 +216,12 @@ def upgrade() -> None:
     )
 
     # === VENDORS ===
-    op.create_table(
-        'vendors',
+    sa.Table(
+        'vendors', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('org_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False, index=True),
         sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('specialty', sa.Enum('GENERAL', 'PLUMBING', 'HVAC', 'ELECTRICAL', 'ROOFING', name='vendorspecialty'), nullable=False),
+        sa.Column('specialty', vendor_specialty_enum, nullable=False),
         sa.Column('contact_name', sa.String(255), nullable=True),
         sa.Column('email', sa.String(255), nullable=True),
         sa.Column('phone', sa.String(50), nullable=True),
@@ -208,8 +234,8 @@ def upgrade() -> None:
     )
 
     # === MAINTENANCE TICKETS ===
-    op.create_table(
-        'maintenance_tickets',
+    sa.Table(
+        'maintenance_tickets', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('unit_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('units.id', ondelete='CASCADE'), nullable=False, index=True),
         sa.Column('created_by_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
@@ -217,8 +243,8 @@ def upgrade() -> None:
         sa.Column('assigned_org_member_user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
         sa.Column('title', sa.String(255), nullable=False),
         sa.Column('description', sa.Text(), nullable=False),
-        sa.Column('status', sa.Enum('open', 'acknowledged', 'scheduled', 'in_progress', 'completed', 'rejected', name='maintenancestatus'), nullable=False, index=True),
-        sa.Column('category', sa.Enum('GENERAL', 'PLUMBING', 'HVAC', 'ELECTRICAL', 'ROOFING', name='vendorspecialty'), nullable=True),
+        sa.Column('status', maintenance_status_enum, nullable=False, index=True),
+        sa.Column('category', vendor_specialty_enum, nullable=True),
         sa.Column('priority', sa.Integer(), default=3),
         sa.Column('maintenance_cost_estimate_cents', sa.Integer(), nullable=True),
         sa.Column('mason_triage_result', postgresql.JSONB(), nullable=True),
@@ -229,16 +255,17 @@ def upgrade() -> None:
         sa.Column('tenant_notes', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('updated_at', sa.DateTime(), nullable=False),
+        # Partial: only actionable tickets are looked up by unit
+        sa.Index('ix_maintenance_tickets_unit_open', 'unit_id', postgresql_where=sa.text("status IN ('open', 'in_progress')")),
     )
-    op.create_index('ix_maintenance_tickets_unit_status', 'maintenance_tickets', ['unit_id', 'status'])
 
     # === AUDIT LOG ===
-    op.create_table(
-        'audit_log',
+    sa.Table(
+        'audit_log', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('org_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='SET NULL'), nullable=True, index=True),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True, index=True),
-        sa.Column('action', sa.Enum('invite_sent', 'invite_accepted', 'inspection_submitted', 'inspection_signed', 'vendor_assigned', 'maintenance_triaged', 'lease_created', 'lease_activated', 'evidence_confirmed', name='auditaction'), nullable=False, index=True),
+        sa.Column('action', audit_action_enum, nullable=False, index=True),
         sa.Column('resource_type', sa.String(50), nullable=False),
         sa.Column('resource_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('details', postgresql.JSONB(), nullable=True),
@@ -248,8 +275,8 @@ def upgrade() -> None:
     )
 
     # === MASON LOGS ===
-    op.create_table(
-        'mason_logs',
+    sa.Table(
+        'mason_logs', metadata,
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('org_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='SET NULL'), nullable=True, index=True),
         sa.Column('action_type', sa.String(50), nullable=False),
@@ -262,19 +289,44 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False),
     )
 
+    # Enum types go first; the tables only reference them by name
+    enums = [
+        org_role_enum,
+        property_type_enum,
+        unit_status_enum,
+        lease_type_enum,
+        lease_status_enum,
+        inspection_type_enum,
+        inspection_status_enum,
+        evidence_type_enum,
+        vendor_specialty_enum,
+        maintenance_status_enum,
+        audit_action_enum,
+    ]
+    dialect = op.get_context().dialect
+    ddl = [str(postgresql.CreateEnumType(enum).compile(dialect=dialect)) for enum in enums]
+    # Indexes trail every CREATE TABLE rather than being interleaved with them
+    deferred_ddl = []
+    for table in metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            deferred_ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+    execute_batch(ddl + deferred_ddl)
+
 
 def downgrade() -> None:
+    op.execute(
+        'DROP INDEX IF EXISTS ix_maintenance_tickets_unit_open, '
+        'ix_inspections_lease_type_signed, ix_leases_unit_active'
+    )
     op.drop_table('mason_logs')
     op.drop_table('audit_log')
-    op.drop_index('ix_maintenance_tickets_unit_status')
     op.drop_table('maintenance_tickets')
     op.drop_table('vendors')
     op.drop_table('inspection_evidence')
     op.drop_table('inspection_items')
-    op.drop_index('ix_inspections_lease_type_status')
     op.drop_table('inspections')
     op.drop_table('tenant_access')
-    op.drop_index('ix_leases_unit_status')
     op.drop_table('leases')
     op.drop_table('units')
     op.drop_table('properties')
@@ -282,15 +334,9 @@ def downgrade() -> None:
     op.drop_table('organizations')
     op.drop_table('users')
     
-    # Drop enums
-    op.execute('DROP TYPE IF EXISTS auditaction')
-    op.execute('DROP TYPE IF EXISTS maintenancestatus')
-    op.execute('DROP TYPE IF EXISTS vendorspecialty')
-    op.execute('DROP TYPE IF EXISTS evidencetype')
-    op.execute('DROP TYPE IF EXISTS inspectionstatus')
-    op.execute('DROP TYPE IF EXISTS inspectiontype')
-    op.execute('DROP TYPE IF EXISTS leasestatus')
-    op.execute('DROP TYPE IF EXISTS leasetype')
-    op.execute('DROP TYPE IF EXISTS unitstatus')
-    op.execute('DROP TYPE IF EXISTS propertytype')
-    op.execute('DROP TYPE IF EXISTS orgrole')
+    # Drop enums. IF EXISTS keeps a re-run downgrade harmless; upgrade creates
+    # the types without a pg_type probe and relies on this for cleanup.
+    op.execute(
+        'DROP TYPE IF EXISTS auditaction, maintenancestatus, vendorspecialty, evidencetype, '
+        'inspectionstatus, inspectiontype, leasestatus, leasetype, unitstatus, propertytype, orgrole'
+    )
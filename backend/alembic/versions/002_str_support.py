@@ -51,29 +51,32 @@ def upgrade() -> None:
     """)
 
     # Extend inspection_type enum with STR types
-    # Must commit first to use new values in constraints
-    op.execute("COMMIT")
-    op.execute("ALTER TYPE inspectiontype ADD VALUE IF NOT EXISTS 'pre_stay'")
-    op.execute("ALTER TYPE inspectiontype ADD VALUE IF NOT EXISTS 'post_stay'")
-    op.execute("BEGIN")
-
-    # Add occupancy_model to properties
-    op.add_column(
-        'properties',
-        sa.Column(
-            'occupancy_model',
-            sa.Enum('long_term_residential', 'commercial_lease', 'short_term_rental', name='occupancymodel'),
-            server_default='long_term_residential',
-            nullable=False
+    # New values must be committed before the constraints below can use them
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE inspectiontype ADD VALUE IF NOT EXISTS 'pre_stay'")
+        op.execute("ALTER TYPE inspectiontype ADD VALUE IF NOT EXISTS 'post_stay'")
+
+    # Add occupancy_model to properties in its own short transaction: with a
+    # constant default the ADD COLUMN is metadata-only, and the lock on
+    # properties is released right away instead of at the end of the migration.
+    with op.get_context().autocommit_block():
+        op.add_column(
+            'properties',
+            sa.Column(
+                'occupancy_model',
+                postgresql.ENUM('long_term_residential', 'commercial_lease', 'short_term_rental',
+                                name='occupancymodel', create_type=False),
+                server_default='long_term_residential',
+                nullable=False
+            )
         )
-    )
 
     # Add STR fields to inspections
     op.add_column(
         'inspections',
         sa.Column(
             'scope',
-            sa.Enum('lease', 'booking', name='inspectionscope'),
+            postgresql.ENUM('lease', 'booking', name='inspectionscope', create_type=False),
             server_default='lease',
             nullable=False
         )
@@ -86,7 +89,8 @@ def upgrade() -> None:
         'inspections',
         sa.Column(
             'signed_by',
-            sa.Enum('TENANT', 'LANDLORD_ORG_MEMBER', 'HOST_SYSTEM', name='inspectionsignedby'),
+            postgresql.ENUM('TENANT', 'LANDLORD_ORG_MEMBER', 'HOST_SYSTEM',
+                            name='inspectionsignedby', create_type=False),
             nullable=True
         )
     )
@@ -123,32 +127,40 @@ def upgrade() -> None:
         "(scope = 'lease' AND inspection_type IN ('move_in', 'move_out', 'periodic'))"
     )
 
-    # Create bookings table using raw SQL to avoid enum recreation
-    op.execute("""
-        CREATE TABLE bookings (
-            id UUID PRIMARY KEY,
-            unit_id UUID NOT NULL REFERENCES units(id) ON DELETE CASCADE,
-            created_by_id UUID REFERENCES users(id) ON DELETE SET NULL,
-            external_id VARCHAR(100),
-            source VARCHAR(50) NOT NULL DEFAULT 'manual',
-            guest_name VARCHAR(255),
-            guest_count INTEGER NOT NULL DEFAULT 1,
-            check_in_date DATE NOT NULL,
-            check_out_date DATE NOT NULL,
-            actual_check_in TIMESTAMP,
-            actual_check_out TIMESTAMP,
-            status bookingstatus NOT NULL DEFAULT 'upcoming',
-            notes TEXT,
-            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-        )
-    """)
+    # bookingstatus already exists (DO block above), so the column must not
+    # try to create it again
+    op.create_table(
+        'bookings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('unit_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('units.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('created_by_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('external_id', sa.String(100), nullable=True),
+        sa.Column('source', sa.String(50), server_default='manual', nullable=False),
+        sa.Column('guest_name', sa.String(255), nullable=True),
+        sa.Column('guest_count', sa.Integer(), server_default=sa.text('1'), nullable=False),
+        sa.Column('check_in_date', sa.Date(), nullable=False),
+        sa.Column('check_out_date', sa.Date(), nullable=False),
+        sa.Column('actual_check_in', sa.DateTime(), nullable=True),
+        sa.Column('actual_check_out', sa.DateTime(), nullable=True),
+        sa.Column(
+            'status',
+            postgresql.ENUM('upcoming', 'checked_in', 'checked_out', 'cancelled', 'disputed',
+                            name='bookingstatus', create_type=False),
+            server_default='upcoming',
+            nullable=False
+        ),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+    )
 
-    # Add indexes for bookings
-    op.create_index('ix_bookings_unit_id', 'bookings', ['unit_id'])
-    op.create_index('ix_bookings_status', 'bookings', ['status'])
-    op.create_index('ix_bookings_external_id', 'bookings', ['external_id'])
-    op.create_index('ix_bookings_check_in_date', 'bookings', ['check_in_date'])
+    # Add indexes for bookings without blocking writers. CONCURRENTLY can't
+    # run inside a transaction (or a DO block), hence one statement each.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_unit_id ON bookings (unit_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_status ON bookings (status)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_external_id ON bookings (external_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_check_in_date ON bookings (check_in_date)")
 
 
 def downgrade() -> None:
@@ -14,29 +14,89 @@ Golden Master v2.3.1 schema changes:
 - Split audit_log into audit_log_core + activity_log
 """
 
+import os
+
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
+
+from app.core.migrations import execute_batch
 
 revision = '003_golden_master'
 down_revision = '002_str_support'
 branch_labels = None
 depends_on = None
 
+# Rows per UPDATE when backfilling inspection_evidence in place
+EVIDENCE_BATCH_SIZE = int(os.getenv('EVIDENCE_BACKFILL_BATCH_SIZE', '5000'))
+
+
+def _update_evidence_in_batches(set_clause: str) -> str:
+    """PL/pgSQL block applying ``set_clause`` to every inspection_evidence row.
+
+    Rows are updated in id order, EVIDENCE_BATCH_SIZE at a time, so the server
+    never has to plan and buffer a single write over the whole table. Each
+    batch reports its progress as a NOTICE. ``set_clause`` must be
+    deterministic so that re-running the block is harmless. The block is
+    meant to be run through execute_batch.
+    """
+    return f"""
+        DECLARE
+            last_id UUID := '00000000-0000-0000-0000-000000000000';
+            batch_last_id UUID;
+        BEGIN
+            LOOP
+                WITH batch AS (
+                    SELECT id FROM inspection_evidence
+                    WHERE id > last_id
+                    ORDER BY id
+                    LIMIT {EVIDENCE_BATCH_SIZE}
+                ), moved AS (
+                    UPDATE inspection_evidence AS e
+                    SET {set_clause.strip()}
+                    FROM batch
+                    WHERE e.id = batch.id
+                    RETURNING e.id
+                )
+                SELECT id INTO batch_last_id FROM moved ORDER BY id DESC LIMIT 1;
+                EXIT WHEN batch_last_id IS NULL;
+                last_id := batch_last_id;
+                RAISE NOTICE 'inspection_evidence backfill: done through id %', last_id;
+            END LOOP;
+        END
+    """
+
 
 def upgrade() -> None:
+    # Everything up to the concurrent index builds is collected here and sent
+    # to the server as a single batch, in dependency order.
+    ddl = []
+
+    # Let the inspection_evidence index and unique constraint builds use
+    # parallel workers. SET LOCAL lasts until the migration transaction ends.
+    if not os.getenv('SKIP_TUNING'):
+        ddl += [
+            "SET LOCAL max_parallel_maintenance_workers = 4",
+            "SET LOCAL maintenance_work_mem = '1GB'",
+        ]
+
     # === CREATE NEW ENUMS ===
-    op.execute("CREATE TYPE tenantrole AS ENUM ('PRIMARY', 'OCCUPANT')")
-    op.execute("CREATE TYPE invitestatus AS ENUM ('INVITED', 'ACCEPTED', 'REVOKED')")
-    op.execute("CREATE TYPE inspectioncondition AS ENUM ('good', 'fair', 'damaged', 'not_present')")
-    op.execute("CREATE TYPE evidencesource AS ENUM ('tenant', 'landlord', 'vendor', 'system')")
-    op.execute("CREATE TYPE signaturetype AS ENUM ('none', 'ed25519', 'p256')")
-    op.execute("CREATE TYPE contextverdict AS ENUM ('unknown', 'match', 'mismatch', 'inconclusive')")
-    op.execute("CREATE TYPE storageinstancekind AS ENUM ('gcs_generation', 's3_etag')")
-    op.execute("CREATE TYPE jobstatus AS ENUM ('pending', 'processing', 'completed', 'failed', 'dead_letter')")
+    # Each type tolerates already existing, as in 002/004
+    ddl += [
+        f"BEGIN CREATE TYPE {name} AS ENUM ({values}); EXCEPTION WHEN duplicate_object THEN NULL; END"
+        for name, values in [
+            ('tenantrole', "'PRIMARY', 'OCCUPANT'"),
+            ('invitestatus', "'INVITED', 'ACCEPTED', 'REVOKED'"),
+            ('inspectioncondition', "'good', 'fair', 'damaged', 'not_present'"),
+            ('evidencesource', "'tenant', 'landlord', 'vendor', 'system'"),
+            ('signaturetype', "'none', 'ed25519', 'p256'"),
+            ('contextverdict', "'unknown', 'match', 'mismatch', 'inconclusive'"),
+            ('storageinstancekind', "'gcs_generation', 's3_etag'"),
+            ('jobstatus', "'pending', 'processing', 'completed', 'failed', 'dead_letter'"),
+        ]
+    ]
 
     # === JOBS_OUTBOX TABLE ===
-    op.execute("""
+    ddl.append("""
         CREATE TABLE jobs_outbox (
             id UUID PRIMARY KEY,
             type VARCHAR(100) NOT NULL,
@@ -52,104 +112,128 @@ def upgrade() -> None:
             completed_at TIMESTAMP
         )
     """)
-    op.create_index('ix_jobs_outbox_type', 'jobs_outbox', ['type'])
-    op.create_index('ix_jobs_outbox_status', 'jobs_outbox', ['status'])
+
+    # Wake LISTENing workers on enqueue so they don't have to poll for work
+    ddl += [
+        """
+        CREATE OR REPLACE FUNCTION notify_jobs_outbox() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('jobs_outbox_new', NEW.type);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER trg_notify_jobs_outbox AFTER INSERT ON jobs_outbox
+        FOR EACH ROW EXECUTE FUNCTION notify_jobs_outbox()
+        """,
+    ]
 
     # === TENANT_ACCESS CHANGES ===
-    # Add new columns
-    op.add_column('tenant_access', sa.Column('role', sa.Enum('PRIMARY', 'OCCUPANT', name='tenantrole'), server_default='PRIMARY', nullable=False))
-    op.add_column('tenant_access', sa.Column('status', sa.Enum('INVITED', 'ACCEPTED', 'REVOKED', name='invitestatus'), server_default='INVITED', nullable=False))
-    op.add_column('tenant_access', sa.Column('invited_at', sa.DateTime(), server_default=sa.func.now(), nullable=False))
-    op.add_column('tenant_access', sa.Column('accepted_at', sa.DateTime(), nullable=True))
-    op.add_column('tenant_access', sa.Column('revoked_at', sa.DateTime(), nullable=True))
-    
-    # Rename user_id to tenant_user_id
-    op.alter_column('tenant_access', 'user_id', new_column_name='tenant_user_id')
-    
-    # Drop old column and add unique constraint
-    op.drop_column('tenant_access', 'is_primary')
-    op.drop_column('tenant_access', 'created_at')
-    op.create_unique_constraint('uq_tenant_access_lease_user', 'tenant_access', ['lease_id', 'tenant_user_id'])
+    # Add new columns and drop old ones under a single lock. The defaults are
+    # non-volatile, so on PG11+ the NOT NULL adds are metadata-only.
+    ddl += [
+        """
+        ALTER TABLE tenant_access
+            ADD COLUMN role tenantrole NOT NULL DEFAULT 'PRIMARY',
+            ADD COLUMN status invitestatus NOT NULL DEFAULT 'INVITED',
+            ADD COLUMN invited_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            ADD COLUMN accepted_at TIMESTAMP,
+            ADD COLUMN revoked_at TIMESTAMP,
+            DROP COLUMN is_primary,
+            DROP COLUMN created_at
+        """,
+        "ALTER TABLE tenant_access RENAME COLUMN user_id TO tenant_user_id",
+        "ALTER TABLE tenant_access ADD CONSTRAINT uq_tenant_access_lease_user UNIQUE (lease_id, tenant_user_id)",
+    ]
 
     # === INSPECTION CHANGES ===
-    # Add Golden Master v2.3.1 columns
-    op.add_column('inspections', sa.Column('locked_at', sa.DateTime(), nullable=True))
-    op.add_column('inspections', sa.Column('device_signed_at', sa.DateTime(), nullable=True))
-    op.add_column('inspections', sa.Column('captured_offline', sa.Boolean(), server_default='false', nullable=False))
-    op.add_column('inspections', sa.Column('canonical_json_blob', postgresql.JSONB(), nullable=True))
-    op.add_column('inspections', sa.Column('canonical_json_sha256', sa.String(64), nullable=True))
-    op.add_column('inspections', sa.Column('certificate_pdf_path', sa.String(500), nullable=True))
-    op.add_column('inspections', sa.Column('certificate_pdf_sha256', sa.String(64), nullable=True))
+    # Add Golden Master v2.3.1 columns in one ALTER (one lock, no rewrite)
+    ddl.append("""
+        ALTER TABLE inspections
+            ADD COLUMN locked_at TIMESTAMP,
+            ADD COLUMN device_signed_at TIMESTAMP,
+            ADD COLUMN captured_offline BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN canonical_json_blob JSONB,
+            ADD COLUMN canonical_json_sha256 BYTEA,
+            ADD COLUMN certificate_pdf_path VARCHAR(500),
+            ADD COLUMN certificate_pdf_sha256 BYTEA
+    """)
 
     # === INSPECTION_ITEMS CHANGES ===
-    # Rename columns to Golden Master pattern
-    op.alter_column('inspection_items', 'room_name', new_column_name='room_key')
-    op.alter_column('inspection_items', 'item_name', new_column_name='item_key')
-    
-    # Add new columns
-    op.add_column('inspection_items', sa.Column('ordinal', sa.Integer(), server_default='0', nullable=False))
-    op.add_column('inspection_items', sa.Column('condition', sa.Enum('good', 'fair', 'damaged', 'not_present', name='inspectioncondition'), server_default='good', nullable=False))
-    
-    # Rename condition_notes to notes (simpler)
-    op.alter_column('inspection_items', 'condition_notes', new_column_name='notes')
-    
-    # Drop old columns
-    op.drop_column('inspection_items', 'condition_rating')
-    op.drop_column('inspection_items', 'is_damaged')
-    op.drop_column('inspection_items', 'damage_description')
-    
-    # Add unique constraint
-    op.create_unique_constraint('uq_inspection_item_order', 'inspection_items', ['inspection_id', 'room_key', 'ordinal', 'item_key'])
+    # Rename columns to Golden Master pattern (condition_notes becomes plain
+    # notes), then add, drop and constrain in a single ALTER. RENAME can't
+    # share an ALTER TABLE with other actions.
+    ddl += [
+        "ALTER TABLE inspection_items RENAME COLUMN room_name TO room_key",
+        "ALTER TABLE inspection_items RENAME COLUMN item_name TO item_key",
+        "ALTER TABLE inspection_items RENAME COLUMN condition_notes TO notes",
+        """
+        ALTER TABLE inspection_items
+            ADD COLUMN ordinal INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN condition inspectioncondition NOT NULL DEFAULT 'good',
+            DROP COLUMN condition_rating,
+            DROP COLUMN is_damaged,
+            DROP COLUMN damage_description,
+            ADD CONSTRAINT uq_inspection_item_order UNIQUE (inspection_id, room_key, ordinal, item_key)
+        """,
+    ]
 
     # === INSPECTION_EVIDENCE CHANGES ===
-    # This is a significant schema change - we'll recreate the table
-    op.rename_table('inspection_evidence', 'inspection_evidence_old')
-    
-    op.execute("""
-        CREATE TABLE inspection_evidence (
-            id UUID PRIMARY KEY,
-            inspection_item_id UUID NOT NULL REFERENCES inspection_items(id) ON DELETE CASCADE,
-            object_path VARCHAR(500) NOT NULL UNIQUE,
-            mime_type VARCHAR(100) NOT NULL,
-            size_bytes BIGINT NOT NULL,
-            file_sha256_claimed VARCHAR(64) NOT NULL,
-            file_sha256_verified VARCHAR(64),
-            confirmed_at TIMESTAMP NOT NULL,
-            evidence_source evidencesource NOT NULL DEFAULT 'tenant',
-            storage_instance_kind storageinstancekind NOT NULL,
-            storage_instance_id VARCHAR(255) NOT NULL,
-            confirm_idempotency_key VARCHAR(255) NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            CONSTRAINT uq_evidence_confirm UNIQUE (inspection_item_id, confirm_idempotency_key)
-        )
-    """)
-    # Index created inline in CREATE TABLE
-    
-    # Migrate data from old table (best effort - some columns won't map directly)
-    op.execute("""
-        INSERT INTO inspection_evidence (
-            id, inspection_item_id, object_path, mime_type, size_bytes,
-            file_sha256_claimed, file_sha256_verified, confirmed_at,
-            evidence_source, storage_instance_kind, storage_instance_id,
-            confirm_idempotency_key, created_at
-        )
-        SELECT 
-            id, item_id, object_path, mime_type, file_size_bytes,
-            file_hash, CASE WHEN is_confirmed THEN file_hash ELSE NULL END,
-            COALESCE(confirmed_at, created_at),
-            'tenant', 'gcs_generation', 'migrated-' || id::text,
-            'migrated-' || id::text, created_at
-        FROM inspection_evidence_old
-    """)
-    
-    op.drop_table('inspection_evidence_old')
+    # Reshape the table in place rather than copying every row into a new one.
+    # Every updated row version would also be inserted into each index, so
+    # the secondary index is dropped for the backfill and the unique
+    # constraints only go on afterwards, when they can be built by sorting.
+    ddl += [
+        "ALTER TABLE inspection_evidence RENAME COLUMN item_id TO inspection_item_id",
+        "ALTER TABLE inspection_evidence RENAME COLUMN file_size_bytes TO size_bytes",
+        "ALTER TABLE inspection_evidence RENAME COLUMN file_hash TO file_sha256_claimed",
+        "ALTER TABLE inspection_evidence RENAME CONSTRAINT inspection_evidence_item_id_fkey "
+        "TO inspection_evidence_inspection_item_id_fkey",
+        "DROP INDEX ix_inspection_evidence_item_id",
+        """
+        ALTER TABLE inspection_evidence
+            ALTER COLUMN size_bytes TYPE BIGINT,
+            ALTER COLUMN file_sha256_claimed TYPE BYTEA USING decode(file_sha256_claimed, 'hex'),
+            ALTER COLUMN created_at SET DEFAULT NOW(),
+            ADD COLUMN file_sha256_verified BYTEA,
+            ADD COLUMN evidence_source evidencesource NOT NULL DEFAULT 'tenant',
+            ADD COLUMN storage_instance_kind storageinstancekind NOT NULL DEFAULT 'gcs_generation',
+            ADD COLUMN storage_instance_id VARCHAR(255),
+            ADD COLUMN confirm_idempotency_key VARCHAR(255)
+        """,
+    ]
+
+    # Backfill (best effort - some columns won't map directly)
+    ddl.append(_update_evidence_in_batches("""
+        file_sha256_verified = CASE WHEN e.is_confirmed THEN e.file_sha256_claimed ELSE NULL END,
+        confirmed_at = COALESCE(e.confirmed_at, e.created_at),
+        storage_instance_id = 'migrated-' || e.id::text,
+        confirm_idempotency_key = 'migrated-' || e.id::text
+    """))
+
+    ddl += [
+        """
+        ALTER TABLE inspection_evidence
+            DROP COLUMN evidence_type,
+            DROP COLUMN file_name,
+            DROP COLUMN is_confirmed,
+            DROP COLUMN file_metadata,
+            ALTER COLUMN storage_instance_kind DROP DEFAULT,
+            ALTER COLUMN confirmed_at SET NOT NULL,
+            ALTER COLUMN storage_instance_id SET NOT NULL,
+            ALTER COLUMN confirm_idempotency_key SET NOT NULL,
+            ADD CONSTRAINT inspection_evidence_object_path_key UNIQUE (object_path),
+            ADD CONSTRAINT uq_evidence_confirm UNIQUE (inspection_item_id, confirm_idempotency_key)
+        """,
+        "CREATE INDEX ix_inspection_evidence_inspection_item_id ON inspection_evidence (inspection_item_id)",
+    ]
 
     # === AUDIT LOG CHANGES ===
-    # Rename audit_log to audit_log_core
-    op.rename_table('audit_log', 'audit_log_core')
-    
-    # Create activity_log table
-    op.execute("""
+    # Rename audit_log to audit_log_core and create activity_log
+    ddl += [
+        "ALTER TABLE audit_log RENAME TO audit_log_core",
+        """
         CREATE TABLE activity_log (
             id UUID PRIMARY KEY,
             org_id UUID REFERENCES organizations(id) ON DELETE SET NULL,
@@ -162,56 +246,78 @@ def upgrade() -> None:
             user_agent VARCHAR(500),
             created_at TIMESTAMP NOT NULL DEFAULT NOW()
         )
-    """)
-    op.create_index('ix_activity_log_org_id', 'activity_log', ['org_id'])
-    op.create_index('ix_activity_log_user_id', 'activity_log', ['user_id'])
-    op.create_index('ix_activity_log_activity_type', 'activity_log', ['activity_type'])
+        """,
+    ]
+
+    execute_batch(ddl)
+
+    # === INDEXES ===
+    # Built CONCURRENTLY so writers aren't blocked; that can't happen inside a
+    # transaction, so this has to be the last step of the revision.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_outbox_type ON jobs_outbox (type)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_outbox_pending ON jobs_outbox (status, run_after) "
+            "INCLUDE (type) WHERE status IN ('pending', 'processing')"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_activity_log_org_created "
+            "ON activity_log (org_id, created_at DESC) INCLUDE (activity_type, resource_type, resource_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_activity_log_user_created "
+            "ON activity_log (user_id, created_at DESC) INCLUDE (activity_type)"
+        )
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_activity_log_activity_type ON activity_log (activity_type)")
 
 
 def downgrade() -> None:
     # Drop activity_log
     op.drop_index('ix_activity_log_activity_type')
-    op.drop_index('ix_activity_log_user_id')
-    op.drop_index('ix_activity_log_org_id')
+    op.drop_index('ix_activity_log_user_created')
+    op.drop_index('ix_activity_log_org_created')
     op.drop_table('activity_log')
     
     # Rename audit_log_core back to audit_log
     op.rename_table('audit_log_core', 'audit_log')
     
-    # Recreate old inspection_evidence structure
-    op.rename_table('inspection_evidence', 'inspection_evidence_new')
-    
-    op.execute("""
-        CREATE TABLE inspection_evidence (
-            id UUID PRIMARY KEY,
-            item_id UUID NOT NULL REFERENCES inspection_items(id) ON DELETE CASCADE,
-            evidence_type VARCHAR(20) NOT NULL DEFAULT 'photo',
-            object_path VARCHAR(500) NOT NULL,
-            file_name VARCHAR(255) NOT NULL,
-            mime_type VARCHAR(100) NOT NULL,
-            file_size_bytes INTEGER NOT NULL,
-            file_hash VARCHAR(64) NOT NULL,
-            is_confirmed BOOLEAN NOT NULL DEFAULT FALSE,
-            confirmed_at TIMESTAMP,
-            file_metadata JSONB,
-            created_at TIMESTAMP NOT NULL DEFAULT NOW()
-        )
-    """)
-    
+    # Restore the old inspection_evidence shape in place
+    execute_batch([
+        "DROP INDEX ix_inspection_evidence_inspection_item_id",
+        """
+        ALTER TABLE inspection_evidence
+            DROP CONSTRAINT uq_evidence_confirm,
+            DROP CONSTRAINT inspection_evidence_object_path_key,
+            ALTER COLUMN size_bytes TYPE INTEGER,
+            ALTER COLUMN file_sha256_claimed TYPE VARCHAR(64) USING encode(file_sha256_claimed, 'hex'),
+            ALTER COLUMN confirmed_at DROP NOT NULL,
+            ADD COLUMN evidence_type VARCHAR(20) NOT NULL DEFAULT 'photo',
+            ADD COLUMN file_name VARCHAR(255) NOT NULL DEFAULT 'migrated-file',
+            ADD COLUMN is_confirmed BOOLEAN NOT NULL DEFAULT FALSE,
+            ADD COLUMN file_metadata JSONB
+        """,
+    ])
+
     # Migrate data back (best effort)
-    op.execute("""
-        INSERT INTO inspection_evidence (
-            id, item_id, object_path, file_name, mime_type, file_size_bytes,
-            file_hash, is_confirmed, confirmed_at, created_at
-        )
-        SELECT 
-            id, inspection_item_id, object_path, 'migrated-file', mime_type, size_bytes,
-            file_sha256_claimed, file_sha256_verified IS NOT NULL, confirmed_at, created_at
-        FROM inspection_evidence_new
-    """)
-    
-    op.drop_table('inspection_evidence_new')
-    op.create_index('ix_inspection_evidence_item_id', 'inspection_evidence', ['item_id'])
+    execute_batch([_update_evidence_in_batches("is_confirmed = e.file_sha256_verified IS NOT NULL")])
+
+    execute_batch([
+        """
+        ALTER TABLE inspection_evidence
+            ALTER COLUMN file_name DROP DEFAULT,
+            DROP COLUMN file_sha256_verified,
+            DROP COLUMN evidence_source,
+            DROP COLUMN storage_instance_kind,
+            DROP COLUMN storage_instance_id,
+            DROP COLUMN confirm_idempotency_key
+        """,
+        "ALTER TABLE inspection_evidence RENAME CONSTRAINT inspection_evidence_inspection_item_id_fkey "
+        "TO inspection_evidence_item_id_fkey",
+        "ALTER TABLE inspection_evidence RENAME COLUMN file_sha256_claimed TO file_hash",
+        "ALTER TABLE inspection_evidence RENAME COLUMN size_bytes TO file_size_bytes",
+        "ALTER TABLE inspection_evidence RENAME COLUMN inspection_item_id TO item_id",
+        "CREATE INDEX ix_inspection_evidence_item_id ON inspection_evidence (item_id)",
+    ])
     
     # Revert inspection_items changes
     op.drop_constraint('uq_inspection_item_order', 'inspection_items')
@@ -245,16 +351,14 @@ def downgrade() -> None:
     op.drop_column('tenant_access', 'role')
     
     # Drop jobs_outbox
-    op.drop_index('ix_jobs_outbox_status')
+    op.execute("DROP TRIGGER IF EXISTS trg_notify_jobs_outbox ON jobs_outbox")
+    op.execute("DROP FUNCTION IF EXISTS notify_jobs_outbox()")
+    op.drop_index('ix_jobs_outbox_pending')
     op.drop_index('ix_jobs_outbox_type')
     op.drop_table('jobs_outbox')
     
     # Drop enums
-    op.execute("DROP TYPE IF EXISTS jobstatus")
-    op.execute("DROP TYPE IF EXISTS storageinstancekind")
-    op.execute("DROP TYPE IF EXISTS contextverdict")
-    op.execute("DROP TYPE IF EXISTS signaturetype")
-    op.execute("DROP TYPE IF EXISTS evidencesource")
-    op.execute("DROP TYPE IF EXISTS inspectioncondition")
-    op.execute("DROP TYPE IF EXISTS invitestatus")
-    op.execute("DROP TYPE IF EXISTS tenantrole")
+    op.execute(
+        'DROP TYPE IF EXISTS jobstatus, storageinstancekind, contextverdict, signaturetype, '
+        'evidencesource, inspectioncondition, invitestatus, tenantrole'
+    )
@@ -8,6 +8,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID
 
+from app.core.migrations import execute_batch
+
 revision = '004_str_turnover'
 down_revision = '003_golden_master'
 branch_labels = None
@@ -15,31 +17,33 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Create turnover status enum (IF NOT EXISTS)
-    op.execute("""
-        DO $$ BEGIN
+    # Add ORG_CLEANER to orgrole enum, committed on its own as in 002. For a
+    # larger reshuffle of orgrole, create a replacement type and swap the
+    # column over (USING role::text::orgrole_new) instead of repeated ADD VALUE.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE orgrole ADD VALUE IF NOT EXISTS 'ORG_CLEANER'")
+
+    # Everything else goes to the server as a single batch. Tables are raw SQL
+    # to bypass SQLAlchemy enum auto-creation.
+    execute_batch([
+        # Turnover status and photo type enums (IF NOT EXISTS)
+        """
+        BEGIN
             CREATE TYPE turnoverstatus AS ENUM (
                 'pending', 'in_progress', 'completed', 'verified', 'flagged'
             );
         EXCEPTION WHEN duplicate_object THEN NULL;
-        END $$;
-    """)
-    
-    # Create turnover photo type enum (IF NOT EXISTS)
-    op.execute("""
-        DO $$ BEGIN
+        END
+        """,
+        """
+        BEGIN
             CREATE TYPE turnoverphoto AS ENUM (
                 'bed', 'kitchen', 'bathroom', 'towels', 'keys', 'inventory'
             );
         EXCEPTION WHEN duplicate_object THEN NULL;
-        END $$;
-    """)
-    
-    # Add ORG_CLEANER to orgrole enum
-    op.execute("ALTER TYPE orgrole ADD VALUE IF NOT EXISTS 'ORG_CLEANER'")
-    
-    # Create turnovers table using raw SQL to bypass SQLAlchemy enum auto-creation
-    op.execute("""
+        END
+        """,
+        """
         CREATE TABLE turnovers (
             id UUID PRIMARY KEY,
             unit_id UUID NOT NULL REFERENCES units(id) ON DELETE CASCADE,
@@ -60,19 +64,17 @@ def upgrade() -> None:
             created_at TIMESTAMP DEFAULT NOW(),
             updated_at TIMESTAMP DEFAULT NOW()
         )
-    """)
-    op.create_index('ix_turnovers_unit_id', 'turnovers', ['unit_id'])
-    op.create_index('ix_turnovers_assigned_cleaner_id', 'turnovers', ['assigned_cleaner_id'])
-    op.create_index('ix_turnovers_status', 'turnovers', ['status'])
-    
-    # Create turnover_photos table using raw SQL
-    op.execute("""
+        """,
+        "CREATE INDEX ix_turnovers_unit_id ON turnovers (unit_id)",
+        "CREATE INDEX ix_turnovers_assigned_cleaner_id ON turnovers (assigned_cleaner_id)",
+        "CREATE INDEX ix_turnovers_status ON turnovers (status) WHERE status IN ('pending', 'in_progress')",
+        """
         CREATE TABLE turnover_photos (
             id UUID PRIMARY KEY,
             turnover_id UUID NOT NULL REFERENCES turnovers(id) ON DELETE CASCADE,
             photo_type turnoverphoto NOT NULL,
             object_path VARCHAR(500) NOT NULL,
-            file_hash VARCHAR(64) NOT NULL,
+            file_hash BYTEA NOT NULL,
             mime_type VARCHAR(100) DEFAULT 'image/jpeg',
             file_size_bytes INTEGER NOT NULL,
             notes TEXT,
@@ -80,11 +82,11 @@ def upgrade() -> None:
             uploaded_at TIMESTAMP DEFAULT NOW(),
             uploaded_by_id UUID REFERENCES users(id) ON DELETE SET NULL
         )
-    """)
-    op.create_index('ix_turnover_photos_turnover_id', 'turnover_photos', ['turnover_id'])
-    
-    # Create turnover_inventory table
-    op.execute("""
+        """,
+        "CREATE INDEX ix_turnover_photos_turnover_id ON turnover_photos (turnover_id)",
+        # One photo of each type per turnover
+        "ALTER TABLE turnover_photos ADD CONSTRAINT uq_turnover_photo_type UNIQUE (turnover_id, photo_type)",
+        """
         CREATE TABLE turnover_inventory (
             id UUID PRIMARY KEY,
             turnover_id UUID NOT NULL REFERENCES turnovers(id) ON DELETE CASCADE,
@@ -97,15 +99,9 @@ def upgrade() -> None:
             notes TEXT,
             checked_at TIMESTAMP DEFAULT NOW()
         )
-    """)
-    op.create_index('ix_turnover_inventory_turnover_id', 'turnover_inventory', ['turnover_id'])
-    
-    # Create unique constraint for photo type per turnover
-    op.create_unique_constraint(
-        'uq_turnover_photo_type',
-        'turnover_photos',
-        ['turnover_id', 'photo_type']
-    )
+        """,
+        "CREATE INDEX ix_turnover_inventory_turnover_id ON turnover_inventory (turnover_id)",
+    ])
 
 
 def downgrade() -> None:
@@ -0,0 +1,66 @@
+"""Composite indexes for audit, Mason log and booking calendar lookups.
+
+Revision ID: 005_log_composite_indexes
+Revises: 004_str_turnover
+Create Date: 2026-10-16
+
+- audit_log_core: (org_id, created_at DESC), (org_id, action, created_at DESC)
+  and (org_id, resource_type, resource_id) replace the single-column org_id
+  and action indexes
+- mason_logs: (org_id, created_at DESC) replaces the org_id index
+- bookings: (unit_id, check_in_date) replaces the unit_id index
+"""
+from alembic import op
+
+
+revision = '005_log_composite_indexes'
+down_revision = '004_str_turnover'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built without blocking writers on these append-heavy tables. CONCURRENTLY
+    # can't run inside a transaction (or a DO block), hence one statement each.
+    # The old single-column indexes are left-prefixes of the new ones, so they
+    # are dropped only once their replacements exist.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_log_org_created "
+            "ON audit_log_core (org_id, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_log_org_action_created "
+            "ON audit_log_core (org_id, action, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_log_org_resource "
+            "ON audit_log_core (org_id, resource_type, resource_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_mason_logs_org_created "
+            "ON mason_logs (org_id, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_unit_check_in "
+            "ON bookings (unit_id, check_in_date)"
+        )
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_log_org_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_log_action")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_mason_logs_org_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bookings_unit_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_unit_id ON bookings (unit_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_mason_logs_org_id ON mason_logs (org_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_log_action ON audit_log_core (action)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_log_org_id ON audit_log_core (org_id)")
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bookings_unit_check_in")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_mason_logs_org_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_log_org_resource")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_log_org_action_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_log_org_created")
@@ -0,0 +1,174 @@
+"""Partition audit_log_core and mason_logs by month on created_at.
+
+Revision ID: 006_partition_logs
+Revises: 005_log_composite_indexes
+Create Date: 2026-10-16
+
+Both tables are append-only and read almost exclusively over a recent window.
+As RANGE (created_at) partitioned tables the planner skips old months, each
+partition's indexes stay small, and retention becomes
+
+    ALTER TABLE audit_log_core DETACH PARTITION audit_log_core_2025_01;
+    DROP TABLE audit_log_core_2025_01;
+
+instead of a row-by-row DELETE. Postgres requires the partition key in the
+primary key, so the PK becomes (id, created_at).
+
+Partitions are created by create_monthly_partitions(parent, since,
+months_ahead). The app keeps them two months ahead of now
+(app.services.partitions, run on start-up and every few hours, or once via
+``python -m app.services.partitions``); when pg_cron is installed it is also
+scheduled there. A DEFAULT partition catches anything outside the created
+range, and the next run moves those rows into their month's partition.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '006_partition_logs'
+down_revision = '005_log_composite_indexes'
+branch_labels = None
+depends_on = None
+
+# Months of partitions kept ready ahead of the current one
+MONTHS_AHEAD = 2
+
+# Foreign keys and secondary indexes per table; LIKE copies neither
+FOREIGN_KEYS = {
+    'audit_log_core': [
+        ('audit_log_core_org_id_fkey', 'org_id', 'organizations'),
+        ('audit_log_core_user_id_fkey', 'user_id', 'users'),
+    ],
+    'mason_logs': [
+        ('mason_logs_org_id_fkey', 'org_id', 'organizations'),
+    ],
+}
+INDEXES = {
+    'audit_log_core': [
+        'CREATE INDEX ix_audit_log_user_id ON audit_log_core (user_id)',
+        'CREATE INDEX ix_audit_log_org_created ON audit_log_core (org_id, created_at DESC)',
+        'CREATE INDEX ix_audit_log_org_action_created ON audit_log_core (org_id, action, created_at DESC)',
+        'CREATE INDEX ix_audit_log_org_resource ON audit_log_core (org_id, resource_type, resource_id)',
+    ],
+    'mason_logs': [
+        'CREATE INDEX ix_mason_logs_org_created ON mason_logs (org_id, created_at DESC)',
+    ],
+}
+PRIMARY_KEYS = {
+    'audit_log_core': 'audit_log_pkey',
+    'mason_logs': 'mason_logs_pkey',
+}
+
+CRON_JOB = 'log-partitions'
+CRON_COMMAND = (
+    f"SELECT create_monthly_partitions('audit_log_core', now()::date, {MONTHS_AHEAD}); "
+    f"SELECT create_monthly_partitions('mason_logs', now()::date, {MONTHS_AHEAD})"
+)
+
+
+def _swap_table(table: str, partitioned: bool) -> list[str]:
+    """Statements rebuilding ``table`` as a partitioned (or plain) table.
+
+    The old table is renamed aside, a copy with the same columns is created,
+    rows are moved over, and only then is the old table dropped so its
+    index and PK names are free for the new one.
+    """
+    old = f'{table}_swap'
+    pk_columns = 'id, created_at' if partitioned else 'id'
+    statements = [
+        f'ALTER TABLE {table} RENAME TO {old}',
+        f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        + (' PARTITION BY RANGE (created_at)' if partitioned else ''),
+    ]
+    if partitioned:
+        statements += [
+            f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT',
+            f"""
+            PERFORM create_monthly_partitions(
+                '{table}',
+                COALESCE((SELECT min(created_at) FROM {old})::date, now()::date),
+                {MONTHS_AHEAD}
+            )
+            """,
+        ]
+    statements += [
+        f'INSERT INTO {table} SELECT * FROM {old}',
+        f'DROP TABLE {old}',
+        f'ALTER TABLE {table} ADD CONSTRAINT {PRIMARY_KEYS[table]} PRIMARY KEY ({pk_columns})',
+    ]
+    for name, column, target in FOREIGN_KEYS[table]:
+        statements.append(
+            f'ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) '
+            f'REFERENCES {target}(id) ON DELETE SET NULL'
+        )
+    return statements + INDEXES[table]
+
+
+def upgrade() -> None:
+    execute_batch([
+        """
+        CREATE OR REPLACE FUNCTION create_monthly_partitions(
+            parent TEXT, since DATE DEFAULT now()::date, months_ahead INT DEFAULT 2
+        ) RETURNS VOID LANGUAGE plpgsql AS $fn$
+        DECLARE
+            default_part TEXT := parent || '_default';
+            part_start DATE := date_trunc('month', since)::date;
+            last_start DATE := date_trunc('month', now() + make_interval(months => months_ahead))::date;
+            stray_start DATE;
+            part TEXT;
+        BEGIN
+            -- Rows that landed in the DEFAULT partition get their month too
+            IF to_regclass(default_part) IS NOT NULL THEN
+                EXECUTE format('SELECT date_trunc(''month'', min(created_at))::date FROM %I', default_part)
+                INTO stray_start;
+                part_start := LEAST(part_start, COALESCE(stray_start, part_start));
+            END IF;
+            WHILE part_start <= last_start LOOP
+                part := parent || '_' || to_char(part_start, 'YYYY_MM');
+                IF to_regclass(part) IS NULL THEN
+                    -- Postgres refuses a new partition while DEFAULT holds
+                    -- rows in its range, so build it detached, move those
+                    -- rows into it and then attach it
+                    EXECUTE format(
+                        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                        part, parent
+                    );
+                    IF to_regclass(default_part) IS NOT NULL THEN
+                        EXECUTE format(
+                            'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L '
+                            'RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                            default_part, part_start, (part_start + interval '1 month')::date, part
+                        );
+                    END IF;
+                    EXECUTE format(
+                        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        parent, part, part_start, (part_start + interval '1 month')::date
+                    );
+                END IF;
+                part_start := (part_start + interval '1 month')::date;
+            END LOOP;
+        END
+        $fn$
+        """,
+        *_swap_table('audit_log_core', partitioned=True),
+        *_swap_table('mason_logs', partitioned=True),
+        # Keep partitions ahead of the clock on the 1st of each month
+        f"""
+        IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+            PERFORM cron.schedule('{CRON_JOB}', '0 3 1 * *', $cmd${CRON_COMMAND}$cmd$);
+        END IF
+        """,
+    ])
+
+
+def downgrade() -> None:
+    execute_batch([
+        f"""
+        IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+            PERFORM cron.unschedule(jobid) FROM cron.job WHERE jobname = '{CRON_JOB}';
+        END IF
+        """,
+        # Dropping the swapped-out partitioned parent drops its partitions too
+        *_swap_table('mason_logs', partitioned=False),
+        *_swap_table('audit_log_core', partitioned=False),
+        'DROP FUNCTION IF EXISTS create_monthly_partitions(TEXT, DATE, INT)',
+    ])
@@ -0,0 +1,41 @@
+"""GIN (jsonb_path_ops) indexes on the audit and Mason log JSONB columns.
+
+Revision ID: 007_log_jsonb_gin
+Revises: 006_partition_logs
+Create Date: 2026-10-16
+
+jsonb_path_ops only supports containment (@>), which is the shape of every
+lookup on these columns, and is several times smaller than the default
+jsonb_ops GIN. Filter with ``column.op('@>')({...})`` (or ``.contains``)
+rather than ``->>`` comparisons, which these indexes can't serve.
+"""
+
+from alembic import op
+
+from app.core.migrations import execute_batch
+
+revision = '007_log_jsonb_gin'
+down_revision = '006_partition_logs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Both tables are partitioned (006), and CREATE INDEX CONCURRENTLY isn't
+    # supported on a partitioned parent; building on the parent cascades to
+    # every partition in one statement.
+    execute_batch([
+        "CREATE INDEX IF NOT EXISTS ix_audit_log_details_gin "
+        "ON audit_log_core USING gin (details jsonb_path_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_mason_logs_input_data_gin "
+        "ON mason_logs USING gin (input_data jsonb_path_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_mason_logs_output_data_gin "
+        "ON mason_logs USING gin (output_data jsonb_path_ops)",
+    ])
+
+
+def downgrade() -> None:
+    op.execute(
+        'DROP INDEX IF EXISTS ix_mason_logs_output_data_gin, '
+        'ix_mason_logs_input_data_gin, ix_audit_log_details_gin'
+    )
@@ -0,0 +1,70 @@
+"""Server-side created_at/updated_at for logs, bookings and inspections.
+
+Revision ID: 008_server_timestamps
+Revises: 007_log_jsonb_gin
+Create Date: 2026-10-16
+
+created_at defaults to the database clock and updated_at is stamped by a
+BEFORE UPDATE trigger, so the ORM no longer builds and sends a datetime per
+write. Values stay naive UTC (timezone('utc', now())) to match the existing
+TIMESTAMP columns and the rest of the app.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '008_server_timestamps'
+down_revision = '007_log_jsonb_gin'
+branch_labels = None
+depends_on = None
+
+UTC_NOW = "timezone('utc', now())"
+
+CREATED_ONLY = ['audit_log_core', 'mason_logs', 'inspection_evidence']
+CREATED_AND_UPDATED = ['bookings', 'inspections', 'inspection_items']
+
+
+def upgrade() -> None:
+    ddl = [
+        f"""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger
+        LANGUAGE plpgsql AS $fn$
+        BEGIN
+            NEW.updated_at := {UTC_NOW};
+            RETURN NEW;
+        END
+        $fn$
+        """,
+    ]
+    for table in CREATED_ONLY:
+        ddl.append(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT {UTC_NOW}")
+    for table in CREATED_AND_UPDATED:
+        ddl += [
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN created_at SET DEFAULT {UTC_NOW}, "
+            f"ALTER COLUMN updated_at SET DEFAULT {UTC_NOW}",
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()",
+        ]
+    execute_batch(ddl)
+
+
+def downgrade() -> None:
+    ddl = []
+    for table in CREATED_AND_UPDATED:
+        ddl.append(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    for table in CREATED_ONLY:
+        ddl.append(f"ALTER TABLE {table} ALTER COLUMN created_at DROP DEFAULT")
+    for table in ['inspections', 'inspection_items']:
+        ddl.append(
+            f"ALTER TABLE {table} "
+            "ALTER COLUMN created_at DROP DEFAULT, "
+            "ALTER COLUMN updated_at DROP DEFAULT"
+        )
+    ddl += [
+        # bookings had NOW() defaults from 002
+        "ALTER TABLE bookings "
+        "ALTER COLUMN created_at SET DEFAULT NOW(), "
+        "ALTER COLUMN updated_at SET DEFAULT NOW()",
+        "DROP FUNCTION IF EXISTS set_updated_at()",
+    ]
+    execute_batch(ddl)
@@ -0,0 +1,50 @@
+"""Booking date-range index and double-booking exclusion constraint.
+
+Revision ID: 009_booking_overlap
+Revises: 008_server_timestamps
+Create Date: 2026-10-16
+
+- ix_bookings_unit_dates (unit_id, check_out_date, check_in_date) for
+  "bookings on unit X overlapping [a, b)" availability lookups
+- no_overlap_bookings: EXCLUDE USING gist over (unit_id, [check_in, check_out))
+  for active bookings, so two live bookings can never overlap on a unit no
+  matter how requests interleave. Its GiST index also serves && queries.
+
+Adding the constraint fails if active bookings already overlap; resolve (or
+cancel) those first.
+"""
+
+from alembic import op
+
+from app.core.migrations import execute_batch
+
+revision = '009_booking_overlap'
+down_revision = '008_server_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_unit_dates "
+            "ON bookings (unit_id, check_out_date, check_in_date)"
+        )
+
+    # btree_gist supplies the GiST = operator for the uuid column
+    execute_batch([
+        "CREATE EXTENSION IF NOT EXISTS btree_gist",
+        """
+        ALTER TABLE bookings ADD CONSTRAINT no_overlap_bookings EXCLUDE USING gist (
+            unit_id WITH =,
+            daterange(check_in_date, check_out_date, '[)') WITH &&
+        ) WHERE (status IN ('upcoming', 'checked_in'))
+        """,
+    ])
+
+
+def downgrade() -> None:
+    # btree_gist is left installed; other objects may rely on it
+    op.execute("ALTER TABLE bookings DROP CONSTRAINT IF EXISTS no_overlap_bookings")
+    op.execute("DROP INDEX IF EXISTS ix_bookings_unit_dates")
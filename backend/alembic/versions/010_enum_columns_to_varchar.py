@@ -0,0 +1,141 @@
+"""Store audit, booking and inspection enums as VARCHAR + CHECK.
+
+Revision ID: 010_enum_columns_to_varchar
+Revises: 009_booking_overlap
+Create Date: 2026-10-16
+
+Native ENUM types need an ALTER TYPE ... ADD VALUE (outside a transaction,
+and never removable) for every new member; auditaction has already fallen
+behind the app's AuditAction. As VARCHAR(32) with a CHECK constraint, adding
+a value is a constraint swap, and the columns behave like any text column in
+expression and partial indexes.
+
+Columns are cast with USING col::text, so stored labels are kept as-is.
+Constraints and partial indexes whose expressions compare against enum
+literals are dropped before the type change and re-created after it.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '010_enum_columns_to_varchar'
+down_revision = '009_booking_overlap'
+branch_labels = None
+depends_on = None
+
+# type name -> labels (the app enums' values)
+ENUM_VALUES = {
+    'auditaction': [
+        'invite_sent', 'invite_accepted', 'inspection_submitted', 'inspection_signed',
+        'inspection_attested', 'vendor_assigned', 'maintenance_triaged', 'lease_created',
+        'lease_activated', 'evidence_confirmed', 'booking_created', 'claim_packet_generated',
+    ],
+    'bookingstatus': ['upcoming', 'checked_in', 'checked_out', 'cancelled', 'disputed'],
+    'inspectiontype': ['move_in', 'move_out', 'periodic', 'pre_stay', 'post_stay'],
+    'inspectionstatus': ['draft', 'submitted', 'reviewed', 'signed', 'archived'],
+    'inspectionscope': ['lease', 'booking'],
+    'inspectionsignedby': ['TENANT', 'LANDLORD_ORG_MEMBER', 'HOST_SYSTEM'],
+    'inspectioncondition': ['good', 'fair', 'damaged', 'not_present'],
+    'evidencesource': ['tenant', 'landlord', 'vendor', 'system'],
+    'storageinstancekind': ['gcs_generation', 's3_etag'],
+}
+
+# table -> (column, enum type, server default, CHECK constraint name)
+COLUMNS = {
+    'audit_log_core': [
+        ('action', 'auditaction', None, 'ck_audit_log_action'),
+    ],
+    'bookings': [
+        ('status', 'bookingstatus', 'upcoming', 'ck_bookings_status'),
+    ],
+    'inspections': [
+        ('inspection_type', 'inspectiontype', None, 'ck_inspections_inspection_type'),
+        ('status', 'inspectionstatus', None, 'ck_inspections_status'),
+        ('scope', 'inspectionscope', 'lease', 'ck_inspections_scope'),
+        ('signed_by', 'inspectionsignedby', None, 'ck_inspections_signed_by'),
+    ],
+    'inspection_items': [
+        ('condition', 'inspectioncondition', 'good', 'ck_inspection_items_condition'),
+    ],
+    'inspection_evidence': [
+        ('evidence_source', 'evidencesource', 'tenant', 'ck_inspection_evidence_source'),
+        ('storage_instance_kind', 'storageinstancekind', 'gcs_generation',
+         'ck_inspection_evidence_storage_kind'),
+    ],
+}
+
+# Constraints over these columns that compare against enum literals
+DEPENDENT_CONSTRAINTS = [
+    ('inspections', 'ck_inspection_booking_scope',
+     "CHECK ((scope = 'booking' AND booking_id IS NOT NULL) OR (scope = 'lease'))"),
+    ('inspections', 'ck_inspection_scope_type',
+     "CHECK ((scope = 'booking' AND inspection_type IN ('pre_stay', 'post_stay')) OR "
+     "(scope = 'lease' AND inspection_type IN ('move_in', 'move_out', 'periodic')))"),
+    ('bookings', 'no_overlap_bookings',
+     "EXCLUDE USING gist (unit_id WITH =, daterange(check_in_date, check_out_date, '[)') WITH &&) "
+     "WHERE (status IN ('upcoming', 'checked_in'))"),
+]
+
+# Partial indexes whose predicates compare against enum literals
+DEPENDENT_INDEXES = [
+    ('ix_inspections_lease_type_signed',
+     "CREATE INDEX ix_inspections_lease_type_signed ON inspections (lease_id, inspection_type) "
+     "WHERE status = 'signed'"),
+]
+
+
+def _labels(enum_type: str) -> str:
+    return ', '.join(f"'{value}'" for value in ENUM_VALUES[enum_type])
+
+
+def _drop_dependents() -> list[str]:
+    return [
+        f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}'
+        for table, name, _ in DEPENDENT_CONSTRAINTS
+    ] + [f'DROP INDEX IF EXISTS {name}' for name, _ in DEPENDENT_INDEXES]
+
+
+def _add_dependents() -> list[str]:
+    return [
+        f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}'
+        for table, name, definition in DEPENDENT_CONSTRAINTS
+    ] + [definition for _, definition in DEPENDENT_INDEXES]
+
+
+def upgrade() -> None:
+    statements = _drop_dependents()
+    # One ALTER TABLE per table, so each is rewritten (and locked) only once
+    for table, columns in COLUMNS.items():
+        actions = []
+        for column, enum_type, default, check in columns:
+            actions += [
+                f'ALTER COLUMN {column} DROP DEFAULT',
+                f'ALTER COLUMN {column} TYPE VARCHAR(32) USING {column}::text',
+            ]
+            if default is not None:
+                actions.append(f"ALTER COLUMN {column} SET DEFAULT '{default}'")
+            actions.append(f'ADD CONSTRAINT {check} CHECK ({column} IN ({_labels(enum_type)}))')
+        statements.append(f'ALTER TABLE {table} ' + ', '.join(actions))
+    statements += _add_dependents()
+    statements.append(f'DROP TYPE IF EXISTS {", ".join(ENUM_VALUES)}')
+    execute_batch(statements)
+
+
+def downgrade() -> None:
+    statements = [
+        f'CREATE TYPE {enum_type} AS ENUM ({_labels(enum_type)})'
+        for enum_type in ENUM_VALUES
+    ]
+    statements += _drop_dependents()
+    for table, columns in COLUMNS.items():
+        actions = []
+        for column, enum_type, default, check in columns:
+            actions += [
+                f'DROP CONSTRAINT IF EXISTS {check}',
+                f'ALTER COLUMN {column} DROP DEFAULT',
+                f'ALTER COLUMN {column} TYPE {enum_type} USING {column}::{enum_type}',
+            ]
+            if default is not None:
+                actions.append(f"ALTER COLUMN {column} SET DEFAULT '{default}'")
+        statements.append(f'ALTER TABLE {table} ' + ', '.join(actions))
+    statements += _add_dependents()
+    execute_batch(statements)
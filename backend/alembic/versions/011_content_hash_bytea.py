@@ -0,0 +1,32 @@
+"""Store inspections.content_hash as BYTEA.
+
+Revision ID: 011_content_hash_bytea
+Revises: 010_enum_columns_to_varchar
+Create Date: 2026-10-16
+
+The last SHA-256 column still kept as 64-char hex; the evidence and
+certificate digests moved to BYTEA in 003. The model maps it with HexDigest,
+so callers keep reading and writing hex strings.
+"""
+
+from alembic import op
+
+
+revision = '011_content_hash_bytea'
+down_revision = '010_enum_columns_to_varchar'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE inspections "
+        "ALTER COLUMN content_hash TYPE BYTEA USING decode(content_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE inspections "
+        "ALTER COLUMN content_hash TYPE VARCHAR(64) USING encode(content_hash, 'hex')"
+    )
@@ -0,0 +1,42 @@
+"""Generate audit, log, booking and inspection primary keys in Postgres.
+
+Revision ID: 012_server_uuid_defaults
+Revises: 011_content_hash_bytea
+Create Date: 2026-10-16
+
+Gives these ids a gen_random_uuid() default (built in since Postgres 13).
+The models send a time-ordered app.core.ids.uuid7() for every row, so the
+server default is only a fallback for raw SQL inserts (backfills, manual
+fixes). Setting a column default is a catalog-only change.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '012_server_uuid_defaults'
+down_revision = '011_content_hash_bytea'
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    'audit_log_core',
+    'activity_log',
+    'mason_logs',
+    'bookings',
+    'inspections',
+    'inspection_items',
+    'inspection_evidence',
+]
+
+
+def upgrade() -> None:
+    execute_batch([
+        f'ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()'
+        for table in TABLES
+    ])
+
+
+def downgrade() -> None:
+    execute_batch([
+        f'ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT'
+        for table in TABLES
+    ])
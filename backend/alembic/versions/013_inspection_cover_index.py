@@ -0,0 +1,50 @@
+"""Covering index for lease inspection lookups; tighter autovacuum on inspections.
+
+Revision ID: 013_inspection_cover_index
+Revises: 012_server_uuid_defaults
+Create Date: 2026-10-16
+
+ix_inspections_lease_date_cover (lease_id, inspection_date DESC) INCLUDE
+(status, inspection_type) answers "inspections for this lease, newest first"
+and the latest-of-type lookups behind diffs without touching the heap. It
+replaces ix_inspections_lease_id, its left prefix.
+
+Index-only scans skip the heap only for pages marked all-visible, so
+inspections is vacuumed after 5% of rows change or are inserted rather than
+the default 20%.
+"""
+
+from alembic import op
+
+
+revision = '013_inspection_cover_index'
+down_revision = '012_server_uuid_defaults'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inspections_lease_date_cover "
+            "ON inspections (lease_id, inspection_date DESC) INCLUDE (status, inspection_type)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_inspections_lease_id")
+
+    op.execute(
+        "ALTER TABLE inspections SET ("
+        "autovacuum_vacuum_scale_factor = 0.05, "
+        "autovacuum_vacuum_insert_scale_factor = 0.05)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE inspections RESET ("
+        "autovacuum_vacuum_scale_factor, autovacuum_vacuum_insert_scale_factor)"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inspections_lease_id ON inspections (lease_id)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_inspections_lease_date_cover")
@@ -0,0 +1,75 @@
+"""Skip NULLs in the indexes led by nullable org/user foreign keys.
+
+Revision ID: 014_partial_fk_indexes
+Revises: 013_inspection_cover_index
+Create Date: 2026-10-16
+
+org_id and user_id on the log tables are NULL for tenant/system events and
+after ON DELETE SET NULL, and every such row still took an index entry no
+query ever reads: lookups are always "org_id = X" / "user_id = X", which the
+planner proves implies IS NOT NULL, so the partial indexes serve them as
+before.
+
+Each index keeps its name. activity_log is rebuilt CONCURRENTLY under a
+temporary name and swapped in; audit_log_core and mason_logs are partitioned,
+where CREATE INDEX CONCURRENTLY isn't supported, so they are rebuilt in one
+batch as in 007.
+"""
+
+from alembic import op
+
+from app.core.migrations import execute_batch
+
+revision = '014_partial_fk_indexes'
+down_revision = '013_inspection_cover_index'
+branch_labels = None
+depends_on = None
+
+# (index, table, key columns and INCLUDE clause, leading nullable column)
+PARTITIONED_INDEXES = [
+    ('ix_audit_log_org_created', 'audit_log_core', '(org_id, created_at DESC)', 'org_id'),
+    ('ix_audit_log_org_action_created', 'audit_log_core', '(org_id, action, created_at DESC)', 'org_id'),
+    ('ix_audit_log_org_resource', 'audit_log_core', '(org_id, resource_type, resource_id)', 'org_id'),
+    ('ix_audit_log_user_id', 'audit_log_core', '(user_id)', 'user_id'),
+    ('ix_mason_logs_org_created', 'mason_logs', '(org_id, created_at DESC)', 'org_id'),
+]
+PLAIN_INDEXES = [
+    ('ix_activity_log_org_created', 'activity_log',
+     '(org_id, created_at DESC) INCLUDE (activity_type, resource_type, resource_id)', 'org_id'),
+    ('ix_activity_log_user_created', 'activity_log',
+     '(user_id, created_at DESC) INCLUDE (activity_type)', 'user_id'),
+]
+
+
+def _create(name: str, table: str, columns: str, column: str, partial: bool,
+            concurrently: bool = False) -> str:
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}{name} ON {table} {columns}"
+        + (f' WHERE {column} IS NOT NULL' if partial else '')
+    )
+
+
+def _rebuild(partial: bool) -> None:
+    execute_batch([
+        statement
+        for name, table, columns, column in PARTITIONED_INDEXES
+        for statement in (
+            f'DROP INDEX IF EXISTS {name}',
+            _create(name, table, columns, column, partial),
+        )
+    ])
+
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        for name, table, columns, column in PLAIN_INDEXES:
+            op.execute(_create(f'{name}_new', table, columns, column, partial, concurrently=True))
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+            op.execute(f'ALTER INDEX {name}_new RENAME TO {name}')
+
+
+def upgrade() -> None:
+    _rebuild(partial=True)
+
+
+def downgrade() -> None:
+    _rebuild(partial=False)
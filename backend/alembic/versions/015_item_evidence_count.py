@@ -0,0 +1,58 @@
+"""Denormalized evidence_count on inspection_items.
+
+Revision ID: 015_item_evidence_count
+Revises: 014_partial_fk_indexes
+Create Date: 2026-10-16
+
+Item lists show an evidence count per item; reading a column replaces
+loading (or counting) every evidence row. An AFTER INSERT/DELETE trigger on
+inspection_evidence keeps it current, and existing rows are backfilled.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '015_item_evidence_count'
+down_revision = '014_partial_fk_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    execute_batch([
+        # Constant default: metadata-only on PG11+
+        "ALTER TABLE inspection_items ADD COLUMN evidence_count INTEGER NOT NULL DEFAULT 0",
+        """
+        UPDATE inspection_items i SET evidence_count = e.n
+        FROM (
+            SELECT inspection_item_id, count(*) AS n
+            FROM inspection_evidence
+            GROUP BY inspection_item_id
+        ) e
+        WHERE e.inspection_item_id = i.id
+        """,
+        """
+        CREATE OR REPLACE FUNCTION maintain_item_evidence_count() RETURNS trigger
+        LANGUAGE plpgsql AS $fn$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE inspection_items SET evidence_count = evidence_count + 1
+                WHERE id = NEW.inspection_item_id;
+            ELSE
+                UPDATE inspection_items SET evidence_count = evidence_count - 1
+                WHERE id = OLD.inspection_item_id;
+            END IF;
+            RETURN NULL;
+        END
+        $fn$
+        """,
+        "CREATE TRIGGER trg_inspection_evidence_count AFTER INSERT OR DELETE ON inspection_evidence "
+        "FOR EACH ROW EXECUTE FUNCTION maintain_item_evidence_count()",
+    ])
+
+
+def downgrade() -> None:
+    execute_batch([
+        "DROP TRIGGER IF EXISTS trg_inspection_evidence_count ON inspection_evidence",
+        "DROP FUNCTION IF EXISTS maintain_item_evidence_count()",
+        "ALTER TABLE inspection_items DROP COLUMN IF EXISTS evidence_count",
+    ])
@@ -0,0 +1,37 @@
+"""Partial index on bookings.external_id.
+
+Revision ID: 016_bookings_external_id_partial
+Revises: 015_item_evidence_count
+Create Date: 2026-10-16
+
+Manually entered bookings have no external_id, so the index only needs the
+channel-imported rows. Rebuilt CONCURRENTLY under a temporary name and
+swapped in, as in 014.
+"""
+
+from alembic import op
+
+
+revision = '016_bookings_external_id_partial'
+down_revision = '015_item_evidence_count'
+branch_labels = None
+depends_on = None
+
+
+def _rebuild(where: str) -> None:
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_bookings_external_id_new "
+            f"ON bookings (external_id){where}"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bookings_external_id")
+        op.execute("ALTER INDEX ix_bookings_external_id_new RENAME TO ix_bookings_external_id")
+
+
+def upgrade() -> None:
+    _rebuild(" WHERE external_id IS NOT NULL")
+
+
+def downgrade() -> None:
+    _rebuild("")
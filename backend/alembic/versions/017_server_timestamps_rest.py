@@ -0,0 +1,78 @@
+"""Server-side timestamps for the remaining tables.
+
+Revision ID: 017_server_timestamps_rest
+Revises: 016_bookings_external_id_partial
+Create Date: 2026-10-16
+
+Extends 008 to every other table that still had its created_at/updated_at
+(and similar insert-time stamps) filled in by the ORM: the columns default
+to the database clock and updated_at is stamped by the set_updated_at()
+trigger from 008.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '017_server_timestamps_rest'
+down_revision = '016_bookings_external_id_partial'
+branch_labels = None
+depends_on = None
+
+UTC_NOW = "timezone('utc', now())"
+
+# (table, column, default before this revision)
+INSERT_STAMPS = [
+    ('activity_log', 'created_at', 'NOW()'),
+    ('jobs_outbox', 'created_at', 'NOW()'),
+    ('jobs_outbox', 'run_after', 'NOW()'),
+    ('org_memberships', 'created_at', None),
+    ('tenant_access', 'invited_at', 'NOW()'),
+    ('turnover_photos', 'uploaded_at', 'NOW()'),
+    ('turnover_inventory', 'checked_at', 'NOW()'),
+]
+# (table, created_at/updated_at default before this revision)
+CREATED_AND_UPDATED = [
+    ('users', None),
+    ('organizations', None),
+    ('properties', None),
+    ('units', None),
+    ('leases', None),
+    ('vendors', None),
+    ('maintenance_tickets', None),
+    ('turnovers', 'NOW()'),
+]
+
+
+def _default(value: str | None) -> str:
+    return f'SET DEFAULT {value}' if value else 'DROP DEFAULT'
+
+
+def upgrade() -> None:
+    ddl = [
+        f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {UTC_NOW}"
+        for table, column, _ in INSERT_STAMPS
+    ]
+    for table, _ in CREATED_AND_UPDATED:
+        ddl += [
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN created_at SET DEFAULT {UTC_NOW}, "
+            f"ALTER COLUMN updated_at SET DEFAULT {UTC_NOW}",
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()",
+        ]
+    execute_batch(ddl)
+
+
+def downgrade() -> None:
+    ddl = []
+    for table, previous in CREATED_AND_UPDATED:
+        ddl += [
+            f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}",
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN created_at {_default(previous)}, "
+            f"ALTER COLUMN updated_at {_default(previous)}",
+        ]
+    ddl += [
+        f"ALTER TABLE {table} ALTER COLUMN {column} {_default(previous)}"
+        for table, column, previous in INSERT_STAMPS
+    ]
+    execute_batch(ddl)
@@ -0,0 +1,57 @@
+"""Cover an inspection's items in display order with uq_inspection_item_order.
+
+Revision ID: 018_inspection_items_cover_index
+Revises: 017_server_timestamps_rest
+Create Date: 2026-10-16
+
+uq_inspection_item_order (inspection_id, room_key, ordinal, item_key) already
+returns an inspection's items in the Inspection.items order. Rebuilt with
+INCLUDE (condition, mason_estimated_repair_cents) it also carries the columns
+the views and diffs compare, so they are read without touching the heap. It
+replaces ix_inspection_items_inspection_id, its left prefix.
+
+The new unique index is built CONCURRENTLY and then swapped in as the
+constraint (ADD CONSTRAINT ... USING INDEX renames it), so the table is only
+locked for the swap.
+"""
+
+from alembic import op
+
+from app.core.migrations import execute_batch
+
+revision = '018_inspection_items_cover_index'
+down_revision = '017_server_timestamps_rest'
+branch_labels = None
+depends_on = None
+
+KEY = '(inspection_id, room_key, ordinal, item_key)'
+INCLUDE = ' INCLUDE (condition, mason_estimated_repair_cents)'
+
+
+def _rebuild_constraint(covering: bool) -> None:
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_inspection_item_order_new '
+            f'ON inspection_items {KEY}' + (INCLUDE if covering else '')
+        )
+    execute_batch([
+        'ALTER TABLE inspection_items '
+        'DROP CONSTRAINT uq_inspection_item_order, '
+        'ADD CONSTRAINT uq_inspection_item_order UNIQUE USING INDEX uq_inspection_item_order_new',
+    ])
+
+
+def upgrade() -> None:
+    _rebuild_constraint(covering=True)
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_inspection_items_inspection_id')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inspection_items_inspection_id '
+            'ON inspection_items (inspection_id)'
+        )
+    _rebuild_constraint(covering=False)
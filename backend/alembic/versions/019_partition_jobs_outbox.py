@@ -0,0 +1,152 @@
+"""Partition jobs_outbox by month on created_at.
+
+Revision ID: 019_partition_jobs_outbox
+Revises: 018_inspection_items_cover_index
+Create Date: 2026-10-16
+
+Outbox rows are inserted, walked through a few status updates and then never
+read again, so the table and its indexes bloat faster than autovacuum keeps
+up. Partitioned by RANGE (created_at), finished months are detached and
+dropped instead of deleted, which hands their pages (and their share of every
+index) straight back to the OS. The partial pending index is created on the
+parent and so exists, small, on every partition.
+
+A unique index on a partitioned table must include the partition key, which
+would let the same unique_scope be enqueued again in a later month. Scopes
+are therefore claimed in jobs_outbox_scopes, an insert-only table keyed on
+unique_scope, and jobs_outbox keeps the column without a constraint. The PK
+becomes (id, created_at).
+
+Partitions are created by create_monthly_partitions() from 006. Old months
+are removed by prune_jobs_outbox_partitions(keep_months), which skips any
+partition still holding pending or processing jobs. The app runs both on
+start-up and every few hours (app.services.partitions); when pg_cron is
+installed they are also scheduled there daily.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '019_partition_jobs_outbox'
+down_revision = '018_inspection_items_cover_index'
+branch_labels = None
+depends_on = None
+
+# Months of partitions kept ready ahead of the current one
+MONTHS_AHEAD = 2
+# Whole months of finished jobs kept before their partition is dropped
+KEEP_MONTHS = 3
+
+INDEXES = [
+    'CREATE INDEX ix_jobs_outbox_type ON jobs_outbox (type)',
+    "CREATE INDEX ix_jobs_outbox_pending ON jobs_outbox (status, run_after) "
+    "INCLUDE (type) WHERE status IN ('pending', 'processing')",
+]
+NOTIFY_TRIGGER = (
+    'CREATE TRIGGER trg_notify_jobs_outbox AFTER INSERT ON jobs_outbox '
+    'FOR EACH ROW EXECUTE FUNCTION notify_jobs_outbox()'
+)
+
+CRON_JOB = 'jobs-outbox-partitions'
+CRON_COMMAND = (
+    f"SELECT create_monthly_partitions('jobs_outbox', now()::date, {MONTHS_AHEAD}); "
+    f"SELECT prune_jobs_outbox_partitions({KEEP_MONTHS})"
+)
+
+
+def _swap_table(partitioned: bool) -> list[str]:
+    """Statements rebuilding jobs_outbox as a partitioned (or plain) table.
+
+    As in 006: the old table is renamed aside, a copy with the same columns
+    is created and filled, and the old one is dropped (taking its indexes,
+    constraints and trigger with it) before they are re-created.
+    """
+    statements = [
+        'ALTER TABLE jobs_outbox RENAME TO jobs_outbox_swap',
+        'CREATE TABLE jobs_outbox (LIKE jobs_outbox_swap INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        + (' PARTITION BY RANGE (created_at)' if partitioned else ''),
+    ]
+    if partitioned:
+        statements += [
+            'CREATE TABLE jobs_outbox_default PARTITION OF jobs_outbox DEFAULT',
+            f"""
+            PERFORM create_monthly_partitions(
+                'jobs_outbox',
+                COALESCE((SELECT min(created_at) FROM jobs_outbox_swap)::date, now()::date),
+                {MONTHS_AHEAD}
+            )
+            """,
+        ]
+    statements += [
+        'INSERT INTO jobs_outbox SELECT * FROM jobs_outbox_swap',
+        'DROP TABLE jobs_outbox_swap',
+        'ALTER TABLE jobs_outbox ADD CONSTRAINT jobs_outbox_pkey PRIMARY KEY '
+        + ('(id, created_at)' if partitioned else '(id)'),
+    ]
+    if not partitioned:
+        statements.append(
+            'ALTER TABLE jobs_outbox ADD CONSTRAINT jobs_outbox_unique_scope_key UNIQUE (unique_scope)'
+        )
+    return statements + INDEXES + [NOTIFY_TRIGGER]
+
+
+def upgrade() -> None:
+    execute_batch([
+        """
+        CREATE TABLE jobs_outbox_scopes (
+            unique_scope VARCHAR(500) PRIMARY KEY,
+            job_id UUID NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now())
+        )
+        """,
+        """
+        INSERT INTO jobs_outbox_scopes (unique_scope, job_id, created_at)
+        SELECT unique_scope, id, created_at FROM jobs_outbox
+        """,
+        *_swap_table(partitioned=True),
+        """
+        CREATE OR REPLACE FUNCTION prune_jobs_outbox_partitions(keep_months INT DEFAULT 3)
+        RETURNS VOID LANGUAGE plpgsql AS $fn$
+        DECLARE
+            cutoff DATE := date_trunc('month', now() - make_interval(months => keep_months))::date;
+            part TEXT;
+            busy BOOLEAN;
+        BEGIN
+            FOR part IN
+                SELECT c.relname
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'jobs_outbox'::regclass
+                  AND c.relname ~ '^jobs_outbox_[0-9]{4}_[0-9]{2}$'
+                  AND to_date(substr(c.relname, 13), 'YYYY_MM') < cutoff
+            LOOP
+                -- Never drop jobs that are still waiting to run or retry
+                EXECUTE format(
+                    'SELECT EXISTS (SELECT 1 FROM %I WHERE status IN (''pending'', ''processing''))',
+                    part
+                ) INTO busy;
+                IF NOT busy THEN
+                    EXECUTE format('ALTER TABLE jobs_outbox DETACH PARTITION %I', part);
+                    EXECUTE format('DROP TABLE %I', part);
+                END IF;
+            END LOOP;
+        END
+        $fn$
+        """,
+        f"""
+        IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+            PERFORM cron.schedule('{CRON_JOB}', '30 3 * * *', $cmd${CRON_COMMAND}$cmd$);
+        END IF
+        """,
+    ])
+
+
+def downgrade() -> None:
+    execute_batch([
+        f"""
+        IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+            PERFORM cron.unschedule(jobid) FROM cron.job WHERE jobname = '{CRON_JOB}';
+        END IF
+        """,
+        'DROP FUNCTION IF EXISTS prune_jobs_outbox_partitions(INT)',
+        *_swap_table(partitioned=False),
+        'DROP TABLE jobs_outbox_scopes',
+    ])
@@ -0,0 +1,44 @@
+"""Key claimed job scopes on a 16-byte hash instead of the scope text.
+
+Revision ID: 020_jobs_scope_hash
+Revises: 019_partition_jobs_outbox
+Create Date: 2026-10-16
+
+Scopes such as "verify_hash:evidence:<uuid>" run to 50+ bytes, and every
+enqueue probes and extends a B-tree over them. jobs_outbox_scopes is now keyed
+on the first 16 bytes of the scope's SHA-256 (app.models.types.key_hash);
+the text stays as an unindexed column for debugging.
+
+SHA-256 rather than BLAKE2 so existing rows can be backfilled with the
+built-in sha256() (Postgres 11+).
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '020_jobs_scope_hash'
+down_revision = '019_partition_jobs_outbox'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    execute_batch([
+        'ALTER TABLE jobs_outbox_scopes ADD COLUMN scope_hash BYTEA',
+        """
+        UPDATE jobs_outbox_scopes
+        SET scope_hash = substring(sha256(convert_to(unique_scope, 'UTF8')) FROM 1 FOR 16)
+        """,
+        'ALTER TABLE jobs_outbox_scopes '
+        'DROP CONSTRAINT jobs_outbox_scopes_pkey, '
+        'ALTER COLUMN scope_hash SET NOT NULL, '
+        'ADD CONSTRAINT jobs_outbox_scopes_pkey PRIMARY KEY (scope_hash)',
+    ])
+
+
+def downgrade() -> None:
+    execute_batch([
+        'ALTER TABLE jobs_outbox_scopes '
+        'DROP CONSTRAINT jobs_outbox_scopes_pkey, '
+        'ADD CONSTRAINT jobs_outbox_scopes_pkey PRIMARY KEY (unique_scope), '
+        'DROP COLUMN scope_hash',
+    ])
@@ -0,0 +1,203 @@
+"""Denormalized org_id on leases, maintenance tickets, inspections, items and evidence.
+
+Revision ID: 021_denormalize_org_id
+Revises: 020_jobs_scope_hash
+Create Date: 2026-10-16
+
+Tenancy checks had to walk inspection -> lease -> unit -> property to reach
+org_id. Each table now carries its owner's org_id, copied from the parent row
+by a BEFORE INSERT (or re-parenting UPDATE) trigger, so the app never sets it
+and an org filter is a single indexed predicate.
+
+Authorization trusts the column, so it is kept in step with the hierarchy:
+
+* Re-parenting (a property changing org, a unit changing property, or any
+  child moving to another parent) propagates the new org_id down to every
+  descendant through AFTER UPDATE triggers on the parents.
+* inspection_items and inspection_evidence have DEFERRABLE parent FKs, so a
+  bulk load may insert a child before its parent exists. The BEFORE trigger
+  then keeps an org_id the caller supplied instead of overwriting it with
+  NULL, and a deferred constraint trigger checks it against the parent at
+  commit.
+
+Parents are filled before children, so each backfill is one UPDATE ... FROM
+its (already backfilled) parent. Leases, maintenance tickets and inspections
+get an org_id index; items and evidence are always reached through their
+parent's id, so theirs would only cost writes.
+"""
+
+from alembic import op
+
+from app.core.migrations import execute_batch
+
+revision = '021_denormalize_org_id'
+down_revision = '020_jobs_scope_hash'
+branch_labels = None
+depends_on = None
+
+# (table, parent FK column, org_id of the parent row with key {key}, UPDATE ...
+# FROM backfill), parents first
+TABLES = [
+    (
+        'leases', 'unit_id',
+        'SELECT p.org_id FROM units u JOIN properties p ON p.id = u.property_id '
+        'WHERE u.id = {key}',
+        'UPDATE leases l SET org_id = p.org_id FROM units u JOIN properties p '
+        'ON p.id = u.property_id WHERE u.id = l.unit_id',
+    ),
+    (
+        'maintenance_tickets', 'unit_id',
+        'SELECT p.org_id FROM units u JOIN properties p ON p.id = u.property_id '
+        'WHERE u.id = {key}',
+        'UPDATE maintenance_tickets t SET org_id = p.org_id FROM units u JOIN properties p '
+        'ON p.id = u.property_id WHERE u.id = t.unit_id',
+    ),
+    (
+        'inspections', 'lease_id',
+        'SELECT org_id FROM leases WHERE id = {key}',
+        'UPDATE inspections i SET org_id = l.org_id FROM leases l WHERE l.id = i.lease_id',
+    ),
+    (
+        'inspection_items', 'inspection_id',
+        'SELECT org_id FROM inspections WHERE id = {key}',
+        'UPDATE inspection_items it SET org_id = i.org_id FROM inspections i '
+        'WHERE i.id = it.inspection_id',
+    ),
+    (
+        'inspection_evidence', 'inspection_item_id',
+        'SELECT org_id FROM inspection_items WHERE id = {key}',
+        'UPDATE inspection_evidence e SET org_id = it.org_id FROM inspection_items it '
+        'WHERE it.id = e.inspection_item_id',
+    ),
+]
+INDEXED_TABLES = ['leases', 'maintenance_tickets', 'inspections']
+# Tables whose parent FK is DEFERRABLE (see 001/003), checked at commit
+DEFERRED_TABLES = ['inspection_items', 'inspection_evidence']
+
+# (parent table, column whose change moves the subtree, UPDATE propagating
+# NEW's org to the direct children)
+PROPAGATIONS = [
+    (
+        'properties', 'org_id',
+        'UPDATE leases l SET org_id = NEW.org_id FROM units u '
+        'WHERE u.property_id = NEW.id AND l.unit_id = u.id AND l.org_id <> NEW.org_id; '
+        'UPDATE maintenance_tickets t SET org_id = NEW.org_id FROM units u '
+        'WHERE u.property_id = NEW.id AND t.unit_id = u.id AND t.org_id <> NEW.org_id',
+    ),
+    (
+        'units', 'property_id',
+        'UPDATE leases SET org_id = p.org_id FROM properties p '
+        'WHERE p.id = NEW.property_id AND unit_id = NEW.id AND leases.org_id <> p.org_id; '
+        'UPDATE maintenance_tickets SET org_id = p.org_id FROM properties p '
+        'WHERE p.id = NEW.property_id AND unit_id = NEW.id AND maintenance_tickets.org_id <> p.org_id',
+    ),
+    (
+        'leases', 'org_id',
+        'UPDATE inspections SET org_id = NEW.org_id '
+        'WHERE lease_id = NEW.id AND org_id <> NEW.org_id',
+    ),
+    (
+        'inspections', 'org_id',
+        'UPDATE inspection_items SET org_id = NEW.org_id '
+        'WHERE inspection_id = NEW.id AND org_id <> NEW.org_id',
+    ),
+    (
+        'inspection_items', 'org_id',
+        'UPDATE inspection_evidence SET org_id = NEW.org_id '
+        'WHERE inspection_item_id = NEW.id AND org_id <> NEW.org_id',
+    ),
+]
+
+
+def upgrade() -> None:
+    statements = []
+    for table, parent_column, lookup, backfill in TABLES:
+        statements += [
+            f'ALTER TABLE {table} ADD COLUMN org_id UUID',
+            backfill,
+            f'ALTER TABLE {table} ALTER COLUMN org_id SET NOT NULL, '
+            f'ADD CONSTRAINT {table}_org_id_fkey FOREIGN KEY (org_id) '
+            f'REFERENCES organizations(id) ON DELETE CASCADE',
+            # The parent's org wins; a caller-supplied value is only kept
+            # while the parent doesn't exist yet (deferred FKs)
+            f"""
+            CREATE OR REPLACE FUNCTION set_{table}_org_id() RETURNS trigger
+            LANGUAGE plpgsql AS $fn$
+            BEGIN
+                NEW.org_id := COALESCE(({lookup.format(key=f'NEW.{parent_column}')}), NEW.org_id);
+                RETURN NEW;
+            END
+            $fn$
+            """,
+            f'CREATE TRIGGER trg_{table}_org_id BEFORE INSERT OR UPDATE OF {parent_column} '
+            f'ON {table} FOR EACH ROW EXECUTE FUNCTION set_{table}_org_id()',
+        ]
+        if table in DEFERRED_TABLES:
+            # Re-reads the row, since propagation may have updated it after
+            # the event that queued this check
+            statements += [
+                f"""
+                CREATE OR REPLACE FUNCTION check_{table}_org_id() RETURNS trigger
+                LANGUAGE plpgsql AS $fn$
+                DECLARE
+                    cur {table}%ROWTYPE;
+                BEGIN
+                    SELECT * INTO cur FROM {table} WHERE id = NEW.id;
+                    IF FOUND AND cur.org_id IS DISTINCT FROM ({lookup.format(key=f'cur.{parent_column}')}) THEN
+                        RAISE EXCEPTION '{table} % org_id does not match its parent', cur.id
+                            USING ERRCODE = 'foreign_key_violation';
+                    END IF;
+                    RETURN NULL;
+                END
+                $fn$
+                """,
+                f'CREATE CONSTRAINT TRIGGER trg_{table}_org_id_check '
+                f'AFTER INSERT OR UPDATE OF org_id, {parent_column} ON {table} '
+                f'DEFERRABLE INITIALLY DEFERRED '
+                f'FOR EACH ROW EXECUTE FUNCTION check_{table}_org_id()',
+            ]
+    for parent, column, propagate in PROPAGATIONS:
+        # Plain AFTER UPDATE with WHEN: an UPDATE OF trigger would miss
+        # org_id changes made by the parent's own BEFORE trigger
+        statements += [
+            f"""
+            CREATE OR REPLACE FUNCTION propagate_{parent}_org_id() RETURNS trigger
+            LANGUAGE plpgsql AS $fn$
+            BEGIN
+                {propagate};
+                RETURN NULL;
+            END
+            $fn$
+            """,
+            f'CREATE TRIGGER trg_{parent}_org_id_propagate AFTER UPDATE ON {parent} '
+            f'FOR EACH ROW WHEN (OLD.{column} IS DISTINCT FROM NEW.{column}) '
+            f'EXECUTE FUNCTION propagate_{parent}_org_id()',
+        ]
+    execute_batch(statements)
+
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        for table in INDEXED_TABLES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_org_id ON {table} (org_id)')
+
+
+def downgrade() -> None:
+    statements = []
+    for parent, _, _ in PROPAGATIONS:
+        statements += [
+            f'DROP TRIGGER IF EXISTS trg_{parent}_org_id_propagate ON {parent}',
+            f'DROP FUNCTION IF EXISTS propagate_{parent}_org_id()',
+        ]
+    for table, _, _, _ in reversed(TABLES):
+        if table in DEFERRED_TABLES:
+            statements += [
+                f'DROP TRIGGER IF EXISTS trg_{table}_org_id_check ON {table}',
+                f'DROP FUNCTION IF EXISTS check_{table}_org_id()',
+            ]
+        statements += [
+            f'DROP TRIGGER IF EXISTS trg_{table}_org_id ON {table}',
+            f'DROP FUNCTION IF EXISTS set_{table}_org_id()',
+            # Drops its index and foreign key with it
+            f'ALTER TABLE {table} DROP COLUMN IF EXISTS org_id',
+        ]
+    execute_batch(statements)
@@ -0,0 +1,39 @@
+"""GIN (jsonb_path_ops) indexes on job payloads and Mason triage results.
+
+Revision ID: 022_jsonb_path_ops_indexes
+Revises: 021_denormalize_org_id
+Create Date: 2026-10-16
+
+Same operator class as the log indexes in 007: containment (@>) only, and
+several times smaller than the default jsonb_ops.
+
+jobs_outbox is partitioned (019), where CREATE INDEX CONCURRENTLY isn't
+supported, so its index is built on the parent directly; maintenance_tickets
+is built CONCURRENTLY.
+"""
+
+from alembic import op
+
+revision = '022_jsonb_path_ops_indexes'
+down_revision = '021_denormalize_org_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_outbox_payload_gin "
+        "ON jobs_outbox USING gin (payload jsonb_path_ops)"
+    )
+
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_maintenance_tickets_triage_gin "
+            "ON maintenance_tickets USING gin (mason_triage_result jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_maintenance_tickets_triage_gin')
+    op.execute('DROP INDEX IF EXISTS ix_jobs_outbox_payload_gin')
@@ -0,0 +1,59 @@
+"""Partial indexes for the lease and ticket states queries single out.
+
+Revision ID: 023_status_partial_indexes
+Revises: 022_jsonb_path_ops_indexes
+Create Date: 2026-10-16
+
+- leases: ix_leases_active (org_id, end_date) WHERE status = 'active' serves
+  the expiring-soon lists and the revenue totals
+- maintenance_tickets: ix_maintenance_tickets_open (unit_id, priority,
+  created_at DESC) over open/in-progress tickets replaces
+  ix_maintenance_tickets_unit_open, its left prefix, and returns them in list
+  order
+- the plain status indexes on leases, maintenance_tickets and inspections are
+  dropped: a handful of values over the whole table is too unselective for
+  the planner to pick, and every write still paid for them
+"""
+
+from alembic import op
+
+
+revision = '023_status_partial_indexes'
+down_revision = '022_jsonb_path_ops_indexes'
+branch_labels = None
+depends_on = None
+
+STATUS_INDEXES = [
+    ('ix_leases_status', 'leases'),
+    ('ix_maintenance_tickets_status', 'maintenance_tickets'),
+    ('ix_inspections_status', 'inspections'),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_leases_active "
+            "ON leases (org_id, end_date) WHERE status = 'active'"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_maintenance_tickets_open "
+            "ON maintenance_tickets (unit_id, priority, created_at DESC) "
+            "WHERE status IN ('open', 'in_progress')"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_maintenance_tickets_unit_open")
+        for name, _ in STATUS_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in STATUS_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} (status)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_maintenance_tickets_unit_open "
+            "ON maintenance_tickets (unit_id) WHERE status IN ('open', 'in_progress')"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_maintenance_tickets_open")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_leases_active")
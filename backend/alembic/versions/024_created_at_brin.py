@@ -0,0 +1,40 @@
+"""BRIN indexes on inspections and maintenance_tickets created_at.
+
+Revision ID: 024_created_at_brin
+Revises: 023_status_partial_indexes
+Create Date: 2026-10-16
+
+created_at is stamped by the database on insert (008, 017), so it rises with
+the physical row order and a BRIN index (min/max per 32 pages) is enough to
+skip everything outside a report's period. That costs kilobytes where a
+B-tree would cost one entry per row.
+"""
+
+from alembic import op
+
+
+revision = '024_created_at_brin'
+down_revision = '023_status_partial_indexes'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_inspections_created_brin', 'inspections'),
+    ('ix_maintenance_tickets_created_brin', 'maintenance_tickets'),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        for name, table in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING brin (created_at) WITH (pages_per_range = 32)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,44 @@
+"""Narrow small-range integer columns to SMALLINT.
+
+Revision ID: 025_smallint_columns
+Revises: 024_created_at_brin
+Create Date: 2026-10-16
+
+Priorities (1-5), basis points (<= 10000), ordinals, schema versions, build
+years and bedroom counts all fit in two bytes. Indexes over these columns
+(uq_inspection_item_order, ix_maintenance_tickets_open) are rebuilt by the
+type change and shrink with it. Each table is rewritten once.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '025_smallint_columns'
+down_revision = '024_created_at_brin'
+branch_labels = None
+depends_on = None
+
+COLUMNS = {
+    'inspections': ['schema_version'],
+    'inspection_items': ['ordinal'],
+    'leases': ['pro_rata_share_bps'],
+    'maintenance_tickets': ['priority'],
+    'properties': ['year_built'],
+    'units': ['bedrooms'],
+}
+
+
+def _retype(column_type: str) -> list[str]:
+    # One ALTER TABLE per table, so each is rewritten (and locked) only once
+    return [
+        f'ALTER TABLE {table} '
+        + ', '.join(f'ALTER COLUMN {column} TYPE {column_type}' for column in columns)
+        for table, columns in COLUMNS.items()
+    ]
+
+
+def upgrade() -> None:
+    execute_batch(_retype('SMALLINT'))
+
+
+def downgrade() -> None:
+    execute_batch(_retype('INTEGER'))
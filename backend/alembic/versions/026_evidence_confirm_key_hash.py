@@ -0,0 +1,47 @@
+"""Key evidence confirm idempotency on a 16-byte hash of the client key.
+
+Revision ID: 026_evidence_confirm_key_hash
+Revises: 025_smallint_columns
+Create Date: 2026-10-16
+
+uq_evidence_confirm indexed (inspection_item_id, confirm_idempotency_key),
+and clients send keys of up to 255 characters, so every confirm probed and
+extended a B-tree of wide text entries. As with jobs_outbox_scopes in 020 the
+constraint now covers the first 16 bytes of the key's SHA-256
+(app.models.types.key_hash); the text stays as an unindexed column.
+
+The unique index leads on inspection_item_id, so the separate single-column
+index on it only duplicated its prefix and is dropped.
+"""
+
+from app.core.migrations import execute_batch
+
+revision = '026_evidence_confirm_key_hash'
+down_revision = '025_smallint_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    execute_batch([
+        'ALTER TABLE inspection_evidence ADD COLUMN confirm_key_hash BYTEA',
+        """
+        UPDATE inspection_evidence
+        SET confirm_key_hash = substring(sha256(convert_to(confirm_idempotency_key, 'UTF8')) FROM 1 FOR 16)
+        """,
+        'ALTER TABLE inspection_evidence '
+        'DROP CONSTRAINT uq_evidence_confirm, '
+        'ALTER COLUMN confirm_key_hash SET NOT NULL, '
+        'ADD CONSTRAINT uq_evidence_confirm UNIQUE (inspection_item_id, confirm_key_hash)',
+        'DROP INDEX IF EXISTS ix_inspection_evidence_inspection_item_id',
+    ])
+
+
+def downgrade() -> None:
+    execute_batch([
+        'CREATE INDEX ix_inspection_evidence_inspection_item_id ON inspection_evidence (inspection_item_id)',
+        'ALTER TABLE inspection_evidence '
+        'DROP CONSTRAINT uq_evidence_confirm, '
+        'ADD CONSTRAINT uq_evidence_confirm UNIQUE (inspection_item_id, confirm_idempotency_key), '
+        'DROP COLUMN confirm_key_hash',
+    ])
@@ -0,0 +1,59 @@
+"""Make users.email unique on lower(email).
+
+Revision ID: 027_users_email_lower_index
+Revises: 026_evidence_confirm_key_hash
+Create Date: 2026-10-16
+
+Invite and magic-link lookups match a user by email regardless of case, and
+a lower(email) = lower(:email) predicate can't use the plain unique index on
+email, so each one was a sequential scan of users. The unique index is
+rebuilt on lower(email). It serves those lookups and also stops a second
+account from registering the same address in different case.
+
+Built CONCURRENTLY before the old index is dropped, so users stays writable
+throughout. A failed concurrent build leaves an INVALID index that IF NOT
+EXISTS would then skip, so the upgrade first refuses to run while two users'
+emails differ only by case, and drops any invalid leftover from an earlier
+attempt.
+"""
+
+from alembic import op
+
+from app.core.migrations import execute_batch
+
+revision = '027_users_email_lower_index'
+down_revision = '026_evidence_confirm_key_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    execute_batch([
+        """
+        IF EXISTS (SELECT 1 FROM users GROUP BY lower(email) HAVING count(*) > 1) THEN
+            RAISE EXCEPTION 'users.email holds addresses that differ only by case'
+                USING HINT = 'Merge or rename those users '
+                             '(SELECT lower(email) FROM users GROUP BY 1 HAVING count(*) > 1), '
+                             'then upgrade again.';
+        END IF
+        """,
+        """
+        IF EXISTS (
+            SELECT 1 FROM pg_index
+            WHERE indexrelid = to_regclass('ix_users_email_lower') AND NOT indisvalid
+        ) THEN
+            DROP INDEX ix_users_email_lower;
+        END IF
+        """,
+    ])
+
+    # CONCURRENTLY can't run inside a transaction (or a DO block)
+    with op.get_context().autocommit_block():
+        op.execute('CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower ON users (lower(email))')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_email')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email ON users (email)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower')
@@ -1,9 +1,10 @@
 """Application configuration using Pydantic Settings."""
 
 from enum import Enum
-from functools import lru_cache
+from functools import cache, cached_property
 from typing import Optional
 
+from pydantic import computed_field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,6 +21,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # App
@@ -27,8 +29,16 @@ class Settings(BaseSettings):
     debug: bool = False
     api_v1_prefix: str = "/v1"
 
+    # CORS (comma-separated)
+    allowed_origins: str = "http://localhost:3000,http://localhost:3001"
+
     # Database
     database_url: str
+    # DATABASE_URL points at PgBouncer in transaction mode: it does the pooling
+    database_pgbouncer: bool = False
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
 
     # Firebase Auth
     firebase_project_id: str
@@ -59,20 +69,31 @@ class Settings(BaseSettings):
     claimsiq_base_url: str = "http://localhost:3000"
     claimsiq_api_key: Optional[str] = None
 
-    @property
+    @model_validator(mode="after")
+    def _check_bucket(self) -> "Settings":
+        """Fail at start-up, rather than on the first upload, if the bucket is unset."""
+        if self.storage_provider == StorageProvider.GCS and not self.gcs_bucket_name:
+            raise ValueError("GCS_BUCKET_NAME required when STORAGE_PROVIDER=gcs")
+        if self.storage_provider == StorageProvider.S3 and not self.s3_bucket_name:
+            raise ValueError("S3_BUCKET_NAME required when STORAGE_PROVIDER=s3")
+        return self
+
+    @computed_field
+    @cached_property
     def bucket_name(self) -> str:
         """Get the appropriate bucket name based on storage provider."""
         if self.storage_provider == StorageProvider.GCS:
-            if not self.gcs_bucket_name:
-                raise ValueError("GCS_BUCKET_NAME required when STORAGE_PROVIDER=gcs")
             return self.gcs_bucket_name
-        else:
-            if not self.s3_bucket_name:
-                raise ValueError("S3_BUCKET_NAME required when STORAGE_PROVIDER=s3")
-            return self.s3_bucket_name
+        return self.s3_bucket_name
+
+    @computed_field
+    @cached_property
+    def origins(self) -> tuple[str, ...]:
+        """allowed_origins parsed once into an immutable tuple."""
+        return tuple(o.strip() for o in self.allowed_origins.split(",") if o.strip())
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Cached settings instance."""
     return Settings()
@@ -1,20 +1,54 @@
 """Async database configuration using SQLAlchemy 2.0."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+
+def _engine_options() -> dict[str, Any]:
+    """Pool and connection options for the configured deployment.
+
+    Behind PgBouncer the pooler owns the server connections, so SQLAlchemy
+    keeps none (NullPool) and asyncpg's prepared statement caches are off,
+    as transaction pooling can't keep them on one backend. Statements are
+    still prepared per execution, so each gets a unique name: the dialect's
+    default sequential names collide when two clients' statements land on
+    the same server connection. Otherwise a
+    QueuePool sized for concurrent requests is used. Stale connections are
+    recycled rather than pinged on every checkout, and JIT is disabled since
+    its compile time outweighs the gain on short OLTP queries.
+    """
+    if settings.database_pgbouncer:
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        }
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": False,
+        "pool_reset_on_return": "rollback",
+        "connect_args": {"server_settings": {"jit": "off"}},
+    }
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    **_engine_options(),
 )
 
 async_session_maker = async_sessionmaker(
@@ -28,7 +62,21 @@ async_session_maker = async_sessionmaker(
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+
+    # Fetch server-side defaults (timestamps, trigger-filled columns) via
+    # RETURNING on every mapper; async sessions can't lazy-load them later
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def raiseload_in_debug() -> tuple[LoaderOption, ...]:
+    """Loader options that make any unplanned lazy load raise, in debug only.
+
+    Spread into list queries after their explicit eager loads, e.g.
+    ``select(Booking).options(*raiseload_in_debug())``, so a relationship
+    touched per row (an N+1) fails loudly in development and CI instead of
+    quietly issuing one query per result. Production keeps default loading.
+    """
+    return (raiseload("*"),) if settings.debug else ()
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -0,0 +1,16 @@
+"""Helpers shared by Alembic revisions."""
+
+from typing import Iterable
+
+from alembic import op
+
+
+def execute_batch(statements: Iterable[str]) -> None:
+    """Execute several DDL statements in a single server round trip.
+
+    The statements are wrapped in one PL/pgSQL DO block. A plain
+    semicolon-joined string won't do: asyncpg prepares everything it sends,
+    and PostgreSQL refuses to prepare a string holding more than one command.
+    """
+    body = ";\n".join(stmt.strip().rstrip(";") for stmt in statements)
+    op.execute(f"DO $batch$ BEGIN\n{body};\nEND $batch$;")
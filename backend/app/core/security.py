@@ -1,12 +1,16 @@
 """Firebase JWT verification middleware and security utilities."""
 
+import asyncio
 import hashlib
 import json
 import os
-from typing import Any, Optional
+import time
+from enum import IntFlag
+from typing import Any, BinaryIO, Optional
 from uuid import UUID
 
 import firebase_admin
+from cachetools import TLRUCache, TTLCache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from firebase_admin import auth, credentials
@@ -18,6 +22,30 @@ from app.core.database import get_db
 
 settings = get_settings()
 
+# Inspections with at least this many items are hashed off the event loop
+CONTENT_HASH_OFFLOAD_MIN_ITEMS = 200
+
+# Read size when hashing file-like objects in compute_file_hash
+FILE_HASH_CHUNK_SIZE = 1 << 20
+
+# Verified ID tokens are reused until they expire, but for at most this long
+TOKEN_CACHE_MAX_TTL_SECONDS = 300
+# Kept short so org role changes reach the API quickly
+USER_CONTEXT_CACHE_TTL_SECONDS = 30
+
+
+def _token_ttu(_key: bytes, decoded_token: dict[str, Any], now: float) -> float:
+    remaining = decoded_token.get("exp", 0) - time.time()
+    return now + min(remaining, TOKEN_CACHE_MAX_TTL_SECONDS)
+
+
+# blake2b(token) -> decoded claims; raw tokens are never kept in memory
+_token_cache: TLRUCache = TLRUCache(maxsize=50_000, ttu=_token_ttu)
+# firebase_uid -> (db_user_id, org_id, org_role, role_mask)
+_user_context_cache: TTLCache = TTLCache(
+    maxsize=50_000, ttl=USER_CONTEXT_CACHE_TTL_SECONDS
+)
+
 
 def _ensure_firebase_initialized() -> None:
     if firebase_admin._apps:
@@ -48,6 +76,24 @@ def _ensure_firebase_initialized() -> None:
 security = HTTPBearer()
 
 
+class Role(IntFlag):
+    """Org roles as bit flags, so role guards are a single AND."""
+    OWNER = 1
+    ADMIN = 2
+    AGENT = 4
+    CLEANER = 8
+
+
+_ROLE_MASKS: dict[str, int] = {
+    "ORG_OWNER": int(Role.OWNER),
+    "ORG_ADMIN": int(Role.ADMIN),
+    "ORG_AGENT": int(Role.AGENT),
+    "ORG_CLEANER": int(Role.CLEANER),
+}
+ADMIN_MASK = int(Role.OWNER | Role.ADMIN)
+OWNER_MASK = int(Role.OWNER)
+
+
 class AuthenticatedUser:
     """Represents an authenticated user from Firebase JWT."""
 
@@ -65,6 +111,7 @@ class AuthenticatedUser:
         self.db_user_id: Optional[UUID] = None
         self.org_id: Optional[UUID] = None
         self.org_role: Optional[str] = None
+        self.role_mask: int = 0
 
 
 async def verify_firebase_token(
@@ -75,6 +122,16 @@ async def verify_firebase_token(
     This middleware NEVER mints JWTs - it only verifies tokens issued by Firebase.
     """
     token = credentials.credentials
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    decoded_token = _token_cache.get(cache_key)
+    if decoded_token is not None:
+        return AuthenticatedUser(
+            uid=decoded_token["uid"],
+            email=decoded_token.get("email"),
+            email_verified=decoded_token.get("email_verified", False),
+            claims=decoded_token,
+        )
 
     try:
         _ensure_firebase_initialized()
@@ -98,6 +155,8 @@ async def verify_firebase_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    _token_cache[cache_key] = decoded_token
+
     return AuthenticatedUser(
         uid=decoded_token["uid"],
         email=decoded_token.get("email"),
@@ -114,24 +173,45 @@ async def get_current_user(
     from app.models.user import User
     from app.models.org import OrgMembership
 
-    # Find user by Firebase UID
+    cached = _user_context_cache.get(auth_user.uid)
+    if cached is not None:
+        (
+            auth_user.db_user_id,
+            auth_user.org_id,
+            auth_user.org_role,
+            auth_user.role_mask,
+        ) = cached
+        return auth_user
+
+    # User and org membership in one round trip. A user can belong to more
+    # than one org; the earliest membership wins, so the org (and the cached
+    # context) is the same on every request.
     result = await db.execute(
-        select(User).where(User.firebase_uid == auth_user.uid)
+        select(User.id, OrgMembership.org_id, OrgMembership.role)
+        .select_from(User)
+        .outerjoin(OrgMembership, OrgMembership.user_id == User.id)
+        .where(User.firebase_uid == auth_user.uid)
+        .order_by(OrgMembership.created_at, OrgMembership.id)
+        .limit(1)
     )
-    user = result.scalar_one_or_none()
-
-    if user:
-        auth_user.db_user_id = user.id
-
-        # Get org membership
-        membership_result = await db.execute(
-            select(OrgMembership).where(OrgMembership.user_id == user.id)
-        )
-        membership = membership_result.scalar_one_or_none()
-
-        if membership:
-            auth_user.org_id = membership.org_id
-            auth_user.org_role = membership.role.value
+    row = result.first()
+
+    if row:
+        user_id, org_id, role = row
+        auth_user.db_user_id = user_id
+
+        if org_id is not None:
+            auth_user.org_id = org_id
+            auth_user.org_role = role.value
+            auth_user.role_mask = _ROLE_MASKS.get(role.value, 0)
+            # Only full org context is cached, so a user who just created or
+            # joined an org is never served a stale "no membership"
+            _user_context_cache[auth_user.uid] = (
+                auth_user.db_user_id,
+                auth_user.org_id,
+                auth_user.org_role,
+                auth_user.role_mask,
+            )
 
     return auth_user
 
@@ -157,7 +237,7 @@ def require_org_admin(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Organization membership required",
         )
-    if current_user.org_role not in ["ORG_OWNER", "ORG_ADMIN"]:
+    if not current_user.role_mask & ADMIN_MASK:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
@@ -174,7 +254,7 @@ def require_org_owner(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Organization membership required",
         )
-    if current_user.org_role != "ORG_OWNER":
+    if not current_user.role_mask & OWNER_MASK:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Owner privileges required",
@@ -204,6 +284,27 @@ def compute_content_hash(data: dict[str, Any], schema_version: int = 1) -> str:
     return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
 
 
-def compute_file_hash(content: bytes) -> str:
-    """Compute SHA-256 hash of file content."""
-    return hashlib.sha256(content).hexdigest()
+async def compute_content_hash_async(data: dict[str, Any], schema_version: int = 1) -> str:
+    """compute_content_hash for async handlers.
+    
+    Large inspections are serialized and hashed in a worker thread so the
+    event loop keeps serving other requests meanwhile.
+    """
+    if len(data.get("items", ())) < CONTENT_HASH_OFFLOAD_MIN_ITEMS:
+        return compute_content_hash(data, schema_version)
+    return await asyncio.to_thread(compute_content_hash, data, schema_version)
+
+
+def compute_file_hash(content: bytes | bytearray | memoryview | BinaryIO) -> str:
+    """Compute SHA-256 hash of file content.
+    
+    Accepts the raw bytes or a binary file-like object; file objects are read
+    in FILE_HASH_CHUNK_SIZE chunks so large uploads are never fully buffered.
+    """
+    hasher = hashlib.sha256()
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        hasher.update(content)
+    else:
+        for chunk in iter(lambda: content.read(FILE_HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
@@ -1,11 +1,15 @@
 """PROVENIQ Properties - FastAPI Application Entry Point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
+from app.services.ledger import close_ledger_service, get_ledger_service
+from app.services.partitions import run_partition_maintenance
+from app.services.service_bridge import close_service_bridge, get_service_bridge
 from app.routers import (
     auth_router,
     org_router,
@@ -26,9 +30,19 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
-    # Startup
+    # Startup: seat a keep-alive connection to each sibling service so the
+    # first real request doesn't pay the connect handshake
+    await asyncio.gather(
+        get_service_bridge().prewarm(),
+        get_ledger_service().prewarm(),
+    )
+    # Keep the log and outbox tables' monthly partitions ahead of the clock
+    partition_maintenance = asyncio.create_task(run_partition_maintenance())
     yield
     # Shutdown
+    partition_maintenance.cancel()
+    await close_service_bridge()
+    await close_ledger_service()
 
 
 app = FastAPI(
@@ -43,7 +57,7 @@ app = FastAPI(
 # CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:3001"],  # Frontend dev
+    allow_origins=list(settings.origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -9,7 +9,7 @@ from app.models.vendor import Vendor
 from app.models.maintenance import MaintenanceTicket
 from app.models.audit import AuditLogCore, ActivityLog, MasonLog
 from app.models.booking import Booking
-from app.models.jobs import JobsOutbox
+from app.models.jobs import JobsOutbox, JobsOutboxScope
 from app.models.turnover import Turnover, TurnoverPhoto, TurnoverInventory
 
 __all__ = [
@@ -30,6 +30,7 @@ __all__ = [
     "MasonLog",
     "Booking",
     "JobsOutbox",
+    "JobsOutboxScope",
     "Turnover",
     "TurnoverPhoto",
     "TurnoverInventory",
@@ -4,18 +4,21 @@ import uuid
 from datetime import datetime
 from typing import Optional, Any
 
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import String, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
+from app.core.ids import uuid7
 from app.models.enums import AuditAction
+from app.models.types import RANDOM_UUID, StringEnum, UTC_NOW, enum_check
 
 
 class AuditLogCore(Base):
     """Immutable audit log for compliance-critical events.
     
     Golden Master v2.3.1: Core audit events only (evidence, signatures, submissions).
+    Range-partitioned by month on created_at.
     """
 
     __tablename__ = "audit_log_core"
@@ -23,25 +26,23 @@ class AuditLogCore(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=RANDOM_UUID,
     )
     org_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("organizations.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     
     action: Mapped[AuditAction] = mapped_column(
-        SQLEnum(AuditAction),
+        StringEnum(AuditAction),
         nullable=False,
-        index=True,
     )
     
     # Resource being acted upon
@@ -55,7 +56,27 @@ class AuditLogCore(Base):
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Partition key, hence part of the primary key (see migration 006)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, server_default=UTC_NOW
+    )
+
+    __table_args__ = (
+        # Org audit feeds, optionally filtered by action, newest first. The
+        # org/user indexes skip rows without one; lookups are always "= X".
+        Index('ix_audit_log_org_created', 'org_id', created_at.desc(),
+              postgresql_where=text('org_id IS NOT NULL')),
+        Index('ix_audit_log_org_action_created', 'org_id', 'action', created_at.desc(),
+              postgresql_where=text('org_id IS NOT NULL')),
+        Index('ix_audit_log_org_resource', 'org_id', 'resource_type', 'resource_id',
+              postgresql_where=text('org_id IS NOT NULL')),
+        Index('ix_audit_log_user_id', 'user_id', postgresql_where=text('user_id IS NOT NULL')),
+        # Containment (@>) lookups on details
+        Index('ix_audit_log_details_gin', 'details',
+              postgresql_using='gin', postgresql_ops={'details': 'jsonb_path_ops'}),
+        enum_check('action', AuditAction, name='ck_audit_log_action'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
 
 
 class ActivityLog(Base):
@@ -69,19 +90,18 @@ class ActivityLog(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=RANDOM_UUID,
     )
     org_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("organizations.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     
     # Activity type (view, list, search, etc.)
@@ -98,24 +118,37 @@ class ActivityLog(Base):
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+
+    __table_args__ = (
+        # Covering indexes: the newest-first org/user feeds are index-only scans
+        Index('ix_activity_log_org_created', 'org_id', created_at.desc(),
+              postgresql_include=['activity_type', 'resource_type', 'resource_id'],
+              postgresql_where=text('org_id IS NOT NULL')),
+        Index('ix_activity_log_user_created', 'user_id', created_at.desc(),
+              postgresql_include=['activity_type'],
+              postgresql_where=text('user_id IS NOT NULL')),
+    )
 
 
 class MasonLog(Base):
-    """Log of Mason AI advisory decisions (for auditing AI recommendations)."""
+    """Log of Mason AI advisory decisions (for auditing AI recommendations).
+    
+    Range-partitioned by month on created_at.
+    """
 
     __tablename__ = "mason_logs"
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=RANDOM_UUID,
     )
     org_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("organizations.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     
     # What Mason was asked to do
@@ -141,4 +174,17 @@ class MasonLog(Base):
     # Processing time (ms)
     processing_time_ms: Mapped[Optional[int]] = mapped_column(nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Partition key, hence part of the primary key (see migration 006)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, server_default=UTC_NOW
+    )
+
+    __table_args__ = (
+        Index('ix_mason_logs_org_created', 'org_id', created_at.desc(),
+              postgresql_where=text('org_id IS NOT NULL')),
+        Index('ix_mason_logs_input_data_gin', 'input_data',
+              postgresql_using='gin', postgresql_ops={'input_data': 'jsonb_path_ops'}),
+        Index('ix_mason_logs_output_data_gin', 'output_data',
+              postgresql_using='gin', postgresql_ops={'output_data': 'jsonb_path_ops'}),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
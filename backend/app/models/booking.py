@@ -4,12 +4,14 @@ import uuid
 from datetime import datetime, date
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, DateTime, Date, ForeignKey, Enum as SQLEnum, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, DateTime, Date, FetchedValue, ForeignKey, Text, Index, func, text
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
 from app.models.enums import BookingStatus
+from app.models.types import RANDOM_UUID, StringEnum, UTC_NOW, enum_check
 
 if TYPE_CHECKING:
     from app.models.property import Unit
@@ -28,13 +30,13 @@ class Booking(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=RANDOM_UUID,
     )
     unit_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("units.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     created_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
@@ -43,7 +45,7 @@ class Booking(Base):
     )
     
     # External reference (Airbnb confirmation code, etc.)
-    external_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+    external_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     source: Mapped[str] = mapped_column(String(50), default="manual")  # manual, airbnb, vrbo, etc.
     
     # Guest info (minimal - no PII storage beyond name)
@@ -59,7 +61,7 @@ class Booking(Base):
     actual_check_out: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     status: Mapped[BookingStatus] = mapped_column(
-        SQLEnum(BookingStatus),
+        StringEnum(BookingStatus),
         default=BookingStatus.UPCOMING,
         nullable=False,
         index=True,
@@ -67,11 +69,31 @@ class Booking(Base):
     
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
     unit: Mapped["Unit"] = relationship("Unit", back_populates="bookings")
     created_by: Mapped[Optional["User"]] = relationship("User")
+
+    __table_args__ = (
+        # Unit calendar lookups: bookings for a unit by check-in date
+        Index('ix_bookings_unit_check_in', 'unit_id', 'check_in_date'),
+        # Channel-imported bookings only; manual ones have no external_id
+        Index('ix_bookings_external_id', 'external_id',
+              postgresql_where=text('external_id IS NOT NULL')),
+        # Availability: bookings on a unit overlapping a date window
+        Index('ix_bookings_unit_dates', 'unit_id', 'check_out_date', 'check_in_date'),
+        # No two active bookings on a unit may overlap (needs btree_gist)
+        ExcludeConstraint(
+            ('unit_id', '='),
+            (func.daterange(check_in_date, check_out_date, text("'[)'")), '&&'),
+            where=text("status IN ('upcoming', 'checked_in')"),
+            using='gist',
+            name='no_overlap_bookings',
+        ),
+        enum_check('status', BookingStatus, name='ck_bookings_status'),
+    )
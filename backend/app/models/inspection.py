@@ -4,11 +4,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Any
 
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLEnum, Text, Integer, Boolean, CheckConstraint
+from sqlalchemy import String, DateTime, FetchedValue, ForeignKey, Index, Text, Integer, SmallInteger, Boolean, CheckConstraint, LargeBinary, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import HexDigest, RANDOM_UUID, StringEnum, UTC_NOW, enum_check
 from app.models.enums import (
     InspectionType, InspectionStatus, EvidenceType, InspectionScope, InspectionSignedBy,
     InspectionCondition, EvidenceSource, StorageInstanceKind, SignatureType,
@@ -28,12 +30,22 @@ class Inspection(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=RANDOM_UUID,
     )
     lease_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("leases.id", ondelete="CASCADE"),
         nullable=False,
+    )
+    # Owning org, copied from the lease by a trigger on insert and kept in
+    # step on re-parenting (migration 021), so tenancy filters don't join
+    # leases, units and properties
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        server_default=FetchedValue(),
+        nullable=False,
         index=True,
     )
     created_by_id: Mapped[uuid.UUID] = mapped_column(
@@ -50,19 +62,18 @@ class Inspection(Base):
     )
     
     inspection_type: Mapped[InspectionType] = mapped_column(
-        SQLEnum(InspectionType),
+        StringEnum(InspectionType),
         nullable=False,
     )
     status: Mapped[InspectionStatus] = mapped_column(
-        SQLEnum(InspectionStatus),
+        StringEnum(InspectionStatus),
         default=InspectionStatus.DRAFT,
         nullable=False,
-        index=True,
     )
     
     # STR support: scope determines if lease-scoped or booking-scoped
     scope: Mapped[InspectionScope] = mapped_column(
-        SQLEnum(InspectionScope),
+        StringEnum(InspectionScope),
         default=InspectionScope.LEASE,
         nullable=False,
     )
@@ -78,16 +89,16 @@ class Inspection(Base):
     captured_offline: Mapped[bool] = mapped_column(Boolean, default=False)
     
     # Content hash (SHA-256 of canonical JSON)
-    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
-    schema_version: Mapped[int] = mapped_column(Integer, default=1)
+    content_hash: Mapped[Optional[str]] = mapped_column(HexDigest, nullable=True)
+    schema_version: Mapped[int] = mapped_column(SmallInteger, default=1)
     
     # Frozen canonical JSON blob for audit trail
     canonical_json_blob: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB, nullable=True)
-    canonical_json_sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    canonical_json_sha256: Mapped[Optional[str]] = mapped_column(HexDigest, nullable=True)
     
     # Certificate PDF
     certificate_pdf_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
-    certificate_pdf_sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    certificate_pdf_sha256: Mapped[Optional[str]] = mapped_column(HexDigest, nullable=True)
     
     # Signatures (lease-scoped: tenant + landlord)
     tenant_signed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -95,7 +106,7 @@ class Inspection(Base):
     
     # STR host attestation (booking-scoped)
     signed_by: Mapped[Optional[InspectionSignedBy]] = mapped_column(
-        SQLEnum(InspectionSignedBy),
+        StringEnum(InspectionSignedBy),
         nullable=True,
     )
     signed_actor_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -107,9 +118,10 @@ class Inspection(Base):
     
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -117,17 +129,23 @@ class Inspection(Base):
     created_by: Mapped[Optional["User"]] = relationship(
         "User", back_populates="inspections_created", foreign_keys=[created_by_id]
     )
+    # Items and their evidence are nearly always read together; "selectin"
+    # loads each level in one IN query instead of one query per parent
     items: Mapped[list["InspectionItem"]] = relationship(
         "InspectionItem", back_populates="inspection", cascade="all, delete-orphan",
-        order_by="InspectionItem.room_name, InspectionItem.item_name"
+        order_by="InspectionItem.room_key, InspectionItem.ordinal, InspectionItem.item_key",
+        lazy="selectin",
     )
+    # Rarely needed; load explicitly so an accidental access fails loudly
     supplemental_inspections: Mapped[list["Inspection"]] = relationship(
         "Inspection", back_populates="original_inspection",
-        foreign_keys=[supplemental_to_inspection_id]
+        foreign_keys=[supplemental_to_inspection_id],
+        lazy="raise",
     )
     original_inspection: Mapped[Optional["Inspection"]] = relationship(
         "Inspection", back_populates="supplemental_inspections",
-        remote_side=[id], foreign_keys=[supplemental_to_inspection_id]
+        remote_side=[id], foreign_keys=[supplemental_to_inspection_id],
+        lazy="raise",
     )
 
     __table_args__ = (
@@ -142,6 +160,31 @@ class Inspection(Base):
             "(scope = 'lease' AND inspection_type IN ('move_in', 'move_out', 'periodic'))",
             name="ck_inspection_scope_type",
         ),
+        enum_check("inspection_type", InspectionType, name="ck_inspections_inspection_type"),
+        enum_check("status", InspectionStatus, name="ck_inspections_status"),
+        enum_check("scope", InspectionScope, name="ck_inspections_scope"),
+        enum_check("signed_by", InspectionSignedBy, name="ck_inspections_signed_by"),
+        # Signed inspections of a type per lease (move-in/move-out diffs)
+        Index(
+            "ix_inspections_lease_type_signed", "lease_id", "inspection_type",
+            postgresql_where=text("status = 'signed'"),
+        ),
+        # Lease inspection lists and latest-of-type lookups as index-only scans
+        Index(
+            "ix_inspections_lease_date_cover", "lease_id", inspection_date.desc(),
+            postgresql_include=["status", "inspection_type"],
+        ),
+        # Period reports range-scan created_at, which follows insert order
+        Index(
+            "ix_inspections_created_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+        # Vacuum sooner than the 20% default so the visibility map stays
+        # current enough for index-only scans
+        {"postgresql_with": {
+            "autovacuum_vacuum_scale_factor": "0.05",
+            "autovacuum_vacuum_insert_scale_factor": "0.05",
+        }},
     )
 
 
@@ -156,23 +199,32 @@ class InspectionItem(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=RANDOM_UUID,
     )
     inspection_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("inspections.id", ondelete="CASCADE"),
+        ForeignKey("inspections.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
+        nullable=False,
+    )
+    # Owning org, copied from the inspection by a trigger on insert and kept
+    # in step on re-parenting (migration 021). Set it explicitly only when
+    # inserting ahead of the inspection; it is checked at commit.
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        server_default=FetchedValue(),
         nullable=False,
-        index=True,
     )
     
     # Golden Master v2.3.1: room_key/item_key/ordinal pattern
     room_key: Mapped[str] = mapped_column(String(100), nullable=False)
     item_key: Mapped[str] = mapped_column(String(100), nullable=False)
-    ordinal: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    ordinal: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False)
     
     # Condition (enum-based)
     condition: Mapped[InspectionCondition] = mapped_column(
-        SQLEnum(InspectionCondition),
+        StringEnum(InspectionCondition),
         default=InspectionCondition.GOOD,
         nullable=False,
     )
@@ -181,20 +233,33 @@ class InspectionItem(Base):
     # Mason AI cost estimate (advisory only - INTEGER CENTS)
     mason_estimated_repair_cents: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Evidence attached to this item, maintained by a trigger on inspection_evidence
+    evidence_count: Mapped[int] = mapped_column(
+        Integer, server_default=text("0"), server_onupdate=FetchedValue(), nullable=False
+    )
+    
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
     inspection: Mapped["Inspection"] = relationship("Inspection", back_populates="items")
     evidence: Mapped[list["InspectionEvidence"]] = relationship(
         "InspectionEvidence", back_populates="item", cascade="all, delete-orphan",
-        order_by="InspectionEvidence.confirmed_at"
+        order_by="InspectionEvidence.confirmed_at",
+        lazy="selectin",
     )
 
     __table_args__ = (
-        UniqueConstraint('inspection_id', 'room_key', 'ordinal', 'item_key', name='uq_inspection_item_order'),
+        # Also serves an inspection's items in display order, with the
+        # columns the inspection views read, without heap fetches
+        UniqueConstraint(
+            'inspection_id', 'room_key', 'ordinal', 'item_key', name='uq_inspection_item_order',
+            postgresql_include=['condition', 'mason_estimated_repair_cents'],
+        ),
+        enum_check('condition', InspectionCondition, name='ck_inspection_items_condition'),
     )
 
 
@@ -210,13 +275,22 @@ class InspectionEvidence(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=RANDOM_UUID,
     )
     inspection_item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("inspection_items.id", ondelete="CASCADE"),
+        ForeignKey("inspection_items.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
+        nullable=False,
+    )
+    # Owning org, copied from the item by a trigger on insert and kept in
+    # step on re-parenting (migration 021). Set it explicitly only when
+    # inserting ahead of the item; it is checked at commit.
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        server_default=FetchedValue(),
         nullable=False,
-        index=True,
     )
     
     # Storage info
@@ -225,34 +299,38 @@ class InspectionEvidence(Base):
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
     
     # SHA-256 hashes: claimed by client, verified by server async
-    file_sha256_claimed: Mapped[str] = mapped_column(String(64), nullable=False)
-    file_sha256_verified: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    file_sha256_claimed: Mapped[str] = mapped_column(HexDigest, nullable=False)
+    file_sha256_verified: Mapped[Optional[str]] = mapped_column(HexDigest, nullable=True)
     
     # Confirm timestamp (server-side HEAD check passed)
     confirmed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     
     # Evidence source
     evidence_source: Mapped[EvidenceSource] = mapped_column(
-        SQLEnum(EvidenceSource),
+        StringEnum(EvidenceSource),
         default=EvidenceSource.TENANT,
         nullable=False,
     )
     
     # Storage provider instance tracking (for immutability verification)
     storage_instance_kind: Mapped[StorageInstanceKind] = mapped_column(
-        SQLEnum(StorageInstanceKind),
+        StringEnum(StorageInstanceKind),
         nullable=False,
     )
     storage_instance_id: Mapped[str] = mapped_column(String(255), nullable=False)
     
-    # Idempotency key for confirm endpoint
+    # Idempotency key for confirm endpoint; unique per item through its
+    # 16-byte key_hash(), the text itself is not indexed
     confirm_idempotency_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    confirm_key_hash: Mapped[bytes] = mapped_column(LargeBinary(16), nullable=False)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
     item: Mapped["InspectionItem"] = relationship("InspectionItem", back_populates="evidence")
 
     __table_args__ = (
-        UniqueConstraint('inspection_item_id', 'confirm_idempotency_key', name='uq_evidence_confirm'),
+        UniqueConstraint('inspection_item_id', 'confirm_key_hash', name='uq_evidence_confirm'),
+        enum_check('evidence_source', EvidenceSource, name='ck_inspection_evidence_source'),
+        enum_check('storage_instance_kind', StorageInstanceKind, name='ck_inspection_evidence_storage_kind'),
     )
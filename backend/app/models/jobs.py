@@ -1,14 +1,16 @@
-"""Jobs outbox model for async side effects with unique_scope de-duplication."""
+"""Jobs outbox models for async side effects with unique_scope de-duplication."""
 
 import uuid
 from datetime import datetime
 from typing import Optional, Any
 
-from sqlalchemy import String, DateTime, Text, Integer, Enum as SQLEnum, Index
+from sqlalchemy import String, DateTime, Text, Integer, Enum as SQLEnum, Index, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import UTC_NOW
 from app.models.enums import JobStatus
 
 
@@ -16,7 +18,11 @@ class JobsOutbox(Base):
     """Async job queue with idempotency via unique_scope.
     
     All async side effects MUST use this table. No fire-and-forget tasks.
-    unique_scope ensures de-duplication (e.g., "verify_hash:evidence:{id}").
+    unique_scope ensures de-duplication (e.g., "verify_hash:evidence:{id}"),
+    enforced through JobsOutboxScope.
+
+    Range-partitioned by month on created_at, so finished months are
+    detached and dropped rather than deleted row by row.
     """
 
     __tablename__ = "jobs_outbox"
@@ -24,7 +30,7 @@ class JobsOutbox(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     
     # Job type (e.g., "verify_hash", "generate_certificate", "send_notification")
@@ -38,12 +44,12 @@ class JobsOutbox(Base):
         SQLEnum(JobStatus),
         default=JobStatus.PENDING,
         nullable=False,
-        index=True,
     )
     
-    # Unique scope for idempotency (e.g., "verify_hash:evidence:abc123")
-    # UNIQUE constraint prevents duplicate jobs for same scope
-    unique_scope: Mapped[str] = mapped_column(String(500), nullable=False, unique=True)
+    # Unique scope for idempotency (e.g., "verify_hash:evidence:abc123").
+    # A unique index on a partitioned table must include the partition key,
+    # so uniqueness is enforced by jobs_outbox_scopes instead.
+    unique_scope: Mapped[str] = mapped_column(String(500), nullable=False)
     
     # Retry tracking
     attempts: Mapped[int] = mapped_column(Integer, default=0)
@@ -51,14 +57,41 @@ class JobsOutbox(Base):
     last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Scheduling
-    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    run_after: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
     
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Partition key, hence part of the primary key (see migration 019)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, server_default=UTC_NOW
+    )
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     __table_args__ = (
-        Index('ix_jobs_outbox_pending', 'status', 'run_after', 
-              postgresql_where=(status == JobStatus.PENDING)),
+        # Only actionable jobs are indexed, so the index tracks queue depth
+        # rather than the whole job history
+        Index('ix_jobs_outbox_pending', 'status', 'run_after',
+              postgresql_where=status.in_([JobStatus.PENDING, JobStatus.PROCESSING]),
+              postgresql_include=['type']),
+        # Containment (@>) lookups on payload
+        Index('ix_jobs_outbox_payload_gin', 'payload',
+              postgresql_using='gin', postgresql_ops={'payload': 'jsonb_path_ops'}),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+
+class JobsOutboxScope(Base):
+    """Claimed unique_scope values, one row per job ever enqueued.
+
+    Insert-only and never partitioned, so a scope stays claimed after its
+    job's partition has been dropped. Keyed on a 16-byte hash of the scope
+    (see key_hash()); the text is kept, unindexed, for debugging.
+    """
+
+    __tablename__ = "jobs_outbox_scopes"
+
+    scope_hash: Mapped[bytes] = mapped_column(LargeBinary(16), primary_key=True)
+    unique_scope: Mapped[str] = mapped_column(String(500), nullable=False)
+    job_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=UTC_NOW, nullable=False
     )
@@ -4,11 +4,13 @@ import uuid
 from datetime import datetime, date
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, DateTime, Date, ForeignKey, Enum as SQLEnum, Text, BigInteger, Integer, CheckConstraint, UniqueConstraint
+from sqlalchemy import String, DateTime, FetchedValue, Date, ForeignKey, Enum as SQLEnum, Text, BigInteger, SmallInteger, CheckConstraint, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import UTC_NOW
 from app.models.enums import LeaseStatus, LeaseType, TenantRole, InviteStatus
 
 if TYPE_CHECKING:
@@ -25,7 +27,7 @@ class Lease(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     unit_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -33,6 +35,15 @@ class Lease(Base):
         nullable=False,
         index=True,
     )
+    # Owning org, copied from the unit's property by a trigger on insert
+    # (migration 021) so tenancy filters don't join units and properties
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        server_default=FetchedValue(),
+        nullable=False,
+        index=True,
+    )
     
     # Lease type and status
     lease_type: Mapped[LeaseType] = mapped_column(
@@ -44,7 +55,6 @@ class Lease(Base):
         SQLEnum(LeaseStatus),
         default=LeaseStatus.DRAFT,
         nullable=False,
-        index=True,
     )
     
     # Dates
@@ -57,7 +67,7 @@ class Lease(Base):
     
     # Commercial NNN fields (REQUIRED if lease_type='commercial_nnn')
     # pro_rata_share_bps: basis points (1-10000) representing tenant's share of CAM
-    pro_rata_share_bps: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    pro_rata_share_bps: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
     cam_budget_cents: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     
     # Tenant info (before tenant account exists)
@@ -72,9 +82,10 @@ class Lease(Base):
     
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -91,6 +102,16 @@ class Lease(Base):
             "(pro_rata_share_bps IS NULL) OR (pro_rata_share_bps > 0 AND pro_rata_share_bps <= 10000)",
             name="ck_lease_pro_rata_share_bps_range",
         ),
+        CheckConstraint("rent_amount_cents >= 0", name="ck_lease_rent_nonneg"),
+        CheckConstraint("deposit_amount_cents >= 0", name="ck_lease_deposit_nonneg"),
+        CheckConstraint("cam_budget_cents >= 0", name="ck_lease_cam_budget_nonneg"),
+        # Status is low-cardinality, so only the states queries single out are
+        # indexed: current leases per unit (rent roll, CAM), and active leases
+        # per org by end date (expiring-soon and revenue)
+        Index("ix_leases_unit_active", "unit_id",
+              postgresql_where=text("status IN ('active', 'pending')")),
+        Index("ix_leases_active", "org_id", "end_date",
+              postgresql_where=text("status = 'active'")),
     )
 
 
@@ -105,11 +126,11 @@ class TenantAccess(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     lease_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("leases.id", ondelete="CASCADE"),
+        ForeignKey("leases.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
         nullable=False,
         index=True,
     )
@@ -135,7 +156,7 @@ class TenantAccess(Base):
     )
     
     # Timestamps
-    invited_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    invited_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
     accepted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
@@ -4,11 +4,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Any
 
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLEnum, Text, Integer, Boolean
+from sqlalchemy import String, DateTime, FetchedValue, ForeignKey, Enum as SQLEnum, Index, Text, Integer, SmallInteger, Boolean, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import UTC_NOW
 from app.models.enums import MaintenanceStatus, VendorSpecialty
 
 if TYPE_CHECKING:
@@ -25,7 +27,7 @@ class MaintenanceTicket(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     unit_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -33,6 +35,15 @@ class MaintenanceTicket(Base):
         nullable=False,
         index=True,
     )
+    # Owning org, copied from the unit's property by a trigger on insert
+    # (migration 021) so tenancy filters don't join units and properties
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        server_default=FetchedValue(),
+        nullable=False,
+        index=True,
+    )
     created_by_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -59,7 +70,6 @@ class MaintenanceTicket(Base):
         SQLEnum(MaintenanceStatus),
         default=MaintenanceStatus.OPEN,
         nullable=False,
-        index=True,
     )
     
     # Categorization
@@ -69,7 +79,7 @@ class MaintenanceTicket(Base):
     )
     
     # Priority (1-5, 1=highest)
-    priority: Mapped[int] = mapped_column(Integer, default=3)
+    priority: Mapped[int] = mapped_column(SmallInteger, default=3)
     
     # Cost estimate (INTEGER CENTS - advisory only)
     maintenance_cost_estimate_cents: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -86,9 +96,10 @@ class MaintenanceTicket(Base):
     is_tenant_visible: Mapped[bool] = mapped_column(Boolean, default=True)
     tenant_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -96,3 +107,17 @@ class MaintenanceTicket(Base):
     assigned_vendor: Mapped[Optional["Vendor"]] = relationship(
         "Vendor", back_populates="maintenance_tickets"
     )
+
+    __table_args__ = (
+        # Open work per unit in list order; the rest of the ticket history
+        # stays out of the index
+        Index('ix_maintenance_tickets_open', 'unit_id', 'priority', created_at.desc(),
+              postgresql_where=text("status IN ('open', 'in_progress')")),
+        # created_at follows insert order, so a BRIN summary serves the
+        # report's period scans at a fraction of a B-tree's size
+        Index('ix_maintenance_tickets_created_brin', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # Containment (@>) lookups on the triage result
+        Index('ix_maintenance_tickets_triage_gin', 'mason_triage_result',
+              postgresql_using='gin', postgresql_ops={'mason_triage_result': 'jsonb_path_ops'}),
+    )
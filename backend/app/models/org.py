@@ -4,11 +4,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import String, DateTime, FetchedValue, ForeignKey, Enum as SQLEnum, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import UTC_NOW
 from app.models.enums import OrgRole
 
 if TYPE_CHECKING:
@@ -25,7 +27,7 @@ class Organization(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     slug: Mapped[str] = mapped_column(
@@ -43,9 +45,10 @@ class Organization(Base):
     # Settings
     timezone: Mapped[str] = mapped_column(String(50), default="America/New_York")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -68,7 +71,7 @@ class OrgMembership(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     org_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -88,7 +91,7 @@ class OrgMembership(Base):
         nullable=False,
     )
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
     org: Mapped["Organization"] = relationship("Organization", back_populates="memberships")
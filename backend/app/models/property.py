@@ -4,11 +4,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLEnum, Text, Integer, CheckConstraint
+from sqlalchemy import String, DateTime, FetchedValue, ForeignKey, Enum as SQLEnum, Text, Integer, SmallInteger, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import UTC_NOW
 from app.models.enums import PropertyType, UnitStatus, OccupancyModel
 
 if TYPE_CHECKING:
@@ -26,7 +28,7 @@ class Property(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     org_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -61,12 +63,13 @@ class Property(Base):
     total_leasable_sq_ft: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
     # Metadata
-    year_built: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    year_built: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -91,7 +94,7 @@ class Unit(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     property_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -108,7 +111,7 @@ class Unit(Base):
     )
     
     # Unit details
-    bedrooms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    bedrooms: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
     bathrooms: Mapped[Optional[float]] = mapped_column(Integer, nullable=True)  # stored as int (e.g., 15 = 1.5)
     
     # Commercial fields (REQUIRED if parent property_type in ('commercial', 'mixed'))
@@ -117,9 +120,10 @@ class Unit(Base):
     
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
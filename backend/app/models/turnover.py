@@ -4,11 +4,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, List
 
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLEnum, Text, Boolean, Integer
+from sqlalchemy import String, DateTime, FetchedValue, ForeignKey, Enum as SQLEnum, Text, Boolean, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import HexDigest, UTC_NOW
 from app.models.enums import TurnoverStatus, TurnoverPhotoType
 
 if TYPE_CHECKING:
@@ -29,7 +31,7 @@ class Turnover(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     unit_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -67,7 +69,6 @@ class Turnover(Base):
         SQLEnum(TurnoverStatus),
         default=TurnoverStatus.PENDING,
         nullable=False,
-        index=True,
     )
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -86,9 +87,10 @@ class Turnover(Base):
     has_damage: Mapped[bool] = mapped_column(Boolean, default=False)
     needs_restock: Mapped[bool] = mapped_column(Boolean, default=False)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -112,6 +114,12 @@ class Turnover(Base):
         "TurnoverInventory", back_populates="turnover", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Only open turnovers are looked up by status
+        Index('ix_turnovers_status', 'status',
+              postgresql_where=status.in_([TurnoverStatus.PENDING, TurnoverStatus.IN_PROGRESS])),
+    )
+
 
 class TurnoverPhoto(Base):
     """A photo in the turnover checklist.
@@ -124,7 +132,7 @@ class TurnoverPhoto(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     turnover_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -140,7 +148,7 @@ class TurnoverPhoto(Base):
     
     # Storage
     object_path: Mapped[str] = mapped_column(String(500), nullable=False)
-    file_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # SHA-256
+    file_hash: Mapped[str] = mapped_column(HexDigest, nullable=False)  # SHA-256
     mime_type: Mapped[str] = mapped_column(String(100), default="image/jpeg")
     file_size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
     
@@ -148,7 +156,7 @@ class TurnoverPhoto(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_flagged: Mapped[bool] = mapped_column(Boolean, default=False)  # Host flagged an issue
     
-    uploaded_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    uploaded_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
     uploaded_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -172,7 +180,7 @@ class TurnoverInventory(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     turnover_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -194,7 +202,7 @@ class TurnoverInventory(Base):
     is_damaged: Mapped[bool] = mapped_column(Boolean, default=False)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    checked_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    checked_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
     turnover: Mapped["Turnover"] = relationship("Turnover", back_populates="inventory_checks")
@@ -0,0 +1,83 @@
+"""Custom column types and server defaults shared by the models."""
+
+import hashlib
+from enum import Enum
+from typing import Any, Optional
+
+from sqlalchemy import CheckConstraint, LargeBinary, String, text
+from sqlalchemy.types import TypeDecorator
+
+# Server-side "now" as naive UTC, matching the app's TIMESTAMP columns
+UTC_NOW = text("timezone('utc', now())")
+# Fallback primary key for raw SQL inserts; the ORM always sends uuid7()
+RANDOM_UUID = text("gen_random_uuid()")
+
+
+def key_hash(value: str) -> bytes:
+    """Fixed 16-byte key for a long lookup string: the first half of its SHA-256.
+
+    Matches substring(sha256(convert_to(value, 'UTF8')) FROM 1 FOR 16) in SQL,
+    which migrations use to backfill existing rows.
+    """
+    return hashlib.sha256(value.encode()).digest()[:16]
+
+
+class HexDigest(TypeDecorator):
+    """SHA-256 digest stored as raw BYTEA but read and written as a hex string.
+
+    Half the size of a VARCHAR(64) hex column (and of any index on it), while
+    the rest of the app keeps passing lowercase hex strings around.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect: Any) -> Optional[bytes]:
+        if value is None:
+            return None
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value: Optional[bytes], dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return value.hex()
+
+
+class StringEnum(TypeDecorator):
+    """Python Enum stored by value in a VARCHAR instead of a native Postgres ENUM.
+
+    New members then need only a CHECK constraint swap (see enum_check), not
+    an ALTER TYPE. Binding an unknown value raises ValueError before the
+    statement reaches the database.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[Enum], length: int = 32):
+        super().__init__(length)
+        self.enum_cls = enum_cls
+        # Plain dict lookups on the per-row paths instead of EnumMeta.__call__
+        self._members = {member.value: member for member in enum_cls}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, self.enum_cls):
+            return value.value
+        return self.enum_cls(value).value
+
+    def process_result_value(self, value: Optional[str], dialect: Any) -> Optional[Enum]:
+        if value is None:
+            return None
+        member = self._members.get(value)
+        if member is None:
+            # Raises the usual ValueError for a label the enum doesn't know
+            return self.enum_cls(value)
+        return member
+
+
+def enum_check(column: str, enum_cls: type[Enum], name: str) -> CheckConstraint:
+    """CHECK constraint limiting a StringEnum column to the enum's values."""
+    values = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({values})", name=name)
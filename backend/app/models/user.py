@@ -4,11 +4,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, DateTime, Boolean
+from sqlalchemy import String, DateTime, FetchedValue, Boolean, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.models.types import UTC_NOW
 
 if TYPE_CHECKING:
     from app.models.org import OrgMembership
@@ -24,7 +26,7 @@ class User(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     firebase_uid: Mapped[str] = mapped_column(
         String(128),
@@ -32,20 +34,17 @@ class User(Base):
         nullable=False,
         index=True,
     )
-    email: Mapped[str] = mapped_column(
-        String(255),
-        unique=True,
-        nullable=False,
-        index=True,
-    )
+    # Unique case-insensitively, through ix_users_email_lower
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     phone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    # Stamped by the set_updated_at() trigger
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -58,3 +57,9 @@ class User(Base):
     inspections_created: Mapped[list["Inspection"]] = relationship(
         "Inspection", back_populates="created_by", foreign_keys="Inspection.created_by_id"
     )
+
+    __table_args__ = (
+        # Email lookups compare lower(email) = lower(:email), which only an
+        # index on the same expression can serve
+        Index('ix_users_email_lower', func.lower(email), unique=True),
+    )
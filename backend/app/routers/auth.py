@@ -6,7 +6,8 @@ from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from firebase_admin import auth
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -148,7 +149,7 @@ async def verify_magic_link(
 
     # Find or create user
     user_result = await db.execute(
-        select(User).where(User.email == lease.tenant_email)
+        select(User).where(func.lower(User.email) == func.lower(lease.tenant_email))
     )
     user = user_result.scalar_one_or_none()
 
@@ -170,7 +171,16 @@ async def verify_magic_link(
             phone=lease.tenant_phone,
         )
         db.add(user)
-        await db.flush()
+        try:
+            await db.flush()
+        except IntegrityError as e:
+            if "ix_users_email_lower" not in str(e.orig):
+                raise
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="An account with this email already exists",
+            )
 
     # Create tenant access
     access_result = await db.execute(
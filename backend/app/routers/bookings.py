@@ -7,10 +7,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.database import get_db
+from app.core.database import get_db, raiseload_in_debug
 from app.core.security import require_org_member, AuthenticatedUser, compute_content_hash
 from app.models.property import Property, Unit
 from app.models.lease import Lease
@@ -112,7 +113,16 @@ async def create_booking(
         notes=data.notes,
     )
     db.add(booking)
-    await db.flush()
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        if "no_overlap_bookings" not in str(e.orig):
+            raise
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Unit already has an active booking overlapping these dates",
+        )
 
     # Auto-create PRE_STAY inspection draft
     pre_stay_inspection = Inspection(
@@ -165,6 +175,7 @@ async def list_bookings(
         .join(Unit)
         .join(Property)
         .where(Property.org_id == current_user.org_id)
+        .options(*raiseload_in_debug())
     )
 
     if unit_id:
@@ -177,29 +188,25 @@ async def list_bookings(
     result = await db.execute(query)
     bookings = result.scalars().all()
 
-    # Get linked inspections
-    responses = []
-    for booking in bookings:
+    # Linked inspection IDs for every booking in one query, columns only so
+    # no inspection items or evidence are loaded
+    linked: dict[tuple[str, InspectionType], UUID] = {}
+    if bookings:
         insp_result = await db.execute(
-            select(Inspection).where(
-                Inspection.booking_id == str(booking.id),
+            select(Inspection.booking_id, Inspection.inspection_type, Inspection.id).where(
+                Inspection.booking_id.in_([str(booking.id) for booking in bookings]),
                 Inspection.scope == InspectionScope.BOOKING,
             )
         )
-        inspections = insp_result.scalars().all()
-        
-        pre_stay_id = None
-        post_stay_id = None
-        for insp in inspections:
-            if insp.inspection_type == InspectionType.PRE_STAY:
-                pre_stay_id = insp.id
-            elif insp.inspection_type == InspectionType.POST_STAY:
-                post_stay_id = insp.id
+        for booking_id, inspection_type, inspection_id in insp_result:
+            linked[(booking_id, inspection_type)] = inspection_id
 
+    responses = []
+    for booking in bookings:
         responses.append(BookingResponse(
             **booking.__dict__,
-            pre_stay_inspection_id=pre_stay_id,
-            post_stay_inspection_id=post_stay_id,
+            pre_stay_inspection_id=linked.get((str(booking.id), InspectionType.PRE_STAY)),
+            post_stay_inspection_id=linked.get((str(booking.id), InspectionType.POST_STAY)),
         ))
 
     return responses
@@ -226,22 +233,22 @@ async def get_booking(
     if not booking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
 
-    # Get linked inspections
+    # Get linked inspection IDs, columns only so no inspection items or
+    # evidence are loaded
     insp_result = await db.execute(
-        select(Inspection).where(
+        select(Inspection.id, Inspection.inspection_type).where(
             Inspection.booking_id == str(booking.id),
             Inspection.scope == InspectionScope.BOOKING,
         )
     )
-    inspections = insp_result.scalars().all()
     
     pre_stay_id = None
     post_stay_id = None
-    for insp in inspections:
-        if insp.inspection_type == InspectionType.PRE_STAY:
-            pre_stay_id = insp.id
-        elif insp.inspection_type == InspectionType.POST_STAY:
-            post_stay_id = insp.id
+    for inspection_id, inspection_type in insp_result:
+        if inspection_type == InspectionType.PRE_STAY:
+            pre_stay_id = inspection_id
+        elif inspection_type == InspectionType.POST_STAY:
+            post_stay_id = inspection_id
 
     return BookingResponse(
         **booking.__dict__,
@@ -372,7 +379,10 @@ async def get_claim_packet(
     # Get PRE_STAY inspection
     pre_stay_result = await db.execute(
         select(Inspection)
-        .options(selectinload(Inspection.items).selectinload(InspectionItem.evidence))
+        .options(
+            selectinload(Inspection.items).selectinload(InspectionItem.evidence),
+            *raiseload_in_debug(),
+        )
         .where(
             Inspection.booking_id == str(booking.id),
             Inspection.inspection_type == InspectionType.PRE_STAY,
@@ -390,7 +400,10 @@ async def get_claim_packet(
     # Get POST_STAY inspection
     post_stay_result = await db.execute(
         select(Inspection)
-        .options(selectinload(Inspection.items).selectinload(InspectionItem.evidence))
+        .options(
+            selectinload(Inspection.items).selectinload(InspectionItem.evidence),
+            *raiseload_in_debug(),
+        )
         .where(
             Inspection.booking_id == str(booking.id),
             Inspection.inspection_type == InspectionType.POST_STAY,
@@ -82,9 +82,7 @@ async def get_dashboard_stats(
                 else_=0
             )).label("expiring_soon"),
         )
-        .join(Unit)
-        .join(Property)
-        .where(Property.org_id == org_id)
+        .where(Lease.org_id == org_id)
     )
     lease_stats = lease_query.one()
 
@@ -94,10 +92,8 @@ async def get_dashboard_stats(
             func.coalesce(func.sum(Lease.rent_amount_cents), 0).label("monthly_rent_roll"),
             func.coalesce(func.sum(Lease.deposit_amount_cents), 0).label("deposits_held"),
         )
-        .join(Unit)
-        .join(Property)
         .where(
-            Property.org_id == org_id,
+            Lease.org_id == org_id,
             Lease.status == LeaseStatus.ACTIVE,
         )
     )
@@ -113,9 +109,7 @@ async def get_dashboard_stats(
                 else_=0
             )).label("completed_this_month"),
         )
-        .join(Unit)
-        .join(Property)
-        .where(Property.org_id == org_id)
+        .where(Inspection.org_id == org_id)
     )
     insp_stats = insp_query.one()
 
@@ -130,9 +124,7 @@ async def get_dashboard_stats(
                 else_=0
             )).label("completed_this_month"),
         )
-        .join(Unit)
-        .join(Property)
-        .where(Property.org_id == org_id)
+        .where(MaintenanceTicket.org_id == org_id)
     )
     maint_stats = maint_query.one()
 
@@ -191,7 +183,7 @@ async def get_expiring_leases(
         .join(Unit, Lease.unit_id == Unit.id)
         .join(Property, Unit.property_id == Property.id)
         .where(
-            Property.org_id == org_id,
+            Lease.org_id == org_id,
             Lease.status == LeaseStatus.ACTIVE,
             Lease.end_date <= cutoff,
             Lease.end_date >= now,
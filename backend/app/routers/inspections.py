@@ -8,17 +8,17 @@ import io
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 
-from app.core.database import get_db
-from app.core.security import get_current_user, require_org_member, AuthenticatedUser, compute_content_hash
-from app.models.property import Property, Unit
+from app.core.database import get_db, raiseload_in_debug
+from app.core.security import get_current_user, require_org_member, AuthenticatedUser, compute_content_hash_async
 from app.models.lease import Lease, TenantAccess
 from app.models.inspection import Inspection, InspectionItem, InspectionEvidence
+from app.models.types import key_hash
 from app.models.enums import (
     InspectionStatus, InspectionType, EvidenceType, InspectionScope, InspectionSignedBy,
     EvidenceSource, StorageInstanceKind,
@@ -42,6 +42,7 @@ from app.schemas.inspection import (
     InspectionAttestRequest,
     InspectionAttestResponse,
 )
+from app.routers.queries import GET_INSPECTION, ORG_LEASE
 from app.services.storage import get_storage_service
 from app.services.audit import AuditService
 from app.services.mason import MasonService
@@ -59,11 +60,7 @@ async def get_inspection_with_auth(
     require_draft: bool = False,
 ) -> Inspection:
     """Get inspection with authorization check."""
-    result = await db.execute(
-        select(Inspection)
-        .options(selectinload(Inspection.items).selectinload(InspectionItem.evidence))
-        .where(Inspection.id == inspection_id)
-    )
+    result = await db.execute(GET_INSPECTION, {"inspection_id": inspection_id})
     inspection = result.scalar_one_or_none()
 
     if not inspection:
@@ -71,17 +68,8 @@ async def get_inspection_with_auth(
 
     # Check authorization
     if current_user.org_id:
-        # Org member - verify through property chain
-        lease_result = await db.execute(
-            select(Lease)
-            .join(Unit)
-            .join(Property)
-            .where(
-                Lease.id == inspection.lease_id,
-                Property.org_id == current_user.org_id,
-            )
-        )
-        if not lease_result.scalar_one_or_none():
+        # Org member - the inspection carries its org
+        if inspection.org_id != current_user.org_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     else:
         # Tenant - verify through tenant_access
@@ -116,13 +104,7 @@ async def create_inspection(
     # Verify lease access
     if current_user.org_id:
         result = await db.execute(
-            select(Lease)
-            .join(Unit)
-            .join(Property)
-            .where(
-                Lease.id == data.lease_id,
-                Property.org_id == current_user.org_id,
-            )
+            ORG_LEASE, {"lease_id": data.lease_id, "org_id": current_user.org_id}
         )
     else:
         result = await db.execute(
@@ -163,17 +145,25 @@ async def list_inspections(
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """List inspections (scoped by org or tenant access)."""
+    # Only the item count is needed, so count in SQL rather than letting
+    # Inspection.items selectin-load every item and its evidence
+    item_count = (
+        select(func.count(InspectionItem.id))
+        .where(InspectionItem.inspection_id == Inspection.id)
+        .correlate(Inspection)
+        .scalar_subquery()
+    )
+    base = select(Inspection, item_count.label("item_count")).options(
+        lazyload(Inspection.items), *raiseload_in_debug()
+    )
     if current_user.org_id:
         query = (
-            select(Inspection)
-            .join(Lease)
-            .join(Unit)
-            .join(Property)
-            .where(Property.org_id == current_user.org_id)
+            base
+            .where(Inspection.org_id == current_user.org_id)
         )
     else:
         query = (
-            select(Inspection)
+            base
             .join(Lease)
             .join(TenantAccess)
             .where(TenantAccess.tenant_user_id == current_user.db_user_id)
@@ -187,14 +177,10 @@ async def list_inspections(
     query = query.order_by(Inspection.created_at.desc())
 
     result = await db.execute(query)
-    inspections = result.scalars().all()
 
     return [
-        InspectionResponse(
-            **i.__dict__,
-            item_count=len(i.items) if hasattr(i, 'items') else 0,
-        )
-        for i in inspections
+        InspectionResponse(**i.__dict__, item_count=count)
+        for i, count in result.all()
     ]
 
 
@@ -248,19 +234,7 @@ async def upsert_inspection_item(
     await db.commit()
     await db.refresh(item)
 
-    # Get evidence count
-    evidence_result = await db.execute(
-        select(InspectionEvidence).where(
-            InspectionEvidence.item_id == item.id,
-            InspectionEvidence.is_confirmed == True,
-        )
-    )
-    evidence_count = len(evidence_result.scalars().all())
-
-    return InspectionItemResponse(
-        **item.__dict__,
-        evidence_count=evidence_count,
-    )
+    return InspectionItemResponse.model_validate(item)
 
 
 @router.get("/{inspection_id}/items", response_model=List[InspectionItemResponse])
@@ -278,15 +252,11 @@ async def list_inspection_items(
 
     items = []
     for item in inspection.items:
-        evidence_count = 0
-        if not (is_org_member and is_draft):
-            # Can see evidence
-            evidence_count = len([e for e in item.evidence if e.is_confirmed])
-        
-        items.append(InspectionItemResponse(
-            **item.__dict__,
-            evidence_count=evidence_count,
-        ))
+        # evidence_count is kept current by a trigger on inspection_evidence
+        response = InspectionItemResponse.model_validate(item)
+        if is_org_member and is_draft:
+            response.evidence_count = 0
+        items.append(response)
 
     return items
 
@@ -315,23 +285,12 @@ async def presign_evidence_upload(
     if not item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
-    # Get org_id for storage path
-    lease_result = await db.execute(
-        select(Lease).join(Unit).join(Property).where(Lease.id == inspection.lease_id)
-    )
-    lease = lease_result.scalar_one()
-    
-    prop_result = await db.execute(
-        select(Property).join(Unit).where(Unit.id == lease.unit_id)
-    )
-    prop = prop_result.scalar_one()
-
     storage = get_storage_service()
     evidence_id = uuid.uuid4()
     
     try:
         upload_url, object_path, expires_at = await storage.create_presigned_upload(
-            org_id=prop.org_id,
+            org_id=inspection.org_id,
             inspection_id=inspection_id,
             item_id=data.inspection_item_id,
             file_name=f"{evidence_id}",
@@ -378,18 +337,8 @@ async def confirm_evidence_upload(
     if not item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
-    lease_result = await db.execute(
-        select(Lease).join(Unit).join(Property).where(Lease.id == inspection.lease_id)
-    )
-    lease = lease_result.scalar_one()
-
-    prop_result = await db.execute(
-        select(Property).join(Unit).where(Unit.id == lease.unit_id)
-    )
-    prop = prop_result.scalar_one()
-
     expected_prefix = (
-        f"orgs/{prop.org_id}/inspections/{inspection_id}/items/{data.inspection_item_id}/"
+        f"orgs/{inspection.org_id}/inspections/{inspection_id}/items/{data.inspection_item_id}/"
     )
     if not data.object_path.startswith(expected_prefix):
         raise HTTPException(
@@ -401,7 +350,7 @@ async def confirm_evidence_upload(
     existing = await db.execute(
         select(InspectionEvidence).where(
             InspectionEvidence.inspection_item_id == data.inspection_item_id,
-            InspectionEvidence.confirm_idempotency_key == data.confirm_idempotency_key,
+            InspectionEvidence.confirm_key_hash == key_hash(data.confirm_idempotency_key),
         )
     )
     existing_evidence = existing.scalar_one_or_none()
@@ -466,6 +415,7 @@ async def confirm_evidence_upload(
         storage_instance_kind=storage_instance_kind,
         storage_instance_id=storage_instance_id,
         confirm_idempotency_key=data.confirm_idempotency_key,
+        confirm_key_hash=key_hash(data.confirm_idempotency_key),
     )
     db.add(evidence)
     await db.flush()  # Get evidence.id
@@ -679,7 +629,7 @@ async def attest_inspection(
             "items": items_data,
         }
 
-        inspection.content_hash = compute_content_hash(canonical_data, schema_version=1)
+        inspection.content_hash = await compute_content_hash_async(canonical_data, schema_version=1)
 
     now = datetime.utcnow()
 
@@ -730,7 +680,10 @@ async def get_inspection_diff(
     # Get move-in inspection
     move_in_result = await db.execute(
         select(Inspection)
-        .options(selectinload(Inspection.items))
+        .options(
+            selectinload(Inspection.items).raiseload(InspectionItem.evidence),
+            *raiseload_in_debug(),
+        )
         .where(
             Inspection.lease_id == lease_id,
             Inspection.inspection_type == InspectionType.MOVE_IN,
@@ -747,7 +700,10 @@ async def get_inspection_diff(
     # Get move-out inspection
     move_out_result = await db.execute(
         select(Inspection)
-        .options(selectinload(Inspection.items))
+        .options(
+            selectinload(Inspection.items).raiseload(InspectionItem.evidence),
+            *raiseload_in_debug(),
+        )
         .where(
             Inspection.lease_id == lease_id,
             Inspection.inspection_type == InspectionType.MOVE_OUT,
@@ -814,10 +770,7 @@ async def get_mason_estimate(
     """Get Mason AI cost estimate for inspection diff."""
     # Get lease for deposit amount
     lease_result = await db.execute(
-        select(Lease).join(Unit).join(Property).where(
-            Lease.id == lease_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_LEASE, {"lease_id": lease_id, "org_id": current_user.org_id}
     )
     lease = lease_result.scalar_one_or_none()
     if not lease:
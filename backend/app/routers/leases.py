@@ -24,6 +24,7 @@ from app.schemas.lease import (
     LeaseRenewalResponse,
 )
 from app.models.inspection import Inspection
+from app.routers.queries import ORG_LEASE
 from app.services.audit import AuditService
 
 router = APIRouter(prefix="/leases", tags=["leases"])
@@ -168,13 +169,7 @@ async def get_lease(
 ):
     """Get a lease by ID."""
     result = await db.execute(
-        select(Lease)
-        .join(Unit)
-        .join(Property)
-        .where(
-            Lease.id == lease_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_LEASE, {"lease_id": lease_id, "org_id": current_user.org_id}
     )
     lease = result.scalar_one_or_none()
 
@@ -193,13 +188,7 @@ async def update_lease(
 ):
     """Update a lease (limited fields)."""
     result = await db.execute(
-        select(Lease)
-        .join(Unit)
-        .join(Property)
-        .where(
-            Lease.id == lease_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_LEASE, {"lease_id": lease_id, "org_id": current_user.org_id}
     )
     lease = result.scalar_one_or_none()
 
@@ -229,13 +218,7 @@ async def send_tenant_invite(
     import hashlib
 
     result = await db.execute(
-        select(Lease)
-        .join(Unit)
-        .join(Property)
-        .where(
-            Lease.id == lease_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_LEASE, {"lease_id": lease_id, "org_id": current_user.org_id}
     )
     lease = result.scalar_one_or_none()
 
@@ -404,13 +387,7 @@ async def terminate_lease(
     the move-out inspection workflow.
     """
     result = await db.execute(
-        select(Lease)
-        .join(Unit)
-        .join(Property)
-        .where(
-            Lease.id == lease_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_LEASE, {"lease_id": lease_id, "org_id": current_user.org_id}
     )
     lease = result.scalar_one_or_none()
 
@@ -23,6 +23,7 @@ from app.schemas.maintenance import (
     MaintenanceTriageRequest,
     MaintenanceTriageResponse,
 )
+from app.routers.queries import ORG_TICKET
 from app.services.audit import AuditService
 from app.services.mason import MasonService
 
@@ -89,9 +90,7 @@ async def list_maintenance_tickets(
     if current_user.org_id:
         query = (
             select(MaintenanceTicket)
-            .join(Unit)
-            .join(Property)
-            .where(Property.org_id == current_user.org_id)
+            .where(MaintenanceTicket.org_id == current_user.org_id)
         )
     else:
         # Tenant - only see visible tickets for their units
@@ -128,13 +127,7 @@ async def get_maintenance_ticket(
     """Get a maintenance ticket by ID."""
     if current_user.org_id:
         result = await db.execute(
-            select(MaintenanceTicket)
-            .join(Unit)
-            .join(Property)
-            .where(
-                MaintenanceTicket.id == ticket_id,
-                Property.org_id == current_user.org_id,
-            )
+            ORG_TICKET, {"ticket_id": ticket_id, "org_id": current_user.org_id}
         )
     else:
         result = await db.execute(
@@ -165,13 +158,7 @@ async def update_maintenance_ticket(
 ):
     """Update a maintenance ticket (org members only)."""
     result = await db.execute(
-        select(MaintenanceTicket)
-        .join(Unit)
-        .join(Property)
-        .where(
-            MaintenanceTicket.id == ticket_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_TICKET, {"ticket_id": ticket_id, "org_id": current_user.org_id}
     )
     ticket = result.scalar_one_or_none()
 
@@ -206,13 +193,7 @@ async def assign_maintenance_ticket(
     Tenants cannot assign vendors (guardrail).
     """
     result = await db.execute(
-        select(MaintenanceTicket)
-        .join(Unit)
-        .join(Property)
-        .where(
-            MaintenanceTicket.id == ticket_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_TICKET, {"ticket_id": ticket_id, "org_id": current_user.org_id}
     )
     ticket = result.scalar_one_or_none()
 
@@ -269,13 +250,7 @@ async def triage_maintenance_ticket(
     - Advisory only
     """
     result = await db.execute(
-        select(MaintenanceTicket)
-        .join(Unit)
-        .join(Property)
-        .where(
-            MaintenanceTicket.id == ticket_id,
-            Property.org_id == current_user.org_id,
-        )
+        ORG_TICKET, {"ticket_id": ticket_id, "org_id": current_user.org_id}
     )
     ticket = result.scalar_one_or_none()
 
@@ -1,11 +1,12 @@
 """Organization router."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import get_current_user, AuthenticatedUser
+from app.core.security import get_current_user, AuthenticatedUser, ADMIN_MASK
 from app.models.user import User
 from app.models.org import Organization, OrgMembership
 from app.models.enums import OrgRole
@@ -48,7 +49,16 @@ async def create_organization(
             full_name=current_user.claims.get("name"),
         )
         db.add(user)
-        await db.flush()
+        try:
+            await db.flush()
+        except IntegrityError as e:
+            if "ix_users_email_lower" not in str(e.orig):
+                raise
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="An account with this email already exists",
+            )
 
     # Check if user already belongs to an org
     membership_result = await db.execute(
@@ -138,7 +148,7 @@ async def update_my_organization(
             detail="User does not belong to an organization",
         )
 
-    if current_user.org_role not in ["ORG_OWNER", "ORG_ADMIN"]:
+    if not current_user.role_mask & ADMIN_MASK:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
@@ -213,7 +223,7 @@ async def invite_member(
             detail="User does not belong to an organization",
         )
 
-    if current_user.org_role not in ["ORG_OWNER", "ORG_ADMIN"]:
+    if not current_user.role_mask & ADMIN_MASK:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required to invite members",
@@ -221,7 +231,7 @@ async def invite_member(
 
     # Check if user already exists
     user_result = await db.execute(
-        select(User).where(User.email == data.email)
+        select(User).where(func.lower(User.email) == func.lower(data.email))
     )
     existing_user = user_result.scalar_one_or_none()
 
@@ -0,0 +1,35 @@
+"""Hot single-row lookups shared by the routers.
+
+Each statement is built once at import; a call only binds its parameters,
+skipping statement construction and cache-key generation per request.
+"""
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import selectinload
+
+from app.core.database import raiseload_in_debug
+from app.models.inspection import Inspection, InspectionItem
+from app.models.lease import Lease
+from app.models.maintenance import MaintenanceTicket
+
+# Inspection with its items and their evidence, by id
+GET_INSPECTION = (
+    select(Inspection)
+    .options(
+        selectinload(Inspection.items).selectinload(InspectionItem.evidence),
+        *raiseload_in_debug(),
+    )
+    .where(Inspection.id == bindparam("inspection_id"))
+)
+
+# Lease by id, within the caller's org
+ORG_LEASE = select(Lease).where(
+    Lease.id == bindparam("lease_id"),
+    Lease.org_id == bindparam("org_id"),
+)
+
+# Maintenance ticket by id, within the caller's org
+ORG_TICKET = select(MaintenanceTicket).where(
+    MaintenanceTicket.id == bindparam("ticket_id"),
+    MaintenanceTicket.org_id == bindparam("org_id"),
+)
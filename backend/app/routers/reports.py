@@ -179,7 +179,7 @@ async def get_lease_expiration_report(
         .join(Unit, Lease.unit_id == Unit.id)
         .join(Property, Unit.property_id == Property.id)
         .where(
-            Property.org_id == org_id,
+            Lease.org_id == org_id,
             Lease.status == LeaseStatus.ACTIVE,
             Lease.end_date >= now,
             Lease.end_date <= end_date,
@@ -268,7 +268,7 @@ async def get_maintenance_summary_report(
         .join(Unit, MaintenanceTicket.unit_id == Unit.id)
         .join(Property, Unit.property_id == Property.id)
         .where(
-            Property.org_id == org_id,
+            MaintenanceTicket.org_id == org_id,
             MaintenanceTicket.created_at >= period_start,
             MaintenanceTicket.created_at <= period_end,
         )
@@ -5,7 +5,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -120,7 +120,7 @@ class PhotoPresignResponse(BaseModel):
 class PhotoConfirmRequest(BaseModel):
     object_path: str
     photo_type: TurnoverPhotoType
-    file_hash: str
+    file_hash: str = Field(..., pattern=r"^[0-9a-fA-F]{64}$")
     file_size_bytes: int
     notes: Optional[str] = None
 
@@ -63,7 +63,7 @@ class InspectionItemCreate(BaseSchema):
 
     room_key: str = Field(..., min_length=1, max_length=100)
     item_key: str = Field(..., min_length=1, max_length=100)
-    ordinal: int = Field(default=0, ge=0)
+    ordinal: int = Field(default=0, ge=0, le=32767)
     condition: InspectionCondition = InspectionCondition.GOOD
     notes: Optional[str] = None
 
@@ -122,7 +122,7 @@ class EvidenceConfirmRequest(BaseSchema):
     confirm_idempotency_key: str = Field(..., min_length=1, max_length=255)
     mime_type: str
     size_bytes: int = Field(..., gt=0)
-    file_sha256_claimed: str = Field(..., min_length=64, max_length=64)
+    file_sha256_claimed: str = Field(..., pattern=r"^[0-9a-fA-F]{64}$")
 
 
 class EvidenceResponse(BaseSchema, IDMixin):
@@ -76,7 +76,7 @@ class UnitCreate(BaseSchema):
 
     unit_number: str = Field(..., min_length=1, max_length=50)
     status: UnitStatus = UnitStatus.VACANT
-    bedrooms: Optional[int] = Field(None, ge=0)
+    bedrooms: Optional[int] = Field(None, ge=0, le=32767)
     bathrooms: Optional[int] = Field(None, ge=0)  # stored as int (15 = 1.5)
     sq_ft: Optional[int] = Field(None, gt=0)
     description: Optional[str] = None
@@ -87,7 +87,7 @@ class UnitUpdate(BaseSchema):
 
     unit_number: Optional[str] = Field(None, min_length=1, max_length=50)
     status: Optional[UnitStatus] = None
-    bedrooms: Optional[int] = Field(None, ge=0)
+    bedrooms: Optional[int] = Field(None, ge=0, le=32767)
     bathrooms: Optional[int] = Field(None, ge=0)
     sq_ft: Optional[int] = Field(None, gt=0)
     description: Optional[str] = None
@@ -27,7 +27,12 @@ class AuditService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
     ) -> AuditLog:
-        """Create an audit log entry."""
+        """Create an audit log entry.
+
+        The entry is only added to the session. It is written in the same
+        transaction as the action it records, when the request commits, and
+        all entries pending at that point go out as one multi-row INSERT.
+        """
         entry = AuditLog(
             action=action,
             resource_type=resource_type,
@@ -39,7 +44,6 @@ class AuditService:
             user_agent=user_agent,
         )
         self.db.add(entry)
-        await self.db.flush()
         return entry
 
     async def log_invite_sent(
@@ -10,6 +10,7 @@ Output: ZIP file containing:
 - evidence/ (all photos with original hashes)
 """
 
+import asyncio
 import io
 import json
 import zipfile
@@ -21,6 +22,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.database import raiseload_in_debug
 from app.models.inspection import Inspection, InspectionItem, InspectionEvidence
 from app.models.lease import Lease
 from app.models.property import Property, Unit
@@ -29,6 +31,9 @@ from app.services.mason import MasonService
 from app.services.storage import get_storage_service
 from app.services.claimsiq import get_claimsiq_client, ClaimSubmissionResult
 
+# Max evidence files fetched from storage at once while building a packet
+EVIDENCE_DOWNLOAD_CONCURRENCY = 10
+
 
 class ClaimPacketService:
     """
@@ -281,7 +286,8 @@ class ClaimPacketService:
         result = await self.db.execute(
             select(Inspection)
             .options(
-                selectinload(Inspection.items).selectinload(InspectionItem.evidence)
+                selectinload(Inspection.items).selectinload(InspectionItem.evidence),
+                *raiseload_in_debug(),
             )
             .where(
                 Inspection.lease_id == lease_id,
@@ -442,6 +448,7 @@ class ClaimPacketService:
         move_in: Inspection,
         move_out: Inspection,
         include_evidence: bool,
+        max_concurrency: int = EVIDENCE_DOWNLOAD_CONCURRENCY,
     ) -> bytes:
         """Create the ZIP file with all claim materials."""
         buffer = io.BytesIO()
@@ -459,8 +466,9 @@ class ClaimPacketService:
             
             # Add evidence files if requested
             if include_evidence:
-                evidence_index = []
-                
+                # Collect every evidence file first, then fetch them concurrently
+                # (capped) instead of one storage round trip at a time
+                wanted = []
                 for damage in claim_summary["damages"]["items"]:
                     room = damage["room"]
                     item = damage["item"]
@@ -469,28 +477,45 @@ class ClaimPacketService:
                     for diff_item in self._get_diff_items_from_inspections(move_out):
                         if diff_item["room_name"] == room and diff_item["item_name"] == item:
                             for i, ev in enumerate(diff_item.get("evidence", [])):
-                                try:
-                                    # Download evidence from storage
-                                    file_bytes = await self.storage.download(ev["object_path"])
-                                    
-                                    # Determine extension
-                                    ext = self._get_extension(ev["mime_type"])
-                                    filename = f"evidence/{room}_{item}_{i+1}{ext}"
-                                    
-                                    zf.writestr(filename, file_bytes)
-                                    evidence_index.append({
-                                        "file": filename,
-                                        "hash": ev["file_hash"],
-                                        "room": room,
-                                        "item": item,
-                                    })
-                                except Exception as e:
-                                    # Log but continue if evidence fetch fails
-                                    evidence_index.append({
-                                        "file": f"evidence/{room}_{item}_{i+1}_MISSING",
-                                        "hash": ev["file_hash"],
-                                        "error": str(e),
-                                    })
+                                wanted.append((room, item, i, ev))
+                
+                semaphore = asyncio.Semaphore(max_concurrency)
+                
+                async def fetch(n: int) -> tuple[int, bytes | Exception]:
+                    async with semaphore:
+                        try:
+                            return n, await self.storage.download(wanted[n][3]["object_path"])
+                        except Exception as e:
+                            return n, e
+                
+                # Each file goes into the ZIP as soon as its download lands, so
+                # only the downloads in flight are held in memory; the index is
+                # still listed in damage order
+                entries: list[Optional[dict[str, Any]]] = [None] * len(wanted)
+                for next_done in asyncio.as_completed([fetch(n) for n in range(len(wanted))]):
+                    n, file_bytes = await next_done
+                    room, item, i, ev = wanted[n]
+                    if isinstance(file_bytes, Exception):
+                        # Log but continue if evidence fetch fails
+                        entries[n] = {
+                            "file": f"evidence/{room}_{item}_{i+1}_MISSING",
+                            "hash": ev["file_hash"],
+                            "error": str(file_bytes),
+                        }
+                        continue
+                    
+                    # Determine extension
+                    ext = self._get_extension(ev["mime_type"])
+                    filename = f"evidence/{room}_{item}_{i+1}{ext}"
+                    
+                    zf.writestr(filename, file_bytes)
+                    entries[n] = {
+                        "file": filename,
+                        "hash": ev["file_hash"],
+                        "room": room,
+                        "item": item,
+                    }
+                evidence_index = [entry for entry in entries if entry is not None]
                 
                 # Add evidence index
                 if evidence_index:
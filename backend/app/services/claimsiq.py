@@ -367,12 +367,12 @@ Generated by PROVENIQ Properties."""
         """Calculate severity 1-10 based on damage vs deposit."""
         if deposit_cents == 0:
             return 10
-        ratio = damage_cents / deposit_cents
-        if ratio <= 0.25:
+        # Compare damage/deposit ratio in integer cents (no float division)
+        if damage_cents * 4 <= deposit_cents:
             return 3
-        elif ratio <= 0.5:
+        elif damage_cents * 2 <= deposit_cents:
             return 5
-        elif ratio <= 1.0:
+        elif damage_cents <= deposit_cents:
             return 7
         else:
             return 9
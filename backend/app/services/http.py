@@ -0,0 +1,44 @@
+"""Pooled HTTP client shared by the bridges to other PROVENIQ services."""
+
+from typing import Optional
+
+import httpx
+
+# One pool policy for every outbound service client
+HTTP_TIMEOUT_SECONDS = 10.0
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+
+
+class PooledHTTPService:
+    """Base for services that call another PROVENIQ API over a long-lived client."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Long-lived HTTP client so calls reuse keep-alive connections."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=HTTP_TIMEOUT_SECONDS,
+                limits=HTTP_POOL_LIMITS,
+            )
+        return self._client
+
+    async def prewarm(self) -> None:
+        """Open a pooled connection ahead of the first real call (best effort).
+
+        Any HTTP response, even a 404, leaves a keep-alive socket in the pool.
+        """
+        try:
+            await self.client.get("/health", timeout=2.0)
+        except httpx.HTTPError:
+            pass
+
+    async def aclose(self) -> None:
+        """Close the pooled connections (called on app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -12,9 +12,15 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
 
-from app.models.jobs import JobsOutbox
+from app.core.ids import uuid7
+from app.models.jobs import JobsOutbox, JobsOutboxScope
+from app.models.types import key_hash
 from app.models.enums import JobStatus
 
+# Channel notified (payload: job type) by a trigger on every jobs_outbox
+# insert. Workers should LISTEN on it and only poll as a fallback.
+JOBS_NOTIFY_CHANNEL = "jobs_outbox_new"
+
 
 class JobsService:
     """Service for managing async jobs via outbox pattern."""
@@ -43,25 +49,64 @@ class JobsService:
         Returns:
             Job ID if created, None if duplicate scope exists
         """
-        job_id = uuid.uuid4()
+        created = await self.enqueue_many([{
+            "job_type": job_type,
+            "payload": payload,
+            "unique_scope": unique_scope,
+            "run_after": run_after,
+        }])
+        return created[0] if created else None
+
+    async def enqueue_many(self, jobs: list[dict[str, Any]]) -> list[uuid.UUID]:
+        """Enqueue several jobs in two round trips, whatever their number.
         
-        # Use INSERT ... ON CONFLICT DO NOTHING for idempotency
-        stmt = insert(JobsOutbox).values(
-            id=job_id,
-            type=job_type,
-            payload=payload,
-            status=JobStatus.PENDING,
-            unique_scope=unique_scope,
-            run_after=run_after or datetime.utcnow(),
-        ).on_conflict_do_nothing(index_elements=['unique_scope'])
+        Each dict takes enqueue()'s arguments (job_type, payload,
+        unique_scope and optionally run_after). Jobs whose scope is already
+        claimed, or repeated earlier in the batch, are skipped.
         
-        result = await self.db.execute(stmt)
+        Returns:
+            IDs of the jobs created, in input order
+        """
+        # One job per scope; ON CONFLICT only guards against existing rows
+        batch: dict[bytes, tuple[uuid.UUID, dict[str, Any]]] = {}
+        for job in jobs:
+            batch.setdefault(key_hash(job["unique_scope"]), (uuid7(), job))
+        if not batch:
+            return []
         
-        # rowcount will be 0 if conflict occurred
-        if result.rowcount == 0:
-            return None
+        # Claim the scopes with INSERT ... ON CONFLICT DO NOTHING for
+        # idempotency; jobs_outbox itself is partitioned and can't hold a
+        # unique index on unique_scope alone
+        result = await self.db.execute(
+            insert(JobsOutboxScope)
+            .values([
+                {"scope_hash": key, "unique_scope": job["unique_scope"], "job_id": job_id}
+                for key, (job_id, job) in batch.items()
+            ])
+            .on_conflict_do_nothing(index_elements=['scope_hash'])
+            .returning(JobsOutboxScope.job_id)
+        )
+        claimed = set(result.scalars())
+        if not claimed:
+            return []
+        
+        now = datetime.utcnow()
+        created = [(job_id, job) for job_id, job in batch.values() if job_id in claimed]
+        await self.db.execute(
+            insert(JobsOutbox).values([
+                {
+                    "id": job_id,
+                    "type": job["job_type"],
+                    "payload": job["payload"],
+                    "status": JobStatus.PENDING,
+                    "unique_scope": job["unique_scope"],
+                    "run_after": job.get("run_after") or now,
+                }
+                for job_id, job in created
+            ])
+        )
         
-        return job_id
+        return [job_id for job_id, _ in created]
 
     async def enqueue_verify_hash(
         self,
@@ -10,10 +10,11 @@ CANONICAL SCHEMA v1.0.0
 import hashlib
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
-import httpx
+
+from app.services.http import PooledHTTPService
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,12 @@ PRODUCER = "properties"
 PRODUCER_VERSION = "1.0.0"
 
 
-class LedgerService:
+def _utc_timestamp() -> str:
+    """Current UTC time in the canonical occurred_at format (ISO-8601, Z suffix)."""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")[:-6] + "Z"
+
+
+class LedgerService(PooledHTTPService):
     """
     Bridge to PROVENIQ Ledger for property audit trail.
     
@@ -36,7 +42,7 @@ class LedgerService:
     """
     
     def __init__(self, base_url: str = LEDGER_API_URL):
-        self.base_url = base_url
+        super().__init__(base_url)
     
     def _hash_payload(self, payload: dict) -> str:
         """Calculate SHA256 hash of payload."""
@@ -55,7 +61,7 @@ class LedgerService:
         """Write a canonical event to the Ledger."""
         corr_id = correlation_id or str(uuid4())
         idempotency_key = f"properties_{uuid4()}"
-        occurred_at = datetime.utcnow().isoformat() + "Z"
+        occurred_at = _utc_timestamp()
         canonical_hash = self._hash_payload(payload)
 
         subject = {"asset_id": asset_id or "SYSTEM"}
@@ -80,26 +86,24 @@ class LedgerService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/events/canonical",
-                    json=canonical_event,
-                    timeout=10.0,
-                )
-                
-                if response.status_code not in (200, 201):
-                    logger.warning(f"[LEDGER] Write failed: {response.status_code} {response.text}")
-                    return None
-                
-                data = response.json()
-                return {
-                    "event_id": data.get("event_id"),
-                    "sequence_number": data.get("sequence_number"),
-                    "entry_hash": data.get("entry_hash"),
-                    "committed_at": data.get("committed_at"),
-                }
+            response = await self.client.post(
+                "/api/v1/events/canonical",
+                json=canonical_event,
+            )
+            
+            if response.status_code not in (200, 201):
+                logger.warning("[LEDGER] Write failed: %s %s", response.status_code, response.text)
+                return None
+            
+            data = response.json()
+            return {
+                "event_id": data.get("event_id"),
+                "sequence_number": data.get("sequence_number"),
+                "entry_hash": data.get("entry_hash"),
+                "committed_at": data.get("committed_at"),
+            }
         except Exception as e:
-            logger.error(f"[LEDGER] Write error: {e}")
+            logger.error("[LEDGER] Write error: %s", e)
             return None
     
     async def write_inspection_created(
@@ -239,3 +243,9 @@ def get_ledger_service() -> LedgerService:
     if _ledger_instance is None:
         _ledger_instance = LedgerService()
     return _ledger_instance
+
+
+async def close_ledger_service() -> None:
+    """Release the Ledger service's HTTP connections, if it was ever used."""
+    if _ledger_instance is not None:
+        await _ledger_instance.aclose()
@@ -0,0 +1,76 @@
+"""Upkeep of the monthly partitions on the log and outbox tables.
+
+Migrations 006 and 019 partition audit_log_core, mason_logs and jobs_outbox
+by month on created_at, but only create partitions up to a couple of months
+ahead. Everything after that lands in the DEFAULT partition, and finished
+outbox months are only reclaimed when their partition is dropped, so the app
+keeps the calendar moving itself rather than relying on pg_cron (which the
+stock Postgres image doesn't ship).
+
+Runs on start-up and then every PARTITION_MAINTENANCE_INTERVAL_SECONDS from
+the app's lifespan; deployments without a long-lived app process can run it
+once from cron instead:
+
+    python -m app.services.partitions
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+# Tables partitioned by month on created_at
+PARTITIONED_TABLES = ("audit_log_core", "mason_logs", "jobs_outbox")
+# Months of partitions kept ready ahead of the current one
+MONTHS_AHEAD = 2
+# Whole months of finished jobs kept before their partition is dropped
+JOBS_OUTBOX_KEEP_MONTHS = 3
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 6 * 60 * 60
+# pg_advisory_xact_lock key, so concurrent app workers take turns
+_LOCK_KEY = 0x7061_7274  # "part"
+
+
+async def maintain_partitions(db: AsyncSession) -> None:
+    """Create coming months' partitions and drop finished outbox months, in one transaction."""
+    await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _LOCK_KEY})
+    for table in PARTITIONED_TABLES:
+        await db.execute(
+            text("SELECT create_monthly_partitions(:parent, now()::date, :months_ahead)"),
+            {"parent": table, "months_ahead": MONTHS_AHEAD},
+        )
+    await db.execute(
+        text("SELECT prune_jobs_outbox_partitions(:keep_months)"),
+        {"keep_months": JOBS_OUTBOX_KEEP_MONTHS},
+    )
+    await db.commit()
+
+
+async def run_partition_maintenance(
+    interval_seconds: int = PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+) -> None:
+    """Run maintain_partitions now and then every ``interval_seconds``, forever.
+
+    Failures are logged and retried on the next round; the partitions are
+    months ahead, so a missed round costs nothing.
+    """
+    while True:
+        try:
+            async with async_session_maker() as db:
+                await maintain_partitions(db)
+        except Exception:
+            logger.exception("[PARTITIONS] Maintenance failed")
+        await asyncio.sleep(interval_seconds)
+
+
+async def _main() -> None:
+    async with async_session_maker() as db:
+        await maintain_partitions(db)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
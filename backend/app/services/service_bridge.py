@@ -5,18 +5,25 @@ Integration with PROVENIQ Service for maintenance work orders.
 Properties dispatches maintenance to Service, which manages vendor assignment.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-import httpx
+from cachetools import TTLCache
+
+from app.services.http import PooledHTTPService
 
 logger = logging.getLogger(__name__)
 
 SERVICE_API_URL = "http://localhost:3008/api"
 
+# Provider search results change on the scale of minutes, not requests
+PROVIDER_CACHE_TTL_SECONDS = 300
+PROVIDER_CACHE_MAX_ENTRIES = 10_000
+
 
-class ServiceBridge:
+class ServiceBridge(PooledHTTPService):
     """
     Bridge to PROVENIQ Service for maintenance dispatch.
     
@@ -30,7 +37,11 @@ class ServiceBridge:
     """
     
     def __init__(self, base_url: str = SERVICE_API_URL):
-        self.base_url = base_url
+        super().__init__(base_url)
+        self._provider_cache: TTLCache = TTLCache(
+            maxsize=PROVIDER_CACHE_MAX_ENTRIES, ttl=PROVIDER_CACHE_TTL_SECONDS
+        )
+        self._provider_inflight: dict[tuple, asyncio.Future] = {}
     
     async def create_work_order(
         self,
@@ -49,55 +60,51 @@ class ServiceBridge:
     ) -> Optional[dict]:
         """Create a work order in Service."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/work-orders",
-                    json={
-                        "title": title,
-                        "description": description,
-                        "serviceDomain": service_domain,
-                        "serviceType": service_type,
-                        "priority": self._map_urgency_to_priority(urgency),
-                        "contactName": contact_name,
-                        "contactPhone": contact_phone,
-                        "address": address,
-                        "sourceApp": "properties",
-                        "sourceId": str(ticket_id),
-                        "metadata": {
-                            "property_id": str(property_id),
-                            "unit_id": str(unit_id) if unit_id else None,
-                            "requested_by": str(requested_by),
-                        },
+            response = await self.client.post(
+                "/work-orders",
+                json={
+                    "title": title,
+                    "description": description,
+                    "serviceDomain": service_domain,
+                    "serviceType": service_type,
+                    "priority": self._map_urgency_to_priority(urgency),
+                    "contactName": contact_name,
+                    "contactPhone": contact_phone,
+                    "address": address,
+                    "sourceApp": "properties",
+                    "sourceId": str(ticket_id),
+                    "metadata": {
+                        "property_id": str(property_id),
+                        "unit_id": str(unit_id) if unit_id else None,
+                        "requested_by": str(requested_by),
                     },
-                    timeout=10.0,
-                )
-                
-                if response.status_code not in (200, 201):
-                    logger.warning(f"[SERVICE] Work order creation failed: {response.status_code}")
-                    return None
-                
-                data = response.json()
-                logger.info(f"[SERVICE] Work order created: {data.get('id')}")
-                return data
+                },
+            )
+            
+            if response.status_code not in (200, 201):
+                logger.warning("[SERVICE] Work order creation failed: %s", response.status_code)
+                return None
+            
+            data = response.json()
+            logger.info("[SERVICE] Work order created: %s", data.get("id"))
+            return data
         except Exception as e:
-            logger.error(f"[SERVICE] Work order creation error: {e}")
+            logger.error("[SERVICE] Work order creation error: %s", e)
             return None
     
     async def get_work_order_status(self, work_order_id: str) -> Optional[dict]:
         """Get work order status from Service."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/work-orders/{work_order_id}",
-                    timeout=10.0,
-                )
-                
-                if response.status_code != 200:
-                    return None
-                
-                return response.json()
+            response = await self.client.get(
+                f"/work-orders/{work_order_id}",
+            )
+            
+            if response.status_code != 200:
+                return None
+            
+            return response.json()
         except Exception as e:
-            logger.error(f"[SERVICE] Work order status error: {e}")
+            logger.error("[SERVICE] Work order status error: %s", e)
             return None
     
     async def get_providers_for_service(
@@ -106,7 +113,30 @@ class ServiceBridge:
         service_type: str,
         zip_code: Optional[str] = None,
     ) -> List[dict]:
-        """Get available providers for a service type."""
+        """Get available providers for a service type (cached for a few minutes)."""
+        cache_key = (service_domain, service_type, zip_code)
+        cached = self._provider_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent callers asking for the same search share one request
+        inflight = self._provider_inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._fetch_providers(service_domain, service_type, zip_code)
+            )
+            self._provider_inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda _: self._provider_inflight.pop(cache_key, None))
+        # Shielded so one cancelled caller doesn't cancel the shared lookup
+        return await asyncio.shield(inflight)
+    
+    async def _fetch_providers(
+        self,
+        service_domain: str,
+        service_type: str,
+        zip_code: Optional[str],
+    ) -> List[dict]:
+        """Run the provider search against Service and cache a successful result."""
         try:
             params = {
                 "serviceDomain": service_domain,
@@ -115,20 +145,21 @@ class ServiceBridge:
             if zip_code:
                 params["serviceArea"] = zip_code
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/providers",
-                    params=params,
-                    timeout=10.0,
-                )
-                
-                if response.status_code != 200:
-                    return []
-                
-                data = response.json()
-                return data.get("providers", data) if isinstance(data, dict) else data
+            response = await self.client.get(
+                "/providers",
+                params=params,
+            )
+            
+            if response.status_code != 200:
+                return []
+            
+            data = response.json()
+            providers = data.get("providers", data) if isinstance(data, dict) else data
+            # Only successful lookups are cached so a transient failure isn't replayed
+            self._provider_cache[(service_domain, service_type, zip_code)] = providers
+            return providers
         except Exception as e:
-            logger.error(f"[SERVICE] Provider search error: {e}")
+            logger.error("[SERVICE] Provider search error: %s", e)
             return []
     
     def _map_urgency_to_priority(self, urgency: str) -> str:
@@ -152,3 +183,9 @@ def get_service_bridge() -> ServiceBridge:
     if _service_instance is None:
         _service_instance = ServiceBridge()
     return _service_instance
+
+
+async def close_service_bridge() -> None:
+    """Release the Service bridge's HTTP connections, if it was ever used."""
+    if _service_instance is not None:
+        await _service_instance.aclose()
@@ -0,0 +1,74 @@
+"""Shared fixtures for the database tests.
+
+The tests run against a real Postgres migrated to head (the org_id triggers
+and partitioned tables only exist there), named by TEST_DATABASE_URL:
+
+    TEST_DATABASE_URL=postgresql+asyncpg://... python -m pytest tests
+
+Each test runs inside one transaction that is rolled back afterwards, so the
+database is left as it was. Without TEST_DATABASE_URL the tests are skipped.
+"""
+
+import os
+from contextlib import contextmanager
+
+# Settings are read at import time, so these must be set before app imports
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+os.environ.setdefault("DATABASE_URL", TEST_DATABASE_URL or "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("FIREBASE_PROJECT_ID", "test")
+os.environ.setdefault("GCS_BUCKET_NAME", "test")
+
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def connection():
+    """A connection inside a transaction that is rolled back after the test."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            trans = await conn.begin()
+            try:
+                yield conn
+            finally:
+                await trans.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(connection):
+    """A session joined to the test transaction; its commits become savepoints."""
+    async with AsyncSession(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    ) as session:
+        yield session
+
+
+@pytest.fixture
+def count_queries(connection):
+    """Context manager collecting the SQL statements sent inside its block."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_connection = connection.sync_connection
+        event.listen(sync_connection, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(sync_connection, "before_cursor_execute", before_cursor_execute)
+
+    return counter
@@ -0,0 +1,152 @@
+"""Query counts for loading inspections with their items and evidence.
+
+Inspection.items and InspectionItem.evidence are selectin-loaded, so an
+inspection costs one query per relationship level however many items and
+evidence rows it has, and the list endpoint must not load items at all.
+"""
+
+import uuid
+from datetime import date, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.models import (
+    Inspection,
+    InspectionEvidence,
+    InspectionItem,
+    Lease,
+    Organization,
+    Property,
+    Unit,
+)
+from app.models.enums import InspectionType, StorageInstanceKind
+from app.models.types import key_hash
+
+ITEMS_PER_INSPECTION = 4
+EVIDENCE_PER_ITEM = 2
+
+
+def _evidence(n: int) -> InspectionEvidence:
+    key = f"confirm-{uuid.uuid4()}"
+    return InspectionEvidence(
+        object_path=f"evidence/{uuid.uuid4()}/{n}.jpg",
+        mime_type="image/jpeg",
+        size_bytes=1024,
+        file_sha256_claimed="ab" * 32,
+        confirmed_at=datetime.utcnow(),
+        storage_instance_kind=StorageInstanceKind.GCS_GENERATION,
+        storage_instance_id=str(n),
+        confirm_idempotency_key=key,
+        confirm_key_hash=key_hash(key),
+    )
+
+
+def _inspection(lease_id: uuid.UUID, inspection_type: InspectionType) -> Inspection:
+    return Inspection(
+        lease_id=lease_id,
+        inspection_type=inspection_type,
+        inspection_date=datetime.utcnow(),
+        items=[
+            InspectionItem(
+                room_key="kitchen",
+                item_key=f"item_{i}",
+                ordinal=i,
+                evidence=[_evidence(n) for n in range(EVIDENCE_PER_ITEM)],
+            )
+            for i in range(ITEMS_PER_INSPECTION)
+        ],
+    )
+
+
+@pytest_asyncio.fixture
+async def org_inspections(db):
+    """An org with a lease and two inspections, each with items and evidence."""
+    org = Organization(name="Test Org", slug=f"test-{uuid.uuid4().hex[:12]}")
+    db.add(org)
+    await db.flush()
+    prop = Property(
+        org_id=org.id,
+        name="Test Property",
+        address_line1="1 Main St",
+        city="Springfield",
+        state="IL",
+        zip_code="62701",
+    )
+    db.add(prop)
+    await db.flush()
+    unit = Unit(property_id=prop.id, unit_number="1A")
+    db.add(unit)
+    await db.flush()
+    lease = Lease(
+        unit_id=unit.id,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 12, 31),
+        rent_amount_cents=150000,
+        tenant_email="tenant@example.com",
+    )
+    db.add(lease)
+    await db.flush()
+    inspections = [
+        _inspection(lease.id, InspectionType.MOVE_IN),
+        _inspection(lease.id, InspectionType.MOVE_OUT),
+    ]
+    db.add_all(inspections)
+    await db.flush()
+
+    ids = [i.id for i in inspections]
+    # Start the test from an empty identity map so nothing is served from it
+    db.expunge_all()
+    return org.id, ids
+
+
+@pytest.mark.asyncio
+async def test_inspection_loads_items_and_evidence_in_three_queries(db, org_inspections, count_queries):
+    _, (inspection_id, _) = org_inspections
+
+    with count_queries() as queries:
+        inspection = (
+            await db.execute(select(Inspection).where(Inspection.id == inspection_id))
+        ).scalar_one()
+        evidence = [e for item in inspection.items for e in item.evidence]
+
+    assert len(inspection.items) == ITEMS_PER_INSPECTION
+    assert len(evidence) == ITEMS_PER_INSPECTION * EVIDENCE_PER_ITEM
+    assert len(queries) <= 3
+
+
+@pytest.mark.asyncio
+async def test_get_inspection_query_stays_within_three_queries(db, org_inspections, count_queries):
+    # Imported here: the routers pull in firebase_admin and the storage clients
+    from app.routers.queries import GET_INSPECTION
+
+    _, (inspection_id, _) = org_inspections
+
+    with count_queries() as queries:
+        inspection = (
+            await db.execute(GET_INSPECTION, {"inspection_id": inspection_id})
+        ).scalar_one()
+        evidence = [e for item in inspection.items for e in item.evidence]
+
+    assert len(evidence) == ITEMS_PER_INSPECTION * EVIDENCE_PER_ITEM
+    assert len(queries) <= 3
+
+
+@pytest.mark.asyncio
+async def test_list_inspections_does_not_load_items(db, org_inspections, count_queries):
+    from app.core.security import AuthenticatedUser
+    from app.routers.inspections import list_inspections
+
+    org_id, inspection_ids = org_inspections
+    user = AuthenticatedUser(uid="test-user")
+    user.org_id = org_id
+
+    with count_queries() as queries:
+        inspections = await list_inspections(lease_id=None, status=None, db=db, current_user=user)
+
+    assert {i.id for i in inspections} == set(inspection_ids)
+    assert all(i.item_count == ITEMS_PER_INSPECTION for i in inspections)
+    # One SELECT with the item count as a subquery; no selectin round trips
+    assert len(queries) == 1
+    assert "inspection_evidence" not in queries[0]